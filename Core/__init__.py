@@ -14,6 +14,8 @@ LangGraph 기반 Generator를 제공합니다.
 - ForgeMode: Forge Mode - MCQ 생성 (LangGraph)
 """
 
+from typing import TYPE_CHECKING
+
 # Core 모듈 imports
 from Utils import (
     FileProcessor,
@@ -21,10 +23,40 @@ from Utils import (
     SystemInfoCollector,
     VectorSearchUtils,
 )
-from .ask_mode import AskMode, create_ask_mode
 
-# ForgeMode (LangGraph 방식)
-from .forge_mode import ForgeMode, create_forge_mode
+# AskMode / ForgeMode는 Vertex AI, LangGraph 등 무거운 의존성을 로드하므로
+# 첫 접근 시점까지 import를 지연합니다 (PEP 562). 타입 체커용으로만 정적 import.
+if TYPE_CHECKING:
+    from .ask_mode import AskMode, create_ask_mode, create_ask_mode_async
+    from .forge_mode import ForgeMode, create_forge_mode
+
+_LAZY_SUBMODULES = {
+    "AskMode": "ask_mode",
+    "create_ask_mode": "ask_mode",
+    "create_ask_mode_async": "ask_mode",
+    "ForgeMode": "forge_mode",
+    "create_forge_mode": "forge_mode",
+}
+
+
+def __getattr__(name):
+    """지연 로딩 대상 이름에 처음 접근할 때 하위 모듈을 import합니다."""
+    submodule = _LAZY_SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    module = importlib.import_module(f".{submodule}", __name__)
+    # 같은 하위 모듈의 공개 이름을 한 번에 캐시하여 이후 접근은 일반 속성 조회
+    for attr, mod_name in _LAZY_SUBMODULES.items():
+        if mod_name == submodule:
+            globals()[attr] = getattr(module, attr)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 # 전역 설정 imports (fallback 메커니즘 사용)
 try:
@@ -69,6 +101,7 @@ __all__ = [
     
     # 유틸리티 함수들
     "create_ask_mode",
+    "create_ask_mode_async",
     "create_forge_mode",
     "format_documents_for_llm",
     
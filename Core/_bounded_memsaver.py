@@ -0,0 +1,198 @@
+"""
+스레드 수 제한 MemorySaver
+
+MemorySaver는 thread_id별 체크포인트를 무기한 보관하므로
+장시간 실행되는 서비스에서는 메모리가 계속 증가합니다.
+BoundedMemorySaver는 최근 사용 순서(LRU)로 thread_id를 추적하여
+max_threads를 넘으면 가장 오래된 스레드의 체크포인트를 삭제합니다.
+EndOfWorkflowSaver는 여기에 더해 워크플로우 종료 시점에만 체크포인트를 저장합니다
+(checkpoint_scope로 실행을 감싸 저장/폐기를 보장).
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from langgraph.checkpoint.memory import MemorySaver  # type: ignore
+
+
+DEFAULT_MAX_CHECKPOINT_THREADS = 1024
+
+
+class BoundedMemorySaver(MemorySaver):
+    """
+    LRU 방식으로 보관 스레드 수를 제한하는 MemorySaver
+
+    사용 예시:
+        >>> checkpointer = BoundedMemorySaver(max_threads=256)
+        >>> workflow.compile(checkpointer=checkpointer)
+    """
+
+    def __init__(
+        self, max_threads: int = DEFAULT_MAX_CHECKPOINT_THREADS, **kwargs: Any
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            max_threads: 보관할 최대 thread_id 수 (기본값: 1024)
+        """
+        super().__init__(**kwargs)
+        if max_threads < 1:
+            raise ValueError(f"max_threads는 1 이상이어야 합니다: {max_threads}")
+        self.max_threads = max_threads
+        self._thread_order: "OrderedDict[str, None]" = OrderedDict()
+
+    def put(self, config, checkpoint, metadata, new_versions):  # type: ignore[override]
+        result = super().put(config, checkpoint, metadata, new_versions)
+
+        thread_id = config["configurable"]["thread_id"]
+        self._thread_order[thread_id] = None
+        self._thread_order.move_to_end(thread_id)
+
+        while len(self._thread_order) > self.max_threads:
+            evicted, _ = self._thread_order.popitem(last=False)
+            self._evict_thread(evicted)
+
+        return result
+
+    def release(self, thread_id: str) -> None:
+        """더 이상 재개하지 않는 스레드의 체크포인트를 즉시 삭제합니다."""
+        if thread_id in self._thread_order:
+            del self._thread_order[thread_id]
+            self._evict_thread(thread_id)
+
+    def _evict_thread(self, thread_id: str) -> None:
+        """스레드의 체크포인트, 중간 쓰기, 채널 값을 모두 삭제합니다."""
+        delete_thread = getattr(super(), "delete_thread", None)
+        if delete_thread is not None:
+            delete_thread(thread_id)
+            return
+
+        # delete_thread가 없는 구버전 langgraph 대응
+        self.storage.pop(thread_id, None)
+        for attr in ("writes", "blobs"):
+            store = getattr(self, attr, None)
+            if store is None:
+                continue
+            for key in [key for key in store if key[0] == thread_id]:
+                del store[key]
+
+
+class EndOfWorkflowSaver(BoundedMemorySaver):
+    """
+    워크플로우 종료 시점에만 체크포인트를 저장하는 BoundedMemorySaver
+    
+    LangGraph는 노드(super-step)마다 put()/put_writes()를 호출합니다.
+    이 어댑터는 스레드별로 put()을 버퍼에 모아 두었다가 flush()가 호출될 때
+    한 번만 실제로 저장합니다. 실패/취소된 실행의 버퍼는 discard()로 버립니다.
+    호출자는 checkpoint_scope로 실행을 감싸 둘 중 하나가 반드시 호출되도록 합니다.
+    
+    MemorySaver는 new_versions에 포함된 채널 값만 저장하므로, 버퍼링 중
+    모든 put()의 new_versions를 병합해 두었다가 최종 체크포인트와 함께 저장합니다
+    (이전 단계에서 쓰인 채널도 복원됨). 부모 체크포인트는 버퍼링을 시작할 때
+    config가 가리키던 체크포인트(마지막으로 실제 저장된 체크포인트)로 연결됩니다.
+    중간 단계에서 재개(resume)하지 않는 워크플로우 전용입니다.
+    """
+    
+    def __init__(self, **kwargs: Any) -> None:
+        """
+        초기화
+        
+        Args:
+            **kwargs: BoundedMemorySaver 인자 (max_threads 등)
+        """
+        super().__init__(**kwargs)
+        # (thread_id, checkpoint_ns) → 버퍼링 상태
+        #   config: 첫 put의 config (부모 체크포인트)
+        #   checkpoint/metadata: 최신 체크포인트
+        #   new_versions: 버퍼링 중 병합한 채널 버전
+        #   writes: 최신 체크포인트에 대한 put_writes 인자
+        self._pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    
+    def put(self, config, checkpoint, metadata, new_versions):  # type: ignore[override]
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        
+        pending = self._pending.get((thread_id, checkpoint_ns))
+        if pending is None:
+            pending = self._pending[(thread_id, checkpoint_ns)] = {
+                "config": config,
+                "new_versions": {},
+            }
+        pending["checkpoint"] = checkpoint
+        pending["metadata"] = metadata
+        pending["new_versions"].update(new_versions)
+        # 이전 체크포인트의 쓰기 기록은 새 체크포인트에 반영되었으므로 버림
+        pending["writes"] = []
+        
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+    
+    def put_writes(self, config, writes, task_id, *args: Any, **kwargs: Any) -> None:  # type: ignore[override]
+        configurable = config["configurable"]
+        pending = self._pending.get(
+            (configurable["thread_id"], configurable.get("checkpoint_ns", ""))
+        )
+        if pending is None:
+            # 이미 저장된 체크포인트에 대한 쓰기 기록
+            super().put_writes(config, writes, task_id, *args, **kwargs)
+        elif configurable.get("checkpoint_id") == pending["checkpoint"]["id"]:
+            pending["writes"].append((config, writes, task_id, args, kwargs))
+    
+    def _pending_keys(self, thread_id: str) -> List[Tuple[str, str]]:
+        return [key for key in self._pending if key[0] == thread_id]
+    
+    def flush(self, thread_id: str) -> None:
+        """스레드의 버퍼링된 체크포인트를 저장합니다."""
+        for key in self._pending_keys(thread_id):
+            pending = self._pending.pop(key)
+            super().put(
+                pending["config"],
+                pending["checkpoint"],
+                pending["metadata"],
+                pending["new_versions"],
+            )
+            for config, writes, task_id, args, kwargs in pending["writes"]:
+                super().put_writes(config, writes, task_id, *args, **kwargs)
+    
+    def discard(self, thread_id: str) -> None:
+        """스레드의 버퍼링된 체크포인트를 저장하지 않고 버립니다 (실패/취소된 실행)."""
+        for key in self._pending_keys(thread_id):
+            del self._pending[key]
+
+
+@contextmanager
+def checkpoint_scope(checkpointer: Any, thread_ids: Iterable[str]) -> Iterator[None]:
+    """
+    워크플로우 실행 구간을 감싸 EndOfWorkflowSaver 버퍼를 정리합니다.
+    
+    정상 종료하면 thread_ids의 버퍼를 저장(flush)하고, 예외/취소/스트림 조기 종료로
+    빠져나가면 버립니다(discard). 버퍼가 남아 메모리가 계속 늘어나는 것을 막습니다.
+    다른 Checkpointer(또는 None)이면 아무것도 하지 않습니다.
+    
+    사용 예시:
+        >>> with checkpoint_scope(checkpointer, [thread_id]):
+        ...     final_state = await workflow.ainvoke(initial_state, config)
+    """
+    if not isinstance(checkpointer, EndOfWorkflowSaver):
+        yield
+        return
+    
+    thread_ids = list(thread_ids)
+    succeeded = False
+    try:
+        yield
+        succeeded = True
+    finally:
+        for thread_id in thread_ids:
+            if succeeded:
+                checkpointer.flush(thread_id)
+            else:
+                checkpointer.discard(thread_id)
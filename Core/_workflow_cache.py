@@ -0,0 +1,65 @@
+"""
+컴파일된 워크플로우 캐시
+
+AskMode/ForgeMode 인스턴스 간에 컴파일된 그래프와 노드(노드가 캡처한
+LLM/벡터 스토어 클라이언트 포함)를 공유하기 위한 LRU 캐시입니다.
+항목이 그래프와 클라이언트를 참조하므로 max_size로 보관 개수를 제한하여
+오래 쓰이지 않은 구성의 항목은 해제되도록 합니다.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+DEFAULT_MAX_CACHED_WORKFLOWS = 8
+
+
+class WorkflowCache:
+    """
+    스레드 안전한 LRU 워크플로우 캐시
+
+    사용 예시:
+        >>> cache = WorkflowCache(max_size=4)
+        >>> entry = cache.get(key)
+        >>> if entry is None:
+        ...     entry = {"workflow": compile_workflow()}
+        ...     cache.put(key, entry)
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_CACHED_WORKFLOWS) -> None:
+        """
+        초기화
+
+        Args:
+            max_size: 보관할 최대 항목 수 (기본값: 8)
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size는 1 이상이어야 합니다: {max_size}")
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """항목을 조회합니다 (적중 시 최근 사용으로 갱신)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, entry: Dict[str, Any]) -> None:
+        """항목을 저장하고 max_size를 넘으면 가장 오래된 항목을 삭제합니다."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """모든 항목을 삭제합니다."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -12,9 +12,14 @@ Ask Mode - RAG 질의응답 모드
 최신 LangGraph 권장 방식 100% 준수
 """
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional
+from collections import OrderedDict
+from contextlib import aclosing
+from uuid import uuid4
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Final, List, Optional, Tuple
 
+import numpy as np
 from google.cloud import aiplatform
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_google_vertexai import (
@@ -23,7 +28,6 @@ from langchain_google_vertexai import (
     VectorSearchVectorStore,
 )
 from langgraph.graph import END, START, StateGraph  # type: ignore
-from langgraph.checkpoint.memory import MemorySaver  # type: ignore
 
 # CompiledGraph 타입 정의 (LangGraph 0.2.0+)
 try:
@@ -67,12 +71,98 @@ from State import State
 from Node import (
     create_route_question_node,
     create_retrieve_documents_node,
-    create_format_context_node,
     create_generate_answer_node,
-    create_format_output_node,
 )
 from Edge import build_workflow_edges
 
+from ._bounded_memsaver import (
+    DEFAULT_MAX_CHECKPOINT_THREADS,
+    BoundedMemorySaver,
+    EndOfWorkflowSaver,
+    checkpoint_scope,
+)
+from ._workflow_cache import WorkflowCache
+
+
+# 워크플로우 캐시 항목에 저장하고 적중 시 인스턴스에 복원하는 속성
+# (노드 클로저가 LLM/벡터 스토어를 캡처하므로 클라이언트도 함께 공유)
+_SHARED_WORKFLOW_ATTRS: Final = (
+    "llm",
+    "embeddings",
+    "vector_store",
+    "route_question",
+    "retrieve_documents",
+    "generate_answer",
+    "workflow",
+    "checkpointer",
+)
+
+
+# ==================== 프롬프트 템플릿 ====================
+
+_RAG_TEMPLATE = """당신은 응급의료 전문가입니다. 다음 참고 문서들을 바탕으로 질문에 정확하고 상세하게 답변해주세요.
+
+참고 문서:
+{context}
+
+질문: {question}
+
+답변 요구사항:
+- 참고 문서의 내용을 기반으로 정확하게 답변하세요
+- 출처를 명확히 밝혀주세요 (예: "문서의 X장 Y절에 따르면...")
+- 불확실한 내용은 추측하지 말고 "문서에서 찾을 수 없습니다"라고 명시하세요
+- 응급의료 분야의 전문성을 고려하여 답변하세요
+
+답변:"""
+
+_CHAT_TEMPLATE = """당신은 친절한 전문 어시스턴트입니다. 사용자의 질문에 자연스럽고 정확하게 답변하세요.
+
+질문: {question}
+
+원칙:
+- 문서 검색 결과가 없으므로 일반 지식과 상식에 기반해 답변합니다.
+- 불확실한 정보는 추측하지 말고 모른다고 답하세요.
+"""
+
+# 인스턴스마다 변하지 않으므로 import 시 한 번만 파싱
+_RAG_PROMPT: Final = ChatPromptTemplate.from_template(_RAG_TEMPLATE)
+_CHAT_PROMPT: Final = ChatPromptTemplate.from_template(_CHAT_TEMPLATE)
+
+
+# 초기 상태 템플릿 (요청마다 dict(_INITIAL_STATE_TEMPLATE, question=...)로 복사)
+# context/source_documents/messages는 operator.add/add_messages 리듀서 필드라
+# 리스트여야 합니다. 리듀서가 항상 새 리스트를 만들기 때문에 템플릿의 빈 리스트가
+# 실행 상태로 공유(aliasing)되지 않습니다.
+_INITIAL_STATE_TEMPLATE: State = {
+    "question": "",
+    "question_embedding": None,
+    "context": [],
+    "formatted_context": "",
+    "answer": "",
+    "source_documents": [],
+    "num_sources": 0,
+    "error": None,
+    "should_retry": False,
+    "messages": [],
+    "pipeline": "rag",
+    "routing_reason": None,
+}
+
+
+# 프로세스 전역 Embeddings 클라이언트 캐시
+# key: (project, location, model_name) → VertexAIEmbeddings
+_EMBEDDINGS_CACHE: Dict[Tuple[Any, ...], VertexAIEmbeddings] = {}
+
+
+def _preview(text: str, n: int = 50) -> str:
+    """로그용 미리보기 (n자 초과 시 잘라서 "..." 추가)"""
+    return text if len(text) <= n else text[:n] + "..."
+
+
+def _normalize_question(question: str) -> str:
+    """캐시 키용 질문 정규화 (소문자 + 공백 정리)"""
+    return " ".join(question.lower().split())
+
 
 # ==================== LangGraph Generator ====================
 
@@ -95,11 +185,18 @@ class AskMode:
         result = ask_mode.process("응급의료기관의 종류는 무엇인가요?")
         print(result["answer"])
         
-        # 스트리밍
+        # 비동기 환경 (FastAPI 등)
+        result = await ask_mode.aprocess("응급의료기관의 종류는 무엇인가요?")
+        
+        # 스트리밍 (답변 토큰 + 노드 완료 이벤트)
         async for event in ask_mode.process_stream("질문"):
-            print(event["node"], event["output"])
+            print(event.get("token") or event["node"])
     """
     
+    # 컴파일된 워크플로우 캐시 (클래스 레벨, 인스턴스 간 공유, LRU로 개수 제한)
+    # key: _workflow_cache_key() → value: 클라이언트/노드/워크플로우 딕셔너리
+    _workflow_cache: WorkflowCache = WorkflowCache()
+    
     def __init__(
         self,
         vector_store: Optional[VectorSearchVectorStore] = None,
@@ -122,19 +219,14 @@ class AskMode:
         self.logger = logger or setup_logging("Core.AskMode")
         
         # 설정 초기화
-        self.retriever_config = get_retriever_config()
+        # 설정 getter는 캐시된 딕셔너리를 공유하므로 복사 후 수정
+        self.retriever_config = dict(get_retriever_config())
         if custom_config:
             self.retriever_config.update(custom_config)
         
         self.vertex_config = VERTEX_AI_CONFIG
-        self.gemini_config = get_gemini_model_config()
-        self.generation_config = get_generation_config()
-        
-        # Vertex AI 초기화
-        self._initialize_vertex_ai(llm, embeddings)
-        
-        # 벡터 스토어 초기화
-        self._initialize_vector_store(vector_store)
+        self.gemini_config = dict(get_gemini_model_config())
+        self.generation_config = dict(get_generation_config())
         
         # 유틸리티 클래스 초기화
         self.vector_search_utils = VectorSearchUtils()
@@ -143,11 +235,12 @@ class AskMode:
         # 프롬프트 템플릿 초기화
         self._initialize_prompt()
         
-        # 노드 및 엣지 초기화
-        self._initialize_nodes_and_edges()
+        # Vertex AI/벡터 스토어, 노드 초기화 및 LangGraph 워크플로우 빌드
+        # (동일 구성이면 캐시된 클라이언트/노드/그래프 재사용)
+        self._build_workflow(llm, embeddings, vector_store)
         
-        # LangGraph 워크플로우 빌드
-        self.workflow = self._build_workflow()
+        # 답변 캐시 초기화
+        self._initialize_cache()
         
         self.logger.info("✅ AskMode 초기화 완료")
     
@@ -158,10 +251,7 @@ class AskMode:
     ) -> None:
         """Vertex AI 초기화"""
         try:
-            aiplatform.init(
-                project=self.vertex_config["project"],
-                location=self.vertex_config["location"],
-            )
+            self._init_vertex_sdk()
             
             # LLM 초기화
             if llm is not None:
@@ -188,6 +278,65 @@ class AskMode:
             self.logger.error(f"Vertex AI 초기화 실패: {e}")
             raise RuntimeError(f"Vertex AI 초기화 실패: {e}")
     
+    def _init_vertex_sdk(self) -> None:
+        """
+        aiplatform SDK 초기화 (블로킹 네트워크 호출)
+        
+        이벤트 루프 안에서 AskMode를 생성해야 한다면 AskMode.acreate /
+        create_ask_mode_async를 사용하여 스레드에서 실행하세요.
+        """
+        aiplatform.init(
+            project=self.vertex_config["project"],
+            location=self.vertex_config["location"],
+        )
+    
+    @classmethod
+    async def acreate(cls, **kwargs: Any) -> "AskMode":
+        """
+        비동기 환경용 생성자
+        
+        aiplatform.init, VectorSearchVectorStore.from_components 등
+        블로킹 SDK 호출이 이벤트 루프를 막지 않도록 생성자를 스레드에서 실행합니다.
+        
+        Args:
+            **kwargs: AskMode.__init__ 인자
+        
+        Returns:
+            초기화된 AskMode 인스턴스
+        
+        예제:
+            ask_mode = await AskMode.acreate(logger=logger)
+        """
+        return await asyncio.to_thread(cls, **kwargs)
+    
+    def _get_or_create_embeddings(self) -> VertexAIEmbeddings:
+        """
+        VertexAIEmbeddings 클라이언트 반환 (프로세스 전역 공유)
+        
+        (project, location, model_name)이 같은 AskMode 인스턴스들은
+        하나의 클라이언트(채널, 인증 토큰)를 공유합니다.
+        custom_config["share_embeddings_client"]=False이면 새로 생성합니다.
+        """
+        model_name = self.retriever_config["embedding_model"]
+        project = self.vertex_config["project"]
+        location = self.vertex_config["location"]
+        
+        if not self.retriever_config.get("share_embeddings_client", True):
+            return VertexAIEmbeddings(
+                model_name=model_name, project=project, location=location
+            )
+        
+        key = (project, location, model_name)
+        embeddings = _EMBEDDINGS_CACHE.get(key)
+        if embeddings is None:
+            embeddings = VertexAIEmbeddings(
+                model_name=model_name, project=project, location=location
+            )
+            _EMBEDDINGS_CACHE[key] = embeddings
+        else:
+            self.logger.info("공유 Embeddings 클라이언트 재사용")
+        return embeddings
+    
     def _initialize_vector_store(
         self, vector_store: Optional[VectorSearchVectorStore]
     ) -> None:
@@ -201,11 +350,7 @@ class AskMode:
             # Embeddings 초기화 (아직 없다면)
             if not self.embeddings:
                 embedding_dims = self.retriever_config.get("embedding_dimensions", 768)
-                self.embeddings = VertexAIEmbeddings(
-                    model_name=self.retriever_config["embedding_model"],
-                    project=self.vertex_config["project"],
-                    location=self.vertex_config["location"],
-                )
+                self.embeddings = self._get_or_create_embeddings()
                 self.logger.info(f"Embeddings 초기화 완료 (차원: {embedding_dims})")
             
             # 설정에서 ID 가져오기
@@ -234,34 +379,41 @@ class AskMode:
     
     def _initialize_prompt(self) -> None:
         """프롬프트 템플릿 초기화"""
-        rag_template = """당신은 응급의료 전문가입니다. 다음 참고 문서들을 바탕으로 질문에 정확하고 상세하게 답변해주세요.
-
-참고 문서:
-{context}
-
-질문: {question}
-
-답변 요구사항:
-- 참고 문서의 내용을 기반으로 정확하게 답변하세요
-- 출처를 명확히 밝혀주세요 (예: "문서의 X장 Y절에 따르면...")
-- 불확실한 내용은 추측하지 말고 "문서에서 찾을 수 없습니다"라고 명시하세요
-- 응급의료 분야의 전문성을 고려하여 답변하세요
-
-답변:"""
-
-        chat_template = """당신은 친절한 전문 어시스턴트입니다. 사용자의 질문에 자연스럽고 정확하게 답변하세요.
-
-질문: {question}
-
-원칙:
-- 문서 검색 결과가 없으므로 일반 지식과 상식에 기반해 답변합니다.
-- 불확실한 정보는 추측하지 말고 모른다고 답하세요.
-"""
-
-        self.prompt = ChatPromptTemplate.from_template(rag_template)
-        self.chat_prompt = ChatPromptTemplate.from_template(chat_template)
+        # 모듈 로드 시 한 번 생성된 템플릿을 공유 (인스턴스별 재파싱 없음)
+        self.prompt = _RAG_PROMPT
+        self.chat_prompt = _CHAT_PROMPT
         self.logger.info("프롬프트 템플릿 초기화 완료")
     
+    def _initialize_cache(self) -> None:
+        """
+        답변 캐시 초기화
+        
+        2단계 캐시로 동일/유사 질문에 대한 워크플로우 재실행을 생략합니다.
+        - 정확 일치: 정규화된 질문 문자열 키 (LRU)
+        - 의미 일치: 질문 임베딩 코사인 유사도 >= semantic_cache_threshold
+        
+        custom_config["enable_semantic_cache"]가 True일 때만 활성화됩니다.
+        """
+        self.cache_enabled = bool(
+            self.retriever_config.get("enable_semantic_cache", False)
+        )
+        self.cache_size = int(self.retriever_config.get("semantic_cache_size", 256))
+        self.sim_threshold = float(
+            self.retriever_config.get("semantic_cache_threshold", 0.97)
+        )
+        
+        self._exact_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._sem_cache: List[Tuple[np.ndarray, Dict[str, Any]]] = []
+        self._sem_matrix: Optional[np.ndarray] = None  # 캐시 임베딩 행렬 (지연 생성)
+        self._cache_hits = {"exact": 0, "semantic": 0}
+        self._cache_misses = 0
+        
+        if self.cache_enabled:
+            self.logger.info(
+                f"답변 캐시 활성화 (크기: {self.cache_size}, "
+                f"유사도 임계값: {self.sim_threshold})"
+            )
+    
     # ==================== 노드 및 엣지 초기화 ====================
     
     def _initialize_nodes_and_edges(self) -> None:
@@ -286,10 +438,6 @@ class AskMode:
             logger=self.logger,
         )
         
-        self.format_context = create_format_context_node(
-            logger=self.logger,
-        )
-        
         self.generate_answer = create_generate_answer_node(
             llm=self.llm,
             rag_prompt=self.prompt,
@@ -297,29 +445,100 @@ class AskMode:
             logger=self.logger,
         )
         
-        self.format_output = create_format_output_node(
-            logger=self.logger,
-        )
-        
         self.logger.info("노드 함수 초기화 완료")
     
     # ==================== 워크플로우 빌드 ====================
     
-    def _build_workflow(self) -> CompiledGraph:
+    def _workflow_cache_key(
+        self,
+        llm: Optional[VertexAI],
+        embeddings: Optional[VertexAIEmbeddings],
+        vector_store: Optional[VectorSearchVectorStore],
+    ) -> Tuple[Any, ...]:
+        """
+        워크플로우 캐시 키 생성
+        
+        기본 생성되는 LLM/벡터 스토어는 설정값(retriever/vertex/gemini)으로,
+        외부에서 주입한 객체는 identity로 구분합니다. 캐시 항목이 주입 객체를
+        참조하므로 항목이 남아 있는 동안에는 같은 id가 다른 객체에 재사용되지 않습니다.
+        """
+        return (
+            None if llm is None else id(llm),
+            None if embeddings is None else id(embeddings),
+            None if vector_store is None else id(vector_store),
+            id(self.logger),
+            repr(sorted(self.retriever_config.items())),
+            repr(sorted(self.vertex_config.items())),
+            repr(sorted(self.gemini_config.items())),
+        )
+    
+    def _build_workflow(
+        self,
+        llm: Optional[VertexAI] = None,
+        embeddings: Optional[VertexAIEmbeddings] = None,
+        vector_store: Optional[VectorSearchVectorStore] = None,
+    ) -> None:
+        """
+        클라이언트, 노드, LangGraph 워크플로우를 초기화합니다 (클래스 레벨 캐시 사용).
+        
+        같은 설정과 같은 주입 객체로 생성된 AskMode 인스턴스들은 LLM/벡터 스토어
+        클라이언트, 노드, 컴파일된 그래프, Checkpointer를 공유하므로 요청마다
+        AskMode를 만드는 환경에서도 클라이언트 생성과 컴파일을 반복하지 않습니다.
+        캐시는 최근 사용한 구성만 보관합니다 (WorkflowCache.max_size).
+        custom_config["share_workflow"]=False이면 항상 새로 빌드합니다.
+        
+        Args:
+            llm: VertexAI LLM 객체 (None이면 설정으로 생성)
+            embeddings: VertexAIEmbeddings 객체 (선택사항)
+            vector_store: 벡터 스토어 객체 (None이면 설정으로 생성)
+        """
+        share = self.retriever_config.get("share_workflow", True)
+        key = self._workflow_cache_key(llm, embeddings, vector_store) if share else None
+        
+        entry = AskMode._workflow_cache.get(key) if share else None
+        if entry is not None:
+            for name in _SHARED_WORKFLOW_ATTRS:
+                setattr(self, name, entry[name])
+            self._workflow_entry = entry
+            self.logger.info("✅ 캐시된 LangGraph 워크플로우 재사용")
+            return
+        
+        self._initialize_vertex_ai(llm, embeddings)
+        self._initialize_vector_store(vector_store)
+        self._initialize_nodes_and_edges()
+        self.workflow, self.checkpointer = self._compile_workflow()
+        
+        # checkpoint_mode="off"에서 thread_id 요청 시 사용할 워크플로우는
+        # _resolve_workflow에서 지연 컴파일하여 thread_workflow에 저장
+        entry = {name: getattr(self, name) for name in _SHARED_WORKFLOW_ATTRS}
+        entry["thread_workflow"] = None
+        self._workflow_entry = entry
+        if share:
+            AskMode._workflow_cache.put(key, entry)
+    
+    def _compile_workflow(
+        self, checkpoint_mode: Optional[str] = None
+    ) -> Tuple[CompiledGraph, Any]:
         """
         LangGraph 워크플로우를 빌드합니다.
         
         워크플로우 구조:
-        START -> route_question -> (조건부) retrieve_documents -> format_context 
-              -> generate_answer -> format_output -> END
+        START -> route_question -> (Command) retrieve_documents
+              -> generate_answer -> END
+        
+        컨텍스트 포맷팅은 retrieve_documents, 출력 포맷팅은 generate_answer에서
+        함께 처리하여 super-step(상태 복사/체크포인트) 수를 줄입니다.
         
         각 노드는 자체적으로 에러를 처리하여 
         조건부 분기 없이 선형적으로 진행합니다.
         
         엣지는 Edge 모듈에서 중앙 관리됩니다.
         
+        Args:
+            checkpoint_mode: Checkpointer 종류 (None이면 retriever_config 설정 사용)
+        
         Returns:
-            컴파일된 CompiledGraph (상태 저장 지원)
+            (컴파일된 CompiledGraph, Checkpointer 또는 None)
             
         Note:
             최신 LangGraph 권장 방식:
@@ -338,21 +557,40 @@ class AskMode:
             # 2. 노드 추가 (명시적 정의)
             workflow.add_node("route_question", self.route_question)
             workflow.add_node("retrieve_documents", self.retrieve_documents)
-            workflow.add_node("format_context", self.format_context)
             workflow.add_node("generate_answer", self.generate_answer)
-            workflow.add_node("format_output", self.format_output)
             
             # 3. 엣지 추가 (Edge 모듈에서 관리)
             build_workflow_edges(workflow)
             
-            # 4. Checkpointer 생성 (상태 저장/복원 지원)
-            checkpointer = MemorySaver()
+            # 4. Checkpointer 생성 (checkpoint_mode 설정에 따름)
+            #    - "off": 체크포인트 저장 안 함 (기본값, 중간 재개가 없으므로)
+            #      thread_id를 넘긴 요청은 _resolve_workflow에서 end_of_workflow로 실행
+            #    - "per_node": 노드마다 저장 (BoundedMemorySaver)
+            #    - "end_of_workflow": 워크플로우 종료 시에만 저장
+            #    보관 thread_id 수는 max_checkpoint_threads로 제한 (LRU 삭제)
+            if checkpoint_mode is None:
+                checkpoint_mode = self.retriever_config.get("checkpoint_mode", "off")
+            max_threads = int(
+                self.retriever_config.get(
+                    "max_checkpoint_threads", DEFAULT_MAX_CHECKPOINT_THREADS
+                )
+            )
+            if checkpoint_mode == "per_node":
+                checkpointer = BoundedMemorySaver(max_threads=max_threads)
+            elif checkpoint_mode == "end_of_workflow":
+                checkpointer = EndOfWorkflowSaver(max_threads=max_threads)
+            elif checkpoint_mode == "off":
+                checkpointer = None
+            else:
+                raise ValueError(f"지원하지 않는 checkpoint_mode: {checkpoint_mode}")
             
-            # 5. 워크플로우 컴파일 (Checkpointer 포함)
+            # 5. 워크플로우 컴파일
             compiled_workflow = workflow.compile(checkpointer=checkpointer)
             
-            self.logger.info("✅ LangGraph 워크플로우 빌드 완료 (Checkpointer 활성화)")
-            return compiled_workflow
+            self.logger.info(
+                f"✅ LangGraph 워크플로우 빌드 완료 (checkpoint_mode={checkpoint_mode})"
+            )
+            return compiled_workflow, checkpointer
             
         except Exception as e:
             self.logger.error(f"워크플로우 빌드 실패: {e}")
@@ -364,7 +602,11 @@ class AskMode:
         self, question: str, return_sources: bool = True
     ) -> Dict[str, Any]:
         """
-        질문 처리 통합 메서드
+        질문 처리 통합 메서드 (동기 래퍼)
+        
+        aprocess를 asyncio.run으로 실행합니다.
+        FastAPI 엔드포인트, LangGraph 서버 등 이벤트 루프가 이미 실행 중인
+        비동기 환경에서는 이벤트 루프를 막지 않도록 aprocess를 직접 await하세요.
         
         Args:
             question: 처리할 질문
@@ -382,43 +624,65 @@ class AskMode:
             result = ask_mode.process("응급의료기관의 종류는 무엇인가요?")
             print(result["answer"])
         """
+        return asyncio.run(self.aprocess(question, return_sources))
+    
+    async def aprocess(
+        self,
+        question: str,
+        return_sources: bool = True,
+        thread_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        질문 처리 통합 메서드 (비동기)
+        
+        workflow.ainvoke로 워크플로우를 실행하므로 Vertex AI 호출 중에도
+        이벤트 루프가 다른 요청을 처리할 수 있습니다.
+        
+        Args:
+            question: 처리할 질문
+            return_sources: 출처 문서 포함 여부 (기본값: True)
+            thread_id: 대화 스레드 ID (상태 저장용, 선택사항)
+        
+        Returns:
+            process와 동일한 형식의 결과 딕셔너리
+        
+        예제:
+            result = await ask_mode.aprocess("응급의료기관의 종류는 무엇인가요?")
+            print(result["answer"])
+        """
         try:
-            question_preview = (
-                f"{question[:50]}..." if len(question) > 50 else question
-            )
-            self.logger.info(f"질문 처리 시작: '{question_preview}'")
+            self.logger.info(f"질문 처리 시작: '{_preview(question)}'")
+            
+            # 캐시 조회 (적중 시 워크플로우 생략)
+            question_embedding = None
+            if self.cache_enabled:
+                cached, question_embedding = await self._lookup_cache(question)
+                if cached is not None:
+                    result = self._build_result(cached, return_sources)
+                    result["question"] = question
+                    return result
             
             # 초기 상태 생성
-            initial_state: State = {
-                "question": question,
-                "context": [],
-                "formatted_context": "",
-                "answer": "",
-                "source_documents": [],
-                "num_sources": 0,
-                "error": None,
-                "should_retry": False,
-                "messages": [],
-                "pipeline": "rag",
-                "routing_reason": None,
-            }
+            initial_state: State = dict(_INITIAL_STATE_TEMPLATE, question=question)
+            if question_embedding is not None and self._cache_embeddings_match_store():
+                # 캐시 조회용 임베딩을 검색에 재사용 (임베딩 API 호출 1회 절약)
+                initial_state["question_embedding"] = question_embedding.tolist()
             
-            # LangGraph 워크플로우 실행 (Checkpointer를 위한 config 추가)
-            config = {"configurable": {"thread_id": "default"}}
-            final_state = self.workflow.invoke(initial_state, config)
+            # LangGraph 워크플로우 실행
+            workflow, checkpointer = self._resolve_workflow(thread_id)
+            config = self._make_config(checkpointer, thread_id)
+            # 정상 종료 시 체크포인트 저장, 실패/취소 시 버퍼 폐기
+            with checkpoint_scope(checkpointer, [thread_id or "default"]):
+                final_state = await workflow.ainvoke(initial_state, config)
             
             # 결과 딕셔너리 생성
-            result = {
-                "question": final_state["question"],
-                "answer": final_state["answer"],
-                "pipeline": final_state.get("pipeline", "rag"),
-                "routing_reason": final_state.get("routing_reason"),
-            }
+            result = self._build_result(final_state, return_sources)
             
-            # 출처 정보 포함
-            if return_sources:
-                result["source_documents"] = final_state["source_documents"]
-                result["num_sources"] = final_state["num_sources"]
+            # 정상 처리된 결과만 캐시에 저장
+            if self.cache_enabled and not final_state.get("error"):
+                self._store_cache(
+                    question, self._build_result(final_state, True), question_embedding
+                )
             
             self.logger.info(
                 f"질문 처리 완료: {len(result['answer'])}자 답변 생성"
@@ -429,6 +693,164 @@ class AskMode:
             self.logger.error(f"질문 처리 실패: {e}")
             raise RuntimeError(f"질문 처리 실패: {e}")
     
+    async def process_batch_async(
+        self,
+        questions: List[str],
+        return_sources: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 질문 일괄 처리 (비동기)
+        
+        질문마다 초기 상태를 만들고 workflow.abatch로 한 번에 실행합니다.
+        검색/생성 단계의 네트워크 I/O가 질문 간에 겹쳐 처리되므로
+        질문을 하나씩 process로 호출하는 것보다 전체 소요 시간이 짧습니다.
+        
+        custom_config["max_concurrency"]를 지정하면 동시에 실행되는 질문 수를
+        제한합니다 (Vertex AI 채널의 동시 스트림/쿼터에 맞춰 조정).
+        
+        정규화 후 동일한 질문은 한 번만 실행하고 결과를 공유합니다
+        (비교 평가 등에서 같은 질문/컨텍스트로 프롬프트 렌더링과
+        LLM 호출을 반복하지 않도록).
+        
+        답변 캐시가 켜져 있으면 aprocess와 같이 고유 질문마다 캐시를 먼저 조회하고,
+        미스된 질문만 워크플로우로 실행한 뒤 정상 처리된 결과를 캐시에 저장합니다.
+        
+        Args:
+            questions: 처리할 질문 리스트
+            return_sources: 출처 문서 포함 여부 (기본값: True)
+        
+        Returns:
+            질문 순서와 동일한 순서의 결과 딕셔너리 리스트
+            (각 항목의 형식은 process와 동일)
+        
+        예제:
+            results = await ask_mode.process_batch_async(["질문1", "질문2"])
+            for result in results:
+                print(result["answer"])
+        """
+        if not questions:
+            return []
+        
+        try:
+            self.logger.info(f"일괄 질문 처리 시작: {len(questions)}개")
+            
+            # 중복 질문 제거 (정규화 키 → 고유 질문 인덱스)
+            unique_questions: List[str] = []
+            unique_index: Dict[str, int] = {}
+            question_slots: List[int] = []
+            for question in questions:
+                key = _normalize_question(question)
+                if key not in unique_index:
+                    unique_index[key] = len(unique_questions)
+                    unique_questions.append(question)
+                question_slots.append(unique_index[key])
+            
+            if len(unique_questions) < len(questions):
+                self.logger.info(
+                    f"중복 질문 {len(questions) - len(unique_questions)}개 병합 "
+                    f"(실행: {len(unique_questions)}개)"
+                )
+            
+            # 캐시 조회 (적중한 질문은 워크플로우에서 제외)
+            unique_states: List[Optional[Dict[str, Any]]] = [None] * len(unique_questions)
+            question_embeddings: List[Optional[np.ndarray]] = [None] * len(unique_questions)
+            if self.cache_enabled:
+                lookups = await asyncio.gather(
+                    *(self._lookup_cache(question) for question in unique_questions)
+                )
+                for i, (cached, embedding) in enumerate(lookups):
+                    unique_states[i] = cached
+                    question_embeddings[i] = embedding
+            
+            pending = [i for i, state in enumerate(unique_states) if state is None]
+            if len(pending) < len(unique_questions):
+                self.logger.info(
+                    f"답변 캐시 적중 {len(unique_questions) - len(pending)}개 "
+                    f"(실행: {len(pending)}개)"
+                )
+            
+            if pending:
+                # 질문별 초기 상태 및 config 생성 (thread_id는 항목마다 분리)
+                reuse_embedding = self._cache_embeddings_match_store()
+                initial_states = []
+                for i in pending:
+                    initial_state: State = dict(
+                        _INITIAL_STATE_TEMPLATE, question=unique_questions[i]
+                    )
+                    if question_embeddings[i] is not None and reuse_embedding:
+                        # 캐시 조회용 임베딩을 검색에 재사용
+                        initial_state["question_embedding"] = question_embeddings[i].tolist()
+                    initial_states.append(initial_state)
+                # thread_id는 호출마다 고유하게 생성 (고정 ID를 쓰면 다음 배치가 이전 배치의
+                # 스레드를 이어받아 operator.add 필드(context, source_documents)가 누적됨)
+                thread_ids = [f"batch_{uuid4().hex}" for _ in pending]
+                configs = [
+                    self._make_config(self.checkpointer, thread_id)
+                    for thread_id in thread_ids
+                ]
+                
+                # 동시 실행 수 제한 (Vertex AI 채널/쿼터에 맞춰 조정)
+                max_concurrency = self.retriever_config.get("max_concurrency")
+                if max_concurrency:
+                    for config in configs:
+                        config["max_concurrency"] = int(max_concurrency)
+                
+                try:
+                    with checkpoint_scope(self.checkpointer, thread_ids):
+                        final_states = await self.workflow.abatch(initial_states, configs)
+                finally:
+                    # 배치 스레드는 재개하지 않으므로 체크포인트를 바로 삭제
+                    self._release_threads(thread_ids)
+                
+                for i, final_state in zip(pending, final_states):
+                    unique_states[i] = final_state
+                    # 정상 처리된 결과만 캐시에 저장
+                    if self.cache_enabled and not final_state.get("error"):
+                        self._store_cache(
+                            unique_questions[i],
+                            self._build_result(final_state, True),
+                            question_embeddings[i],
+                        )
+            
+            unique_results = [
+                self._build_result(state, return_sources)
+                for state in unique_states
+            ]
+            
+            # 원래 질문 순서대로 결과 복원 (중복 항목은 얕은 복사본)
+            results = []
+            for question, slot in zip(questions, question_slots):
+                result = dict(unique_results[slot])
+                result["question"] = question
+                results.append(result)
+            
+            self.logger.info(f"일괄 질문 처리 완료: {len(results)}개 답변 생성")
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"일괄 질문 처리 실패: {e}")
+            raise RuntimeError(f"일괄 질문 처리 실패: {e}")
+    
+    def process_batch(
+        self,
+        questions: List[str],
+        return_sources: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 질문 일괄 처리 (동기 래퍼)
+        
+        process_batch_async를 asyncio.run으로 실행합니다.
+        이미 이벤트 루프가 실행 중인 환경에서는 process_batch_async를 직접 await하세요.
+        
+        Args:
+            questions: 처리할 질문 리스트
+            return_sources: 출처 문서 포함 여부 (기본값: True)
+        
+        Returns:
+            질문 순서와 동일한 순서의 결과 딕셔너리 리스트
+        """
+        return asyncio.run(self.process_batch_async(questions, return_sources))
+    
     async def process_stream(
         self, 
         question: str,
@@ -437,64 +859,64 @@ class AskMode:
         """
         질문 처리 스트리밍 메서드 (실시간 응답)
         
-        각 노드의 실행 결과를 실시간으로 스트리밍합니다.
-        프론트엔드에서 진행 상황을 표시하거나, 
-        긴 처리 시간에 대응할 때 유용합니다.
+        각 노드의 실행 결과와 generate_answer의 답변 토큰을 실시간으로
+        스트리밍합니다. 프론트엔드에서 진행 상황을 표시하거나,
+        답변을 생성되는 대로 보여줄 때 유용합니다.
         
         Args:
             question: 처리할 질문
             thread_id: 대화 스레드 ID (상태 저장용, 선택사항)
         
         Yields:
-            각 노드의 실행 결과를 포함한 딕셔너리:
-            - node: 실행된 노드 이름
-            - output: 노드의 출력 결과
+            두 종류의 딕셔너리:
+            - 토큰 이벤트: {"node": "generate_answer", "token": 답변 조각}
+            - 노드 완료 이벤트: {"node": 노드 이름, "output": 노드 출력 결과}
             
         예제:
             async for event in ask_mode.process_stream("질문"):
-                node = event.get("node")
-                if node == "generate_answer":
-                    answer = event["output"].get("answer")
-                    print(f"답변: {answer}")
+                if "token" in event:
+                    print(event["token"], end="", flush=True)
+                elif event["node"] == "generate_answer":
+                    sources = event["output"].get("source_documents")
         
         Note:
             최신 LangGraph 권장 방식:
-            - astream으로 실시간 스트리밍
+            - astream(stream_mode=["updates", "custom"])으로 노드 결과와
+              토큰을 함께 스트리밍
             - thread_id로 대화 세션 관리
         """
         try:
-            question_preview = (
-                f"{question[:50]}..." if len(question) > 50 else question
-            )
-            self.logger.info(f"스트리밍 처리 시작: '{question_preview}'")
+            self.logger.info(f"스트리밍 처리 시작: '{_preview(question)}'")
             
             # 초기 상태 생성
-            initial_state: State = {
-                "question": question,
-                "context": [],
-                "formatted_context": "",
-                "answer": "",
-                "source_documents": [],
-                "num_sources": 0,
-                "error": None,
-                "should_retry": False,
-                "messages": [],
-                "pipeline": "rag",
-                "routing_reason": None,
-            }
+            initial_state: State = dict(_INITIAL_STATE_TEMPLATE, question=question)
             
-            # config 설정 (thread_id가 있으면 상태 저장)
-            config = {"configurable": {"thread_id": thread_id or "default"}}
+            # config 설정 (Checkpointer가 있으면 thread_id로 상태 저장)
+            workflow, checkpointer = self._resolve_workflow(thread_id)
+            config = self._make_config(checkpointer, thread_id)
             
             # LangGraph 워크플로우 스트리밍 실행
-            async for event in self.workflow.astream(initial_state, config):
-                # 각 노드의 실행 결과를 실시간으로 반환
-                for node_name, node_output in event.items():
-                    self.logger.debug(f"노드 '{node_name}' 실행 완료")
-                    yield {
-                        "node": node_name,
-                        "output": node_output,
-                    }
+            # 호출자가 스트림을 중간에 닫거나 취소하면 체크포인트 버퍼 폐기
+            # (aclosing: 내부 스트림을 먼저 닫아 종료 시 put까지 끝난 뒤 폐기되도록)
+            with checkpoint_scope(checkpointer, [thread_id or "default"]):
+                async with aclosing(
+                    workflow.astream(
+                        initial_state, config, stream_mode=["updates", "custom"]
+                    )
+                ) as events:
+                    async for mode, event in events:
+                        if mode == "custom":
+                            # generate_answer 노드가 StreamWriter로 보낸 답변 토큰
+                            yield event
+                            continue
+                        
+                        # 각 노드의 실행 결과를 실시간으로 반환
+                        for node_name, node_output in event.items():
+                            self.logger.debug(f"노드 '{node_name}' 실행 완료")
+                            yield {
+                                "node": node_name,
+                                "output": node_output,
+                            }
             
             self.logger.info("스트리밍 처리 완료")
             
@@ -508,6 +930,197 @@ class AskMode:
                 },
             }
     
+    def get_thread_state(self, thread_id: str) -> Dict[str, Any]:
+        """
+        thread_id로 저장된 마지막 워크플로우 상태를 반환합니다.
+        
+        Args:
+            thread_id: aprocess/process_stream에 넘긴 대화 스레드 ID
+        
+        Returns:
+            State 딕셔너리 (저장된 상태가 없으면 빈 딕셔너리)
+        """
+        workflow, checkpointer = self._resolve_workflow(thread_id)
+        snapshot = workflow.get_state(self._make_config(checkpointer, thread_id))
+        return dict(snapshot.values)
+    
+    def _resolve_workflow(
+        self, thread_id: Optional[str] = None
+    ) -> Tuple[CompiledGraph, Any]:
+        """
+        실행할 워크플로우와 Checkpointer를 반환합니다.
+        
+        checkpoint_mode="off"여도 호출자가 thread_id를 넘기면 스레드 상태를
+        보관해야 하므로, end_of_workflow Checkpointer를 붙인 워크플로우를
+        처음 필요할 때 컴파일하여 사용합니다.
+        """
+        if thread_id is None or self.checkpointer is not None:
+            return self.workflow, self.checkpointer
+        
+        entry = self._workflow_entry
+        if entry["thread_workflow"] is None:
+            entry["thread_workflow"] = self._compile_workflow("end_of_workflow")
+        return entry["thread_workflow"]
+    
+    @staticmethod
+    def _make_config(checkpointer: Any, thread_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        워크플로우 실행 config 생성
+        
+        thread_id는 Checkpointer가 있을 때만 필요하므로
+        Checkpointer가 없으면 빈 config를 반환합니다.
+        """
+        if checkpointer is None:
+            return {}
+        return {"configurable": {"thread_id": thread_id or "default"}}
+    
+    def _release_threads(self, thread_ids: List[str]) -> None:
+        """실행이 끝난 thread의 체크포인트를 삭제합니다 (재개하지 않으므로)."""
+        if isinstance(self.checkpointer, BoundedMemorySaver):
+            for thread_id in thread_ids:
+                self.checkpointer.release(thread_id)
+    
+    # ==================== 답변 캐시 ====================
+    
+    def _get_cache_embeddings(self):
+        """캐시 유사도 계산에 사용할 임베딩 객체를 반환합니다."""
+        return self.embeddings or getattr(self.vector_store, "embeddings", None)
+    
+    def _cache_embeddings_match_store(self) -> bool:
+        """
+        캐시용 임베딩 모델이 벡터 스토어의 임베딩 모델과 같은지 확인합니다.
+        
+        같을 때만 캐시 조회에서 계산한 질문 임베딩을 벡터 검색에 재사용합니다.
+        캐시 임베딩은 L2 정규화되어 있지만 내적/코사인 검색 순위에는 영향이 없습니다.
+        """
+        store_embeddings = getattr(self.vector_store, "embeddings", None)
+        return (
+            store_embeddings is not None
+            and self._get_cache_embeddings() is store_embeddings
+        )
+    
+    async def _lookup_cache(
+        self, question: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[np.ndarray]]:
+        """
+        캐시에서 질문에 대한 결과를 조회합니다.
+        
+        Returns:
+            (캐시된 결과 또는 None, 정규화된 질문 임베딩 또는 None)
+            임베딩은 캐시 미스 후 저장 시 재사용됩니다.
+        """
+        key = _normalize_question(question)
+        cached = self._exact_cache.get(key)
+        if cached is not None:
+            self._exact_cache.move_to_end(key)
+            self._cache_hits["exact"] += 1
+            self.logger.info("✅ 답변 캐시 적중 (정확 일치)")
+            return cached, None
+        
+        embeddings = self._get_cache_embeddings()
+        if embeddings is None:
+            self._cache_misses += 1
+            return None, None
+        
+        try:
+            embedding = np.asarray(
+                await embeddings.aembed_query(question), dtype=np.float32
+            )
+        except Exception as e:
+            self.logger.warning(f"캐시용 질문 임베딩 실패: {e}")
+            self._cache_misses += 1
+            return None, None
+        
+        norm = float(np.linalg.norm(embedding))
+        if norm == 0.0:
+            self._cache_misses += 1
+            return None, None
+        embedding /= norm
+        
+        if self._sem_cache:
+            if self._sem_matrix is None:
+                self._sem_matrix = np.stack([emb for emb, _ in self._sem_cache])
+            similarities = self._sem_matrix @ embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.sim_threshold:
+                self._cache_hits["semantic"] += 1
+                self.logger.info(
+                    f"✅ 답변 캐시 적중 (유사도: {float(similarities[best]):.4f})"
+                )
+                return self._sem_cache[best][1], embedding
+        
+        self._cache_misses += 1
+        return None, embedding
+    
+    def _store_cache(
+        self,
+        question: str,
+        result: Dict[str, Any],
+        embedding: Optional[np.ndarray],
+    ) -> None:
+        """결과를 정확 일치/의미 일치 캐시에 저장합니다."""
+        key = _normalize_question(question)
+        self._exact_cache[key] = result
+        self._exact_cache.move_to_end(key)
+        while len(self._exact_cache) > self.cache_size:
+            self._exact_cache.popitem(last=False)
+        
+        if embedding is not None:
+            self._sem_cache.append((embedding, result))
+            if len(self._sem_cache) > self.cache_size:
+                del self._sem_cache[0]
+            self._sem_matrix = None
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        답변 캐시 통계를 반환합니다.
+        
+        Returns:
+            캐시 통계 딕셔너리:
+            - enabled: 캐시 활성화 여부
+            - exact_entries / semantic_entries: 캐시 항목 수
+            - exact_hits / semantic_hits / misses: 적중/미스 횟수
+            - hit_rate: 적중률 (0.0 ~ 1.0)
+        """
+        hits = self._cache_hits["exact"] + self._cache_hits["semantic"]
+        total = hits + self._cache_misses
+        return {
+            "enabled": self.cache_enabled,
+            "exact_entries": len(self._exact_cache),
+            "semantic_entries": len(self._sem_cache),
+            "exact_hits": self._cache_hits["exact"],
+            "semantic_hits": self._cache_hits["semantic"],
+            "misses": self._cache_misses,
+            "hit_rate": hits / total if total else 0.0,
+        }
+    
+    def clear_cache(self) -> None:
+        """답변 캐시와 통계를 초기화합니다."""
+        self._exact_cache.clear()
+        self._sem_cache.clear()
+        self._sem_matrix = None
+        self._cache_hits = {"exact": 0, "semantic": 0}
+        self._cache_misses = 0
+        self.logger.info("답변 캐시 초기화 완료")
+    
+    def _build_result(
+        self, final_state: Dict[str, Any], return_sources: bool
+    ) -> Dict[str, Any]:
+        """워크플로우 최종 상태를 반환용 결과 딕셔너리로 변환합니다."""
+        result = {
+            "question": final_state["question"],
+            "answer": final_state["answer"],
+            "pipeline": final_state.get("pipeline", "rag"),
+            "routing_reason": final_state.get("routing_reason"),
+        }
+        
+        # 출처 정보 포함
+        if return_sources:
+            result["source_documents"] = final_state["source_documents"]
+            result["num_sources"] = final_state["num_sources"]
+        
+        return result
+    
     def get_system_info(self) -> Dict[str, Any]:
         """
         현재 시스템 정보를 반환합니다.
@@ -566,3 +1179,38 @@ def create_ask_mode(
     )
     return ask_mode
 
+
+async def create_ask_mode_async(
+    vector_store: Optional[VectorSearchVectorStore] = None,
+    llm: Optional[VertexAI] = None,
+    embeddings: Optional[VertexAIEmbeddings] = None,
+    custom_config: Optional[Dict[str, Any]] = None,
+    logger: Optional[logging.Logger] = None,
+) -> AskMode:
+    """
+    AskMode 비동기 생성 헬퍼 함수
+    
+    create_ask_mode와 동일하지만 블로킹 초기화(Vertex AI SDK, 벡터 스토어 생성)를
+    스레드에서 실행하므로 FastAPI startup 등 이벤트 루프 안에서 사용합니다.
+    
+    Args:
+        vector_store: 사용할 벡터 스토어 객체 (None이면 config로 생성)
+        llm: VertexAI LLM 객체 (선택사항)
+        embeddings: VertexAIEmbeddings 객체 (선택사항)
+        custom_config: 사용자 정의 설정
+        logger: 로거 객체 (선택사항)
+    
+    Returns:
+        초기화된 AskMode 인스턴스
+    
+    예제:
+        ask_mode = await create_ask_mode_async(logger=logger)
+        result = await ask_mode.aprocess("응급의료기관의 종류는?")
+    """
+    return await AskMode.acreate(
+        vector_store=vector_store,
+        llm=llm,
+        embeddings=embeddings,
+        custom_config=custom_config,
+        logger=logger,
+    )
@@ -11,14 +11,24 @@ Forge Mode - MCQ 생성 모드
 최신 LangGraph 권장 방식 100% 준수
 """
 
+import asyncio
+import copy
+import json
 import logging
 import hashlib
-from typing import Any, Dict, List, Optional
+import re
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from itertools import islice
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Final, List, Optional, Tuple
+
+import numpy as np
 
 # LangChain & LangGraph
+from langchain_core.runnables import RunnableLambda
 from langchain_google_vertexai import VertexAI, VectorSearchVectorStore
 from langgraph.graph import StateGraph
-from langgraph.checkpoint.memory import MemorySaver
 
 # Config
 from config import get_retriever_config
@@ -45,16 +55,18 @@ except ImportError:
     def get_prompt_templates():
         return {
             "mcq_generation_system": "당신은 교육 전문가입니다. 주어진 교재 내용을 바탕으로 4지선다형 문제를 생성합니다.",
-            "mcq_generation_human_retriever": "다음 내용을 바탕으로 4지선다형 문제를 만들어주세요:\n\n{context}\n\n주제: {question}\n\n{instruction}\n\n{format_instructions}",
+            "mcq_generation_human_retriever": "다음 지침에 따라 4지선다형 문제를 만들어주세요:\n\n{instruction}\n\n{format_instructions}\n\n교재 내용:\n{context}\n\n주제: {question}",
         }
 
 # State & Nodes
 from State import State, create_state
 from Node.MCQ import (
     create_mcq_retrieve_documents_node,
+    select_random_topic,
     create_mcq_select_context_node,
     create_mcq_format_context_node,
     create_mcq_prepare_payload_node,
+    create_mcq_prepare_scaffold_node,
     create_mcq_generate_node,
     create_mcq_validate_node,
     create_mcq_format_output_node,
@@ -62,7 +74,292 @@ from Node.MCQ import (
 
 # Edge & Utils
 from Edge import build_mcq_workflow_edges
-from Utils import VectorSearchUtils, setup_logging
+from Utils import VectorSearchUtils, create_error_handler, get_question_hash, setup_logging
+
+from ._bounded_memsaver import DEFAULT_MAX_CHECKPOINT_THREADS, BoundedMemorySaver
+from ._workflow_cache import WorkflowCache
+
+
+# 배치 동시 실행 중 문항 중복으로 판정된 MCQ를 다시 생성하는 최대 횟수
+_MAX_DUPLICATE_RETRIES = 2
+
+
+# 워크플로우 캐시 항목에 저장하고 적중 시 인스턴스에 복원하는 속성
+# (warmup_llm 등이 노드/LLM 속성을 직접 참조하므로 캐시 적중 시에도 모두 설정)
+_SHARED_WORKFLOW_ATTRS: Final = (
+    "retrieve_documents",
+    "select_prompt",
+    "select_context",
+    "format_context",
+    "prepare_payload",
+    "prepare_scaffold",
+    "mcq_llm",
+    "generate_mcq_node",
+    "agenerate_mcq_node",
+    "validate_mcq",
+    "format_output",
+    "mcq_cache",
+    "workflow",
+    "checkpointer",
+)
+
+
+# 배치 진행 로그 구분선
+_SEP = "━" * 70
+
+# 문제 형태 추정용 패턴 (질문 문자열을 한 번만 스캔)
+_CATEGORY_RE = re.compile(r"(?P<multi>[㉠㉡])|(?P<box>보기>)|(?P<law_open>「)|(?P<law_close>」)")
+
+
+def _classify_question_category(question: str) -> str:
+    """
+    질문 텍스트로 Few-shot 카테고리(문제 형태)를 추정합니다.
+    
+    우선순위: 복수형(㉠㉡) > 보기형(<보기>) > 법률형(「」) > 상황형(200자 초과) > 단순형
+    """
+    found = {match.lastgroup for match in _CATEGORY_RE.finditer(question)}
+    if "multi" in found:
+        return "복수형"
+    if "box" in found:
+        return "보기형"
+    if "law_open" in found and "law_close" in found:
+        return "법률형"
+    if len(question) > 200:
+        return "상황형"
+    return "단순형"
+
+
+def _render_completed_row(idx: int, mcq: Dict[str, Any]) -> Tuple[str, str]:
+    """배치 진행 로그용 완료 항목 행 (요약 행, 질문 미리보기 행)을 만듭니다."""
+    part = mcq.get("selected_part", "").replace("Part 0", "P").replace(": ", " ")
+    chapter = mcq.get("selected_chapter", "").replace("Chapter ", "Ch")
+    question = mcq.get("question", "")
+    category = _classify_question_category(question)
+    return (
+        f"✓ [{idx}] {category:6s} | {part} - {chapter}",
+        f"   질문: {question[:80]}...",
+    )
+
+
+class MCQResponseCache:
+    """
+    MCQ 생성 결과 캐시 (정확 일치 + 의미 유사도)
+    
+    동일/유사한 (컨텍스트, 지침, 주제, 카테고리 가중치) 조합에 대해
+    generate_mcq 노드의 LLM 호출을 생략합니다.
+    
+    - 정확 일치: 키 텍스트의 sha256 (LRU)
+    - 의미 일치: 키 텍스트 임베딩 코사인 유사도 >= threshold
+      단, 같은 Part/Chapter이고 근거 문서 ID의 Jaccard 유사도 >= min_jaccard인 경우만
+      (유사한 질문이라도 근거 문서가 다르면 오래된 근거로 답하지 않도록)
+    - 교재 구조(topics_hierarchical)나 프롬프트(system/retriever)가 바뀌면
+      버전 태그가 달라져 기존 항목은 무시됩니다.
+    - ttl_seconds가 지난 항목은 만료됩니다.
+    - 이미 사용된 문항(used_question_hashes)은 적중으로 취급하지 않습니다.
+    - 재시도(retry_count > 0) 중에는 조회하지 않고 새로 생성합니다.
+    - 의미 일치는 semantic=False이거나 State의 allow_semantic_cache=False이면
+      건너뜁니다 (키 임베딩 호출도 생략, 정확 일치만 사용).
+    
+    배치 생성 시 노드가 여러 스레드에서 실행되므로 내부 상태는 Lock으로 보호합니다.
+    """
+    
+    def __init__(
+        self,
+        embeddings: Any = None,
+        max_size: int = 128,
+        threshold: float = 0.95,
+        ttl_seconds: Optional[float] = 3600.0,
+        min_jaccard: float = 0.5,
+        semantic: bool = True,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.embeddings = embeddings
+        self.max_size = max_size
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.min_jaccard = min_jaccard
+        self.semantic = semantic
+        self.logger = logger or logging.getLogger(__name__)
+        
+        self._lock = threading.Lock()
+        # exact_key → (저장 시각, MCQ)
+        self._exact: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # (버전, Part, Chapter, 근거 문서 ID, 임베딩, MCQ, 저장 시각)
+        self._semantic: List[
+            Tuple[str, str, str, frozenset, np.ndarray, Dict[str, Any], float]
+        ] = []
+        self.hits = {"exact": 0, "semantic": 0}
+        self.misses = 0
+    
+    @staticmethod
+    def _version_tag(state: "State") -> str:
+        structure = state.get("topics_hierarchical") or {}
+        raw = "\n".join([
+            json.dumps(structure, ensure_ascii=False, sort_keys=True),
+            state.get("system_prompt") or "",
+            state.get("retriever_prompt") or "",
+        ])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+    
+    @staticmethod
+    def _key_text(state: "State") -> str:
+        context = state.get("formatted_context", "")
+        instruction = state.get("instruction", "")
+        topic = state.get("selected_topic_query") or ""
+        weights = state.get("category_weights") or {}
+        return "\n".join([
+            f"chapter: {state.get('selected_chapter') or ''}",
+            f"topic: {topic}",
+            f"categories: {json.dumps(weights, ensure_ascii=False, sort_keys=True)}",
+            f"instruction: {instruction}",
+            f"context: {context}",
+        ])
+    
+    @staticmethod
+    def _document_ids(state: "State") -> frozenset:
+        ids = (
+            state.get("selected_document_ids")
+            or state.get("context_document_ids")
+            or []
+        )
+        return frozenset(ids)
+    
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+    
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        if self.embeddings is None:
+            return None
+        try:
+            vector = np.asarray(self.embeddings.embed_query(text), dtype=np.float32)
+        except Exception as e:
+            self.logger.warning(f"MCQ 캐시 임베딩 실패: {e}")
+            return None
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else None
+    
+    def _semantic_enabled(self, state: "State") -> bool:
+        # 요청별 설정(allow_semantic_cache)이 없으면 캐시 기본값을 따름
+        allowed = state.get("allow_semantic_cache")
+        return self.semantic if allowed is None else bool(allowed)
+    
+    def _usable(self, mcq: Dict[str, Any], state: "State") -> bool:
+        used = state.get("used_question_hashes") or []
+        return get_question_hash(mcq) not in used
+    
+    def lookup(self, state: "State") -> Tuple[Optional[Dict[str, Any]], Optional[np.ndarray]]:
+        """
+        캐시 조회
+        
+        Returns:
+            (캐시된 MCQ 복사본 또는 None, 키 임베딩 또는 None)
+        """
+        # 재시도 중이면 조회하지 않음: 직전 시도가 캐시된 문항으로 실패했을 수 있고,
+        # 같은 문항을 다시 돌려주면 재시도가 모두 같은 이유로 실패함
+        if state.get("retry_count", 0) > 0:
+            with self._lock:
+                self.misses += 1
+            return None, None
+        
+        version = self._version_tag(state)
+        key_text = self._key_text(state)
+        exact_key = hashlib.sha256(f"{version}\n{key_text}".encode("utf-8")).hexdigest()
+        now = time.monotonic()
+        
+        with self._lock:
+            entry = self._exact.get(exact_key)
+            if entry is not None and self._expired(entry[0], now):
+                del self._exact[exact_key]
+                entry = None
+            if entry is not None and self._usable(entry[1], state):
+                self._exact.move_to_end(exact_key)
+                self.hits["exact"] += 1
+                self.logger.info("✅ MCQ 캐시 적중 (정확 일치)")
+                return copy.deepcopy(entry[1]), None
+        
+        embedding = self._embed(key_text) if self._semantic_enabled(state) else None
+        if embedding is not None:
+            part = state.get("selected_part") or ""
+            chapter = state.get("selected_chapter") or ""
+            doc_ids = self._document_ids(state)
+            with self._lock:
+                self._semantic = [
+                    item for item in self._semantic if not self._expired(item[6], now)
+                ]
+                best_score, best_mcq = -1.0, None
+                for (entry_version, entry_part, entry_chapter, entry_docs,
+                     entry_emb, entry_mcq, _) in self._semantic:
+                    # 버전/범위가 다르면 후보에서 제외 (G2: 범위 일치)
+                    if (entry_version, entry_part, entry_chapter) != (version, part, chapter):
+                        continue
+                    # 근거 문서가 충분히 겹치지 않으면 제외 (G3: 근거 일치)
+                    union = doc_ids | entry_docs
+                    if union and len(doc_ids & entry_docs) / len(union) < self.min_jaccard:
+                        continue
+                    score = float(entry_emb @ embedding)
+                    if score > best_score and self._usable(entry_mcq, state):
+                        best_score, best_mcq = score, entry_mcq
+                if best_mcq is not None and best_score >= self.threshold:
+                    self.hits["semantic"] += 1
+                    self.logger.info(f"✅ MCQ 캐시 적중 (유사도: {best_score:.4f})")
+                    return copy.deepcopy(best_mcq), embedding
+        
+        with self._lock:
+            self.misses += 1
+        return None, embedding
+    
+    def store(
+        self,
+        state: "State",
+        mcq: Dict[str, Any],
+        embedding: Optional[np.ndarray] = None,
+    ) -> None:
+        """생성된 MCQ를 캐시에 저장합니다."""
+        version = self._version_tag(state)
+        key_text = self._key_text(state)
+        exact_key = hashlib.sha256(f"{version}\n{key_text}".encode("utf-8")).hexdigest()
+        if embedding is None and self._semantic_enabled(state):
+            embedding = self._embed(key_text)
+        
+        stored = copy.deepcopy(mcq)
+        now = time.monotonic()
+        with self._lock:
+            self._exact[exact_key] = (now, stored)
+            self._exact.move_to_end(exact_key)
+            while len(self._exact) > self.max_size:
+                self._exact.popitem(last=False)
+            
+            if embedding is not None:
+                self._semantic.append((
+                    version,
+                    state.get("selected_part") or "",
+                    state.get("selected_chapter") or "",
+                    self._document_ids(state),
+                    embedding,
+                    stored,
+                    now,
+                ))
+                if len(self._semantic) > self.max_size:
+                    del self._semantic[0]
+    
+    def clear(self) -> None:
+        """캐시를 비웁니다."""
+        with self._lock:
+            self._exact.clear()
+            self._semantic.clear()
+            self.hits = {"exact": 0, "semantic": 0}
+            self.misses = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계를 반환합니다."""
+        with self._lock:
+            return {
+                "exact_entries": len(self._exact),
+                "semantic_entries": len(self._semantic),
+                "exact_hits": self.hits["exact"],
+                "semantic_hits": self.hits["semantic"],
+                "misses": self.misses,
+            }
 
 
 class QuestionPoolManager:
@@ -87,12 +384,7 @@ class QuestionPoolManager:
         self.used_document_ids.update(filter(None, document_ids))
 
     def register_question(self, mcq: Dict[str, Any]) -> None:
-        digest = mcq.get("question_hash")
-        if not digest:
-            question = mcq.get("question", "")
-            options = mcq.get("options", [])
-            signature = "||".join([question.strip()] + [opt.strip() for opt in options])
-            digest = hashlib.sha256(signature.encode("utf-8")).hexdigest()
+        digest = get_question_hash(mcq)
         self.used_question_hashes.add(digest)
 
         section_ids = mcq.get("doc_section_ids") or []
@@ -118,7 +410,13 @@ class ForgeMode:
     - 전체 범위에서 랜덤 주제 선택
     - 자동 재시도 로직 (설정 가능)
     - Few-shot Learning 지원
-    - Checkpointer로 상태 저장/복원
+    - Checkpointer로 상태 저장/복원 (선택, 기본값 off)
+    
+    히스토리 규약:
+    - 생성된 MCQ 딕셔너리는 반환 후 수정하지 않는 불변 결과로 취급합니다.
+      히스토리에는 복사본이 아닌 같은 객체가 저장되며,
+      get_mcq_history도 항목을 복사하지 않고 그대로 반환합니다.
+      수정이 필요하면 호출자가 직접 복사하세요.
     
     사용 예제:
         # 1. 초기화
@@ -141,6 +439,10 @@ class ForgeMode:
         )
     """
     
+    # 컴파일된 워크플로우 캐시 (클래스 레벨, 인스턴스 간 공유, LRU로 개수 제한)
+    # key: _workflow_cache_key() → value: 노드/워크플로우 딕셔너리
+    _workflow_cache: WorkflowCache = WorkflowCache()
+    
     def __init__(
         self,
         vector_store: VectorSearchVectorStore,
@@ -161,7 +463,8 @@ class ForgeMode:
         self.logger = logger or setup_logging("Core.MCQ_Generator")
         
         # 설정
-        self.retriever_config = get_retriever_config()
+        # 설정 getter는 캐시된 딕셔너리를 공유하므로 복사 후 수정
+        self.retriever_config = dict(get_retriever_config())
         self.mcq_config = get_mcq_generation_config()
         self.mcq_types = get_mcq_types()
         # self.prompt_templates 제거 - State에서 동적으로 로드
@@ -178,14 +481,15 @@ class ForgeMode:
         self.vector_search_utils = VectorSearchUtils()
         self.pool_manager = QuestionPoolManager()
         
-        # 노드 초기화
-        self._initialize_nodes()
-        
-        # 워크플로우 빌드
-        self.workflow = self._build_workflow()
+        # 노드 초기화 및 워크플로우 빌드 (동일 구성이면 캐시된 노드/그래프 재사용)
+        self._build_workflow()
         
-        # 히스토리
-        self.mcq_history: List[Dict[str, Any]] = []
+        # 히스토리 (최근 history_max개만 유지, Part 분포는 카운터로 O(1) 관리)
+        self.mcq_history: "deque[Dict[str, Any]]" = deque(
+            maxlen=int(self.mcq_config.get("history_max", 1000))
+        )
+        self._part_counter: "Counter[str]" = Counter()
+        self._category_counter: "Counter[str]" = Counter()
         
         self.logger.info("✅ ForgeMode 초기화 완료")
     
@@ -207,21 +511,176 @@ class ForgeMode:
         
         # 나머지 노드들
         self.select_context = create_mcq_select_context_node(self.logger)
-        self.format_context = create_mcq_format_context_node(self.logger)
+        self.format_context = create_mcq_format_context_node(
+            self.logger,
+            cache_size=int(self.retriever_config.get("context_cache_size", 64)),
+        )
         self.prepare_payload = create_mcq_prepare_payload_node(self.logger)
+        self.prepare_scaffold = create_mcq_prepare_scaffold_node(self.logger)
         
         # MCQ 생성 노드 (prompt_templates 제거, State에서 읽음)
+        # JSON 모드 LLM을 사용하면 응답 파싱 실패로 인한 재시도(RAG 왕복)가 사라짐
+        mcq_llm = self.llm
+        if self.retriever_config.get("mcq_json_mode", True):
+            mcq_llm = self._with_json_mode(self.llm)
+        self.mcq_llm = mcq_llm
         self.generate_mcq_node = create_mcq_generate_node(
-            llm=self.llm,
+            llm=mcq_llm,
+            logger=self.logger,
+        )
+        # workflow.ainvoke(배치)에서는 chain.astream을 쓰는 async 노드를 사용
+        self.agenerate_mcq_node = create_mcq_generate_node(
+            llm=mcq_llm,
             logger=self.logger,
+            use_async=True,
         )
         
         self.validate_mcq = create_mcq_validate_node(self.logger)
         self.format_output = create_mcq_format_output_node(self.logger)
         
+        # MCQ 응답 캐시 (custom_config["enable_mcq_cache"]=True일 때만)
+        self.mcq_cache: Optional[MCQResponseCache] = None
+        if self.retriever_config.get("enable_mcq_cache", False):
+            self.mcq_cache = MCQResponseCache(
+                embeddings=getattr(self.vector_store, "embeddings", None),
+                max_size=int(self.retriever_config.get("mcq_cache_size", 128)),
+                threshold=float(self.retriever_config.get("mcq_cache_threshold", 0.95)),
+                ttl_seconds=self.retriever_config.get("mcq_cache_ttl", 3600.0),
+                min_jaccard=float(self.retriever_config.get("mcq_cache_min_jaccard", 0.5)),
+                semantic=bool(self.retriever_config.get("mcq_cache_semantic", True)),
+                logger=self.logger,
+            )
+            self.generate_mcq_node = self._wrap_generate_with_cache(
+                self.generate_mcq_node, self.mcq_cache
+            )
+            self.agenerate_mcq_node = self._wrap_agenerate_with_cache(
+                self.agenerate_mcq_node, self.mcq_cache
+            )
+            self.logger.info("MCQ 응답 캐시 활성화")
+            temperature = getattr(self.llm, "temperature", None)
+            if temperature:
+                self.logger.warning(
+                    f"MCQ 응답 캐시 사용 중 (temperature={temperature}): "
+                    "캐시 적중 시 이전에 생성한 문항이 재사용되어 문항 다양성이 줄어들 수 있습니다"
+                )
+        
         self.logger.info("노드 함수 초기화 완료")
     
-    def _build_workflow(self):
+    def _with_json_mode(self, llm: VertexAI) -> VertexAI:
+        """
+        Gemini JSON 모드(response_mime_type="application/json")를 켠 LLM 사본을 반환합니다.
+        
+        LLM 객체는 Ask 모드와 공유될 수 있으므로 원본은 수정하지 않습니다.
+        지원하지 않는 모델/버전이면 원본 LLM을 그대로 사용합니다.
+        """
+        model_name = str(getattr(llm, "model_name", "") or "")
+        if "gemini" not in model_name.lower():
+            return llm
+        
+        try:
+            json_llm = llm.model_copy(update={"response_mime_type": "application/json"})
+        except Exception as e:
+            self.logger.warning(f"JSON 모드 LLM 생성 실패, 기본 LLM 사용: {e}")
+            return llm
+        
+        self.logger.info("MCQ 생성 LLM JSON 모드 활성화")
+        return json_llm
+    
+    def _wrap_generate_with_cache(
+        self,
+        generate_node: Callable[["State"], dict],
+        cache: MCQResponseCache,
+    ) -> Callable[["State"], dict]:
+        """generate_mcq 노드 앞에 MCQ 응답 캐시를 둡니다."""
+        error_handler = create_error_handler(self.logger)
+        
+        def generate_mcq_cached(state: "State") -> dict:
+            cached, embedding = cache.lookup(state)
+            if cached is not None:
+                # 캐시 적중: LLM 호출 생략, 검증/출력 포맷팅은 그대로 진행
+                return error_handler.handle_success(
+                    node_name="generate_mcq",
+                    message="MCQ 캐시 사용 (LLM 호출 생략)",
+                    return_fields={"generated_mcq": cached},
+                )
+            
+            result = generate_node(state)
+            generated = result.get("generated_mcq")
+            if isinstance(generated, dict) and not result.get("error"):
+                cache.store(state, generated, embedding)
+            return result
+        
+        return generate_mcq_cached
+    
+    def _wrap_agenerate_with_cache(
+        self,
+        agenerate_node: Callable[["State"], Awaitable[dict]],
+        cache: MCQResponseCache,
+    ) -> Callable[["State"], Awaitable[dict]]:
+        """async generate_mcq 노드 앞에 MCQ 응답 캐시를 둡니다."""
+        error_handler = create_error_handler(self.logger)
+        
+        async def agenerate_mcq_cached(state: "State") -> dict:
+            # 조회 시 쿼리 임베딩(네트워크 호출)이 있으므로 스레드에서 실행
+            cached, embedding = await asyncio.to_thread(cache.lookup, state)
+            if cached is not None:
+                return error_handler.handle_success(
+                    node_name="generate_mcq",
+                    message="MCQ 캐시 사용 (LLM 호출 생략)",
+                    return_fields={"generated_mcq": cached},
+                )
+            
+            result = await agenerate_node(state)
+            generated = result.get("generated_mcq")
+            if isinstance(generated, dict) and not result.get("error"):
+                await asyncio.to_thread(cache.store, state, generated, embedding)
+            return result
+        
+        return agenerate_mcq_cached
+    
+    def _workflow_cache_key(self) -> Tuple[Any, ...]:
+        """
+        워크플로우 캐시 키 생성
+        
+        노드 클로저가 캡처하는 객체(LLM, 벡터 스토어, 로거)의 identity와
+        설정값으로 구성됩니다. 캐시 항목이 노드를 통해 이 객체들을 참조하므로
+        항목이 남아 있는 동안에는 같은 id가 다른 객체에 재사용되지 않습니다.
+        """
+        return (
+            id(self.llm),
+            id(self.vector_store),
+            id(self.logger),
+            repr(sorted(self.retriever_config.items())),
+        )
+    
+    def _build_workflow(self) -> None:
+        """
+        노드와 LangGraph 워크플로우를 초기화합니다 (클래스 레벨 캐시 사용).
+        
+        동일한 LLM/벡터 스토어/설정으로 생성된 ForgeMode 인스턴스들은
+        노드, 컴파일된 그래프, Checkpointer, MCQ 응답 캐시를 공유하므로
+        요청마다 인스턴스를 만드는 환경에서도 노드 생성과 컴파일을 반복하지 않습니다.
+        캐시는 최근 사용한 구성만 보관합니다 (WorkflowCache.max_size).
+        custom_config["share_workflow"]=False이면 항상 새로 빌드합니다.
+        """
+        share = self.retriever_config.get("share_workflow", True)
+        key = self._workflow_cache_key() if share else None
+        
+        entry = ForgeMode._workflow_cache.get(key) if share else None
+        if entry is not None:
+            for name in _SHARED_WORKFLOW_ATTRS:
+                setattr(self, name, entry[name])
+            self.logger.info("✅ 캐시된 MCQ 워크플로우 재사용")
+            return
+        
+        self._initialize_nodes()
+        self.workflow = self._compile_workflow()
+        if share:
+            ForgeMode._workflow_cache.put(
+                key, {name: getattr(self, name) for name in _SHARED_WORKFLOW_ATTRS}
+            )
+    
+    def _compile_workflow(self):
         """
         LangGraph 워크플로우 빌드 (간소화 버전)
         
@@ -236,30 +695,71 @@ class ForgeMode:
             
             # 2. 노드 추가 (명시적 정의)
             workflow.add_node("retrieve_documents", self.retrieve_documents)
+            workflow.add_node("prepare_scaffold", self.prepare_scaffold)
             workflow.add_node("select_prompt", self.select_prompt)
             workflow.add_node("select_context_chunk", self.select_context)
             workflow.add_node("format_context", self.format_context)
             workflow.add_node("prepare_generation_payload", self.prepare_payload)
-            workflow.add_node("generate_mcq", self.generate_mcq_node)
+            # invoke에서는 동기 노드, ainvoke에서는 async 노드(chain.astream)가 실행됨
+            workflow.add_node(
+                "generate_mcq",
+                RunnableLambda(
+                    self.generate_mcq_node,
+                    afunc=self.agenerate_mcq_node,
+                    name="generate_mcq",
+                ),
+            )
             workflow.add_node("validate_mcq", self.validate_mcq)
             workflow.add_node("format_output", self.format_output)
             
             # 3. 엣지 추가 (Edge 모듈에서 관리)
             build_mcq_workflow_edges(workflow)
             
-            # 4. Checkpointer 생성 (상태 저장/복원 지원)
-            checkpointer = MemorySaver()
+            # 4. Checkpointer 생성 (checkpointer 설정에 따름)
+            #    - "none": 체크포인트 저장 안 함 (기본값, 한 번 실행하고 끝나므로)
+            #    - "memory": 디버깅용 상태 조회가 필요할 때 (BoundedMemorySaver)
+            checkpointer_mode = self.retriever_config.get("checkpointer", "none")
+            if checkpointer_mode == "memory":
+                self.checkpointer = BoundedMemorySaver(
+                    max_threads=int(
+                        self.retriever_config.get(
+                            "max_checkpoint_threads", DEFAULT_MAX_CHECKPOINT_THREADS
+                        )
+                    )
+                )
+            elif checkpointer_mode == "none":
+                self.checkpointer = None
+            else:
+                raise ValueError(f"지원하지 않는 checkpointer: {checkpointer_mode}")
             
-            # 5. 워크플로우 컴파일 (Checkpointer 포함)
-            compiled_workflow = workflow.compile(checkpointer=checkpointer)
+            # 5. 워크플로우 컴파일
+            compiled_workflow = workflow.compile(checkpointer=self.checkpointer)
             
-            self.logger.info("✅ MCQ 워크플로우 빌드 완료 (간소화 버전, Checkpointer 활성화)")
+            self.logger.info(
+                f"✅ MCQ 워크플로우 빌드 완료 (간소화 버전, checkpointer={checkpointer_mode})"
+            )
             return compiled_workflow
             
         except Exception as e:
             self.logger.error(f"워크플로우 빌드 실패: {e}")
             raise RuntimeError(f"워크플로우 빌드 실패: {e}")
     
+    def _make_config(self, thread_id: str) -> Dict[str, Any]:
+        """
+        워크플로우 실행 config 생성
+        
+        thread_id는 Checkpointer가 있을 때만 필요합니다.
+        """
+        config: Dict[str, Any] = {"recursion_limit": 50}  # 재시도를 고려하여 충분히 높게 설정
+        if self.checkpointer is not None:
+            config["configurable"] = {"thread_id": thread_id}
+        return config
+    
+    def _release_thread(self, thread_id: str) -> None:
+        """실행이 끝난 thread의 체크포인트를 삭제합니다 (재개하지 않으므로)."""
+        if isinstance(self.checkpointer, BoundedMemorySaver):
+            self.checkpointer.release(thread_id)
+    
     # ==================== 공개 메서드 ====================
     
     def generate_mcq(
@@ -273,6 +773,7 @@ class ForgeMode:
         question_type_counter: Optional[Dict[str, int]] = None,
         time_counter: Optional[Dict[str, int]] = None,
         logic_counter: Optional[Dict[str, int]] = None,
+        allow_semantic_cache: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """
         MCQ 생성 (주제 기반 또는 랜덤)
@@ -288,6 +789,8 @@ class ForgeMode:
             category_weights: 카테고리별 가중치 (선택사항)
                 예: {"SIMPLE": 0.3, "CASE_BASED": 0.4, "IMAGE_BASED": 0.3}
                 None이면 기본값 사용
+            allow_semantic_cache: MCQ 응답 캐시의 의미 유사도 적중 허용 여부 (선택사항)
+                None이면 캐시 설정(mcq_cache_semantic)을 따름
         
         Returns:
             생성된 MCQ (메타데이터 포함):
@@ -352,6 +855,7 @@ class ForgeMode:
                 category_examples=category_examples,
                 category_weights=final_category_weights,
                 max_few_shot_examples=max_few_shot,
+                few_shot_buckets=self.mcq_config.get("few_shot_buckets", 0),
                 max_retries=max_retries,
                 max_context_docs=self.max_context_docs,
                 used_section_ids=pool_snapshot["used_section_ids"],
@@ -361,13 +865,11 @@ class ForgeMode:
                 question_type_counter=question_type_counter,  # 질문 형식 카운터 전달
                 time_counter=time_counter,  # 시간대 카운터 전달
                 logic_counter=logic_counter,  # 논리(5H5T) 카운터 전달
+                allow_semantic_cache=allow_semantic_cache,
             )
             
             # 워크플로우 실행
-            config = {
-                "configurable": {"thread_id": "mcq_generation"},
-                "recursion_limit": 50  # 재시도를 고려하여 충분히 높게 설정
-            }
+            config = self._make_config("mcq_generation")
             final_state = self.workflow.invoke(initial_state, config)
             
             # 결과 확인
@@ -375,9 +877,9 @@ class ForgeMode:
                 mcq = final_state["final_mcq"]
                 
                 # 히스토리에 추가
-                self.mcq_history.append({
+                self._append_history({
                     "timestamp": mcq["timestamp"],
-                    "mcq": mcq.copy(),
+                    "mcq": mcq,  # 복사하지 않음 (클래스 docstring의 불변 규약 참고)
                     "part": mcq["selected_part"],
                     "chapter": mcq["selected_chapter"],
                     "available_chapters": final_state.get("available_chapters", []),
@@ -399,7 +901,7 @@ class ForgeMode:
             self.logger.error(f"❌ MCQ 생성 실패: {e}", exc_info=True)
             raise RuntimeError(f"MCQ 생성 실패: {e}") from e
     
-    def generate_mcq_batch(
+    async def generate_mcq_batch_async(
         self,
         topics_hierarchical: Dict[str, List[str]],
         topics_nested: Optional[Dict[str, Dict[str, Any]]] = None,
@@ -407,7 +909,9 @@ class ForgeMode:
         max_retries: int = 6,
     ) -> List[Dict[str, Any]]:
         """
-        MCQ 배치 생성 (랜덤 주제, 중복 방지)
+        MCQ 배치 생성 (비동기, 랜덤 주제, 중복 방지)
+        
+        stream_mcq_batch의 결과를 모두 모아 리스트로 반환합니다.
         
         Args:
             topics_hierarchical: 전체 교재 구조
@@ -416,157 +920,363 @@ class ForgeMode:
             max_retries: 각 MCQ당 최대 재시도 횟수
         
         Returns:
-            생성된 MCQ 리스트 (각각 랜덤 주제로 생성, 중복 최소화)
+            생성된 MCQ 리스트 (요청 순서가 아닌 완료 순서, 실패/중복 항목 제외)
         
         예제:
-            >>> # 전체 범위에서 랜덤하게 10개 생성 (중복 방지)
-            >>> mcqs = generator.generate_mcq_batch(
+            >>> mcqs = await generator.generate_mcq_batch_async(
             ...     topics_hierarchical=textbook_structure,
             ...     count=10
             ... )
-            >>> for i, mcq in enumerate(mcqs, 1):
-            ...     print(f"{i}. [{mcq['selected_part']}] {mcq['question']}")
+        """
+        return [
+            mcq
+            async for mcq in self.stream_mcq_batch(
+                topics_hierarchical=topics_hierarchical,
+                topics_nested=topics_nested,
+                count=count,
+                max_retries=max_retries,
+            )
+        ]
+    
+    async def stream_mcq_batch(
+        self,
+        topics_hierarchical: Dict[str, List[str]],
+        topics_nested: Optional[Dict[str, Dict[str, Any]]] = None,
+        count: int = 5,
+        max_retries: int = 6,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        MCQ 배치 생성 스트림 (완료되는 대로 하나씩 반환)
+        
+        각 MCQ는 서로 독립적이므로 workflow.ainvoke를 동시에 실행합니다.
+        동시 실행 수는 custom_config["max_concurrency"] (기본값: 4)로 제한하여
+        Vertex AI QPS를 넘지 않도록 합니다.
+        
+        중복 방지(recent_chapters, 사용된 섹션/문서/문항 풀)는 각 작업이
+        실행 슬롯을 얻는 시점의 스냅샷을 사용하고, 완료되는 대로 갱신합니다.
+        동시에 시작한 작업끼리는 서로의 결과를 보지 못하므로, 완료 시점에 문항 해시가
+        이미 사용된 항목은 최신 풀로 다시 생성합니다 (최대 _MAX_DUPLICATE_RETRIES회,
+        그래도 중복이면 제외).
+        
+        custom_config["batch_prefetch"] (기본값: True)이면 배치 전체의 주제를 먼저 뽑아
+        벡터 검색을 한 번에 수행하고, 각 MCQ의 첫 검색에 그 결과를 사용합니다.
+        
+        Args:
+            topics_hierarchical: 전체 교재 구조
+            topics_nested: 사용되지 않음 (하위 호환성 유지)
+            count: 생성할 MCQ 개수
+            max_retries: 각 MCQ당 최대 재시도 횟수
+        
+        소비자는 나머지 MCQ가 생성되는 동안 이미 완료된 MCQ를 바로 처리할 수 있습니다.
+        스트림을 중간에 닫으면 아직 끝나지 않은 작업은 취소됩니다.
+        
+        Yields:
+            생성된 MCQ (요청 인덱스 순서가 아닌 완료 순서, 실패/중복 항목 제외)
+        
+        예제:
+            >>> async for mcq in generator.stream_mcq_batch(
+            ...     topics_hierarchical=textbook_structure,
+            ...     count=10
+            ... ):
+            ...     print(mcq["question"])
         """
         mcqs = []
+        completed_lines: List[Tuple[str, str]] = []  # 렌더링된 완료 항목 로그 (요약 행, 질문 미리보기 행)
         recent_chapters = []  # 최근 생성된 Chapter 추적
         max_recent = 3  # 최근 3개 Chapter는 중복 방지
         
+        # 반복마다 동일한 초기 상태 인자는 한 번만 구성 (few-shot 리스트 등은 참조 공유)
+        mcq_type = self.mcq_types.get("MCQ_GENERAL", {})
+        base_state_kwargs = {
+            "execution_mode": "forge",
+            "topics_nested": topics_nested,
+            "topics_hierarchical": topics_hierarchical,
+            "instruction": mcq_type.get("instruction", ""),
+            "few_shot_examples": mcq_type.get("few_shot_examples", []),
+            "category_examples": mcq_type.get("category_examples", {}),
+            "category_weights": self.mcq_config.get("category_weights", {}),
+            "max_few_shot_examples": self.mcq_config.get("few_shot_max_examples", 5),
+            "few_shot_buckets": self.mcq_config.get("few_shot_buckets", 0),
+            "max_retries": max_retries,
+            "max_context_docs": self.max_context_docs,
+        }
+        
+        concurrency = max(1, int(self.retriever_config.get("max_concurrency", 4)))
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        # 배치 전체의 주제를 먼저 뽑고 벡터 검색을 한 번에 수행
+        # (각 MCQ의 첫 검색에만 사용, 재시도는 노드에서 새로 검색)
+        prefetched: List[Optional[Dict[str, Any]]] = [None] * count
+        if self.retriever_config.get("batch_prefetch", True) and count > 1:
+            prefetched = await asyncio.to_thread(
+                self._prefetch_retrievals, topics_hierarchical, count, max_recent
+            )
+        
         # 진행 상황 헤더 출력
-        self.logger.info("━" * 70)
-        self.logger.info(f"MCQ 생성 진행 중... (0/{count})")
-        self.logger.info("━" * 70)
-        
-        for i in range(count):
-            try:
-                # Few-shot 예시 가져오기
-                mcq_type = self.mcq_types.get("MCQ_GENERAL", {})
-                few_shot_examples = mcq_type.get("few_shot_examples", [])
-                category_examples = mcq_type.get("category_examples", {})
-                instruction = mcq_type.get("instruction", "")
-                max_few_shot = self.mcq_config.get("few_shot_max_examples", 5)
-                category_weights = self.mcq_config.get("category_weights", {})
-                
-                # 초기 상태 생성 (recent_chapters 포함)
+        self.logger.info(_SEP)
+        self.logger.info("MCQ 생성 진행 중... (0/%d, 동시 실행: %d)", count, concurrency)
+        self.logger.info(_SEP)
+        
+        async def run_one(
+            i: int, precomputed_retrieval: Optional[Dict[str, Any]]
+        ) -> Dict[str, Any]:
+            async with semaphore:
+                # 초기 상태 생성 (슬롯 획득 시점의 중복 방지 정보 반영)
                 pool_snapshot = self.pool_manager.snapshot()
-
+                
                 initial_state = create_state(
-                    execution_mode="forge",
-                    topics_nested=topics_nested,
-                    topics_hierarchical=topics_hierarchical,
-                    instruction=instruction,
-                    few_shot_examples=few_shot_examples,
-                    category_examples=category_examples,
-                    category_weights=category_weights,
-                    max_few_shot_examples=max_few_shot,
-                    max_retries=max_retries,
-                    max_context_docs=self.max_context_docs,
-                    recent_chapters=recent_chapters,  # 중복 방지용
+                    **base_state_kwargs,
+                    recent_chapters=list(recent_chapters),  # 중복 방지용
                     used_section_ids=pool_snapshot["used_section_ids"],
                     used_document_ids=pool_snapshot["used_document_ids"],
                     used_question_hashes=pool_snapshot["used_question_hashes"],
+                    precomputed_retrieval=precomputed_retrieval,
                 )
                 
                 # 워크플로우 실행
-                config = {
-                    "configurable": {"thread_id": f"mcq_batch_{i}"},
-                    "recursion_limit": 50
-                }
-                final_state = self.workflow.invoke(initial_state, config)
+                thread_id = f"mcq_batch_{i}"
+                try:
+                    final_state = await self.workflow.ainvoke(
+                        initial_state, self._make_config(thread_id)
+                    )
+                except Exception as e:
+                    raise RuntimeError(f"MCQ {i+1}/{count} 생성 실패: {e}") from e
+                finally:
+                    self._release_thread(thread_id)
+                
+                if not final_state.get("final_mcq"):
+                    error_msg = final_state.get("error", "알 수 없는 오류")
+                    raise RuntimeError(f"MCQ {i+1}/{count} 생성 실패: {error_msg}")
                 
-                # 결과 확인
-                if final_state.get("final_mcq"):
+                return final_state
+        
+        # 실행 중인 작업 → MCQ 인덱스 (중복으로 다시 생성하는 작업도 같은 인덱스)
+        tasks: Dict["asyncio.Future[Dict[str, Any]]", int] = {
+            asyncio.ensure_future(run_one(i, prefetched[i])): i for i in range(count)
+        }
+        duplicate_retries = [0] * count
+        
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    i = tasks.pop(future)
+                    try:
+                        final_state = future.result()
+                    except Exception as e:
+                        self.logger.error(str(e))
+                        self.logger.warning(f"✗ 생성 실패: {str(e)[:50]}...")
+                        # 실패해도 계속 진행
+                        continue
+                    
                     mcq = final_state["final_mcq"]
-                    mcqs.append(mcq)
                     selected_section_ids = final_state.get("selected_section_ids", [])
                     selected_document_ids = final_state.get("selected_document_ids", [])
+                    
+                    # 같은 스냅샷으로 동시에 시작한 작업끼리는 서로의 문항을 보지 못하므로
+                    # 완료 시점의 풀 기준으로 문항 중복을 다시 확인
+                    if get_question_hash(mcq) in self.pool_manager.used_question_hashes:
+                        if duplicate_retries[i] < _MAX_DUPLICATE_RETRIES:
+                            duplicate_retries[i] += 1
+                            self.logger.warning(
+                                f"MCQ {i+1}/{count} 문항 중복, 최신 풀로 다시 생성 "
+                                f"({duplicate_retries[i]}/{_MAX_DUPLICATE_RETRIES})"
+                            )
+                            # 미리 검색한 문서는 같은 섹션을 다시 고르므로 노드에서 새로 검색
+                            tasks[asyncio.ensure_future(run_one(i, None))] = i
+                        else:
+                            self.logger.warning(f"✗ MCQ {i+1}/{count} 문항 중복, 제외")
+                        continue
+                    
+                    mcqs.append(mcq)
                     self.pool_manager.register_sections(selected_section_ids)
                     self.pool_manager.register_documents(selected_document_ids)
                     self.pool_manager.register_question(mcq)
                     
                     # 생성된 Chapter 기록 (최근 N개만 유지)
                     chapter = mcq.get("selected_chapter", "")
-                    part = mcq.get("selected_part", "")
-                    
-                    # Part 이름 간소화
-                    part_short = part.replace("Part 0", "P").replace(": ", " ")
-                    chapter_short = chapter.replace("Chapter ", "Ch")
-                    
-                    # Few-shot 카테고리 추정 (문제 형태)
-                    question = mcq.get("question", "")
-                    if "㉠" in question or "㉡" in question:
-                        category = "복수형"
-                    elif "<보기>" in question or "보기>" in question:
-                        category = "보기형"
-                    elif "「" in question and "」" in question:
-                        category = "법률형"
-                    elif len(question) > 200:
-                        category = "상황형"
-                    else:
-                        category = "단순형"
-                    
                     if chapter:
                         recent_chapters.append(chapter)
                         if len(recent_chapters) > max_recent:
                             recent_chapters.pop(0)  # 가장 오래된 것 제거
                     
+                    # 완료 항목 로그 행은 MCQ당 한 번만 렌더링 (카테고리 추정 포함)
+                    # INFO가 꺼져 있으면 렌더링과 출력 모두 생략
+                    if self.logger.isEnabledFor(logging.INFO):
+                        completed_lines.append(_render_completed_row(len(mcqs), mcq))
+                    
                     # 진행 상황 로깅
-                    self.logger.info("━" * 70)
-                    self.logger.info(f"MCQ 생성 진행 중... ({len(mcqs)}/{count})")
-                    self.logger.info("━" * 70)
+                    self.logger.info(_SEP)
+                    self.logger.info("MCQ 생성 진행 중... (%d/%d)", len(mcqs), count)
+                    self.logger.info(_SEP)
                     
                     # 완료된 항목 로깅
-                    for idx, completed_mcq in enumerate(mcqs, 1):
-                        c_part = completed_mcq.get("selected_part", "").replace("Part 0", "P").replace(": ", " ")
-                        c_chapter = completed_mcq.get("selected_chapter", "").replace("Chapter ", "Ch")
-                        
-                        # 카테고리 추정
-                        c_q = completed_mcq.get("question", "")
-                        if "㉠" in c_q or "㉡" in c_q:
-                            c_cat = "복수형"
-                        elif "<보기>" in c_q or "보기>" in c_q:
-                            c_cat = "보기형"
-                        elif "「" in c_q and "」" in c_q:
-                            c_cat = "법률형"
-                        elif len(c_q) > 200:
-                            c_cat = "상황형"
-                        else:
-                            c_cat = "단순형"
-                        
-                        self.logger.info(f"✓ [{idx}] {c_cat:6s} | {c_part} - {c_chapter}")
-                        self.logger.debug(f"   질문: {c_q[:80]}...")
-                    
-                    # 진행 중 표시
-                    if len(mcqs) < count:
-                        self.logger.info(f"□ [{len(mcqs)+1}] 생성 중...")
+                    if self.logger.isEnabledFor(logging.INFO):
+                        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+                        for row, preview in completed_lines:
+                            self.logger.info(row)
+                            if debug_enabled:
+                                self.logger.debug(preview)
                     
-                else:
-                    error_msg = final_state.get("error", "알 수 없는 오류")
-                    raise RuntimeError(f"MCQ 생성 실패: {error_msg}")
-                    
-            except Exception as e:
-                self.logger.error(f"MCQ {i+1}/{count} 생성 실패: {e}")
-                self.logger.warning(f"✗ [{i+1}] 생성 실패: {str(e)[:50]}...")
-                # 실패해도 계속 진행
+                    yield mcq
+        finally:
+            # 소비자가 스트림을 중간에 닫은 경우 남은 작업 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
         
         # 완료 메시지
-        self.logger.info("━" * 70)
-        self.logger.info(f"✅ 배치 MCQ 생성 완료: {len(mcqs)}/{count}개 성공")
-        self.logger.info("━" * 70)
+        self.logger.info(_SEP)
+        self.logger.info("✅ 배치 MCQ 생성 완료: %d/%d개 성공", len(mcqs), count)
+        self.logger.info(_SEP)
+    
+    def _prefetch_retrievals(
+        self,
+        topics_hierarchical: Dict[str, List[str]],
+        count: int,
+        max_recent: int,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        배치용 주제를 미리 선택하고 한 번에 검색합니다.
         
-        return mcqs
+        주제 선택은 retrieve_documents 노드와 같은 규칙(select_random_topic)을 따르며,
+        앞서 뽑은 Chapter를 최근 Chapter로 간주하여 배치 내 중복을 줄입니다.
+        실패하면 각 MCQ가 노드에서 개별 검색하도록 None 리스트를 반환합니다.
+        """
+        try:
+            topics = []
+            recent: "deque[str]" = deque(maxlen=max_recent)
+            for _ in range(count):
+                part, chapter, query = select_random_topic(
+                    topics_hierarchical, list(recent), self.mcq_config, self.logger
+                )
+                topics.append((part, chapter, query))
+                recent.append(chapter)
+            
+            results = self.vector_search_utils.search_similar_documents_batch(
+                self.vector_store,
+                [query for _, _, query in topics],
+                k=self.retriever_config.get("initial_k", 10),
+                logger=self.logger,
+            )
+        except Exception as e:
+            self.logger.warning(f"배치 사전 검색 실패, 개별 검색으로 진행: {e}")
+            return [None] * count
+        
+        return [
+            {
+                "selected_part": part,
+                "selected_chapter": chapter,
+                "query": query,
+                "documents": documents,
+            }
+            for (part, chapter, query), documents in zip(topics, results)
+        ]
     
-    def get_mcq_history(self) -> List[Dict[str, Any]]:
+    def generate_mcq_batch(
+        self,
+        topics_hierarchical: Dict[str, List[str]],
+        topics_nested: Optional[Dict[str, Dict[str, Any]]] = None,
+        count: int = 5,
+        max_retries: int = 6,
+    ) -> List[Dict[str, Any]]:
+        """
+        MCQ 배치 생성 (동기 래퍼)
+        
+        generate_mcq_batch_async를 asyncio.run으로 실행합니다.
+        이미 이벤트 루프가 실행 중인 환경에서는 generate_mcq_batch_async를 직접 await하세요.
+        
+        Args:
+            topics_hierarchical: 전체 교재 구조
+            topics_nested: 사용되지 않음 (하위 호환성 유지)
+            count: 생성할 MCQ 개수
+            max_retries: 각 MCQ당 최대 재시도 횟수
+        
+        Returns:
+            생성된 MCQ 리스트 (각각 랜덤 주제로 생성, 중복 최소화)
+        
+        예제:
+            >>> # 전체 범위에서 랜덤하게 10개 생성 (중복 방지)
+            >>> mcqs = generator.generate_mcq_batch(
+            ...     topics_hierarchical=textbook_structure,
+            ...     count=10
+            ... )
+            >>> for i, mcq in enumerate(mcqs, 1):
+            ...     print(f"{i}. [{mcq['selected_part']}] {mcq['question']}")
+        """
+        return asyncio.run(
+            self.generate_mcq_batch_async(
+                topics_hierarchical=topics_hierarchical,
+                topics_nested=topics_nested,
+                count=count,
+                max_retries=max_retries,
+            )
+        )
+    
+    def warmup_llm(self) -> bool:
+        """
+        MCQ 생성 LLM 연결을 미리 준비합니다.
+        
+        첫 생성 요청이 인증 토큰 갱신과 TLS/gRPC 채널 수립 비용(수백 ms)을
+        떠안지 않도록 서버 시작 시 호출합니다. 생성 호출 대신 토큰 수 계산
+        API를 사용하므로 출력 토큰 비용이 들지 않습니다.
+        JSON 모드 사본은 원본과 같은 클라이언트를 공유하므로 한 번이면 충분합니다.
+        
+        Returns:
+            bool: 준비 성공 여부 (실패해도 첫 요청에서 정상적으로 연결됨)
+        """
+        try:
+            self.mcq_llm.get_num_tokens("warmup")
+        except Exception as e:
+            self.logger.warning(f"MCQ LLM 연결 준비 실패 (첫 요청에서 연결): {e}")
+            return False
+        self.logger.info("MCQ LLM 연결 준비 완료")
+        return True
+    
+    def _append_history(self, entry: Dict[str, Any]) -> None:
+        """
+        히스토리에 항목을 추가하고 Part/문제 형태 카운터를 갱신합니다 (가득 차면 가장 오래된 항목 제거).
+        
+        문제 형태는 추가 시점에 한 번만 추정하여 항목의 "category"에 저장하므로
+        통계 조회 시 질문 텍스트를 다시 스캔하지 않습니다.
+        """
+        if "category" not in entry:
+            entry["category"] = _classify_question_category(
+                entry.get("mcq", {}).get("question", "")
+            )
+        if self.mcq_history.maxlen is not None and len(self.mcq_history) == self.mcq_history.maxlen:
+            evicted = self.mcq_history[0]
+            for counter, key in (
+                (self._part_counter, evicted.get("part", "Unknown")),
+                (self._category_counter, evicted["category"]),
+            ):
+                counter[key] -= 1
+                if counter[key] <= 0:
+                    del counter[key]
+        self.mcq_history.append(entry)
+        self._part_counter[entry.get("part", "Unknown")] += 1
+        self._category_counter[entry["category"]] += 1
+    
+    def get_mcq_history(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Dict[str, Any]]:
         """
         MCQ 생성 히스토리 반환
         
+        Args:
+            limit: 반환할 최대 항목 수 (None이면 전체)
+            offset: 건너뛸 항목 수 (오래된 항목 기준)
+        
         Returns:
-            MCQ 생성 히스토리 리스트 (최신순)
+            MCQ 생성 히스토리 리스트 (오래된 순, 항목은 복사하지 않으므로 수정 금지)
         
         예제:
             >>> history = generator.get_mcq_history()
             >>> print(f"총 {len(history)}개의 MCQ 생성됨")
+            >>> page = generator.get_mcq_history(limit=20, offset=40)
         """
-        return self.mcq_history.copy()
+        stop = None if limit is None else offset + limit
+        return list(islice(self.mcq_history, offset, stop))
     
     def clear_mcq_history(self) -> None:
         """
@@ -578,6 +1288,8 @@ class ForgeMode:
         """
         count = len(self.mcq_history)
         self.mcq_history.clear()
+        self._part_counter.clear()
+        self._category_counter.clear()
         self.logger.info(f"MCQ 히스토리 초기화 완료 (총 {count}개 항목 삭제)")
     
     def get_mcq_statistics(self) -> Dict[str, Any]:
@@ -586,8 +1298,9 @@ class ForgeMode:
         
         Returns:
             통계 정보 딕셔너리:
-            - total_count: 총 생성된 MCQ 개수
+            - total_count: 총 생성된 MCQ 개수 (보관 중인 히스토리 기준)
             - part_distribution: Part별 분포
+            - category_distribution: 문제 형태별 분포 (복수형/보기형/법률형/상황형/단순형)
             - latest_generation: 최근 생성 시각
         
         예제:
@@ -595,22 +1308,14 @@ class ForgeMode:
             >>> print(f"총 {stats['total_count']}개 생성됨")
             >>> print(f"Part 분포: {stats['part_distribution']}")
         """
-        total_count = len(self.mcq_history)
-        
-        # Part별 분포 계산
-        part_distribution = {}
-        for entry in self.mcq_history:
-            part = entry.get("part", "Unknown")
-            part_distribution[part] = part_distribution.get(part, 0) + 1
-        
-        # 최근 생성 시각
         latest_generation = None
         if self.mcq_history:
             latest_generation = self.mcq_history[-1]["timestamp"]
         
         return {
-            "total_count": total_count,
-            "part_distribution": part_distribution,
+            "total_count": len(self.mcq_history),
+            "part_distribution": dict(self._part_counter),
+            "category_distribution": dict(self._category_counter),
             "latest_generation": latest_generation,
         }
 
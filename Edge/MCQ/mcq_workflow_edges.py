@@ -4,7 +4,7 @@ MCQ 워크플로우 엣지 정의 (중첩 선택 지원)
 MCQ 생성 워크플로우의 모든 노드 간 연결을 관리합니다.
 """
 
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, List, Literal, Tuple, Union
 from langgraph.graph import END, START
 from State import State
 
@@ -14,6 +14,46 @@ if TYPE_CHECKING:
 
 # ==================== 조건 함수 ====================
 
+# 라우팅은 몇 개의 불리언 조합으로 결정되므로 조건문 대신 테이블 조회로 처리합니다.
+
+# (is_valid, should_retry, retry_count < max_retries) → 다음 단계
+_VALIDATION_ROUTE = {
+    (True, True, True): "format_output",
+    (True, True, False): "format_output",
+    (True, False, True): "format_output",
+    (True, False, False): "format_output",
+    (False, False, True): "end",
+    (False, False, False): "end",
+    (False, True, True): "retry_retrieve",
+    (False, True, False): "end",
+}
+
+# (retry_count < max_retries, error and should_retry) → 다음 단계
+_RETRIEVE_ROUTE = {
+    (True, True): "retry",
+    (True, False): "select_context",
+    (False, True): "select_context",
+    (False, False): "select_context",
+}
+
+# (retry_count < max_retries, error and should_retry) → 다음 단계
+_CONTEXT_SELECTION_ROUTE = {
+    (True, True): "retry_retrieve",
+    (True, False): "format_context",
+    (False, True): "format_context",
+    (False, False): "format_context",
+}
+
+
+def _retry_key(state: State) -> Tuple[bool, bool]:
+    """(재시도 여유 있음, 재시도 요청된 에러 있음) 키를 만듭니다."""
+    retry_count = state.get("retry_count", 0)
+    max_retries = state.get("max_retries", 6)
+    return (
+        retry_count < max_retries,
+        bool(state.get("error")) and bool(state.get("should_retry")),
+    )
+
 
 def should_retry_after_validation(
     state: State
@@ -34,22 +74,11 @@ def should_retry_after_validation(
         "format_output": 성공 (다음 노드로)
         "end": 최대 재시도 초과
     """
-    if state["is_valid"]:
-        return "format_output"
-    
-    if not state["should_retry"]:
-        return "end"
-    
     retry_count = state.get("retry_count", 0)
     max_retries = state.get("max_retries", 6)
-    
-    # 재시도 전략
-    if retry_count < max_retries:
-        # retrieve로 재시도
-        return "retry_retrieve"
-    else:
-        # 최대 재시도 초과: 종료
-        return "end"
+    return _VALIDATION_ROUTE[
+        (bool(state["is_valid"]), bool(state["should_retry"]), retry_count < max_retries)
+    ]
 
 
 def should_retry_after_retrieve(
@@ -58,39 +87,38 @@ def should_retry_after_retrieve(
     """
     문서 검색 후 재시도 여부 결정
     
+    재시도 횟수를 초과하면 에러가 있어도 강제로 진행합니다 (무한 루프 방지).
+    
     Args:
         state: State
     
     Returns:
-        "format_context": 검색 성공
+        "select_context": 검색 성공 (또는 재시도 횟수 초과)
         "retry": 검색 실패, 재시도
     """
-    # retry_count 확인 추가 (무한 루프 방지)
-    retry_count = state.get("retry_count", 0)
-    max_retries = state.get("max_retries", 6)
-    
-    # 재시도 횟수 초과 시 강제로 진행
-    if retry_count >= max_retries:
-        return "select_context"
-    
-    if state.get("error") and state.get("should_retry"):
-        return "retry"
-    
-    return "select_context"
+    return _RETRIEVE_ROUTE[_retry_key(state)]
 
 
 def should_retry_after_context_selection(
     state: State,
 ) -> Literal["format_context", "retry_retrieve"]:
     """컨텍스트 선택 이후 흐름 결정"""
+    return _CONTEXT_SELECTION_ROUTE[_retry_key(state)]
 
-    retry_count = state.get("retry_count", 0)
-    max_retries = state.get("max_retries", 6)
 
-    if state.get("error") and state.get("should_retry") and retry_count < max_retries:
-        return "retry_retrieve"
+def _fan_out_on_retry(
+    state: State,
+) -> Union[str, List[str]]:
+    """
+    검증 후 재시도 시 retrieve_documents와 prepare_scaffold를 함께 다시 실행
 
-    return "format_context"
+    prepare_generation_payload는 두 노드의 결과를 모두 기다리므로
+    재시도 때도 Few-shot 블록을 새로 준비해야 합류가 이루어집니다.
+    """
+    route = should_retry_after_validation(state)
+    if route == "retry_retrieve":
+        return ["retry_retrieve", "retry_scaffold"]
+    return route
 
 
 # ==================== 엣지 빌더 ====================
@@ -102,23 +130,24 @@ def build_mcq_workflow_edges(workflow: "StateGraph") -> None:
     
     워크플로우 구조:
         START 
-          ↓
+          ↓ (병렬 실행)
         retrieve_documents (문서 검색, Part/Chapter 결정)
+        ∥ prepare_scaffold (Few-shot 예시 블록 준비)
           ↓ [조건부]
         select_prompt (범위별 프롬프트 동적 로드)
           ↓
         select_context_chunk (문서/섹션 선택)
           ↓ [조건부]
         format_context (컨텍스트 포맷팅)
-          ↓
-        prepare_generation_payload (LLM 페이로드 준비)
+          ↓ (prepare_scaffold와 합류)
+        prepare_generation_payload (생성 입력 검증)
           ↓
         generate_mcq (MCQ 생성)
           ↓
         validate_mcq (유효성 검증)
           ↓ [조건부]
           - 유효 → format_output
-          - 재시도 → retrieve_documents
+          - 재시도 → retrieve_documents ∥ prepare_scaffold
           - 최대 재시도 초과 → END
           ↓
         format_output (출력 포맷팅)
@@ -136,8 +165,10 @@ def build_mcq_workflow_edges(workflow: "StateGraph") -> None:
         
         build_mcq_workflow_edges(workflow)  # 엣지 자동 구성
     """
-    # 1. 시작 엣지 - 바로 retrieve_documents로
+    # 1. 시작 엣지 - 문서 검색(I/O)과 Few-shot 블록 준비(CPU)를 병렬로
+    #    두 노드는 서로 다른 State 필드만 쓰므로 같은 단계에서 충돌하지 않음
     workflow.add_edge(START, "retrieve_documents")
+    workflow.add_edge(START, "prepare_scaffold")
     
     # 2. 조건부 엣지: 문서 검색 후 → 프롬프트 선택 또는 재시도
     workflow.add_conditional_edges(
@@ -162,17 +193,19 @@ def build_mcq_workflow_edges(workflow: "StateGraph") -> None:
     )
     
     # 3. MCQ 생성 흐름 (선형)
-    workflow.add_edge("format_context", "prepare_generation_payload")
+    #    prepare_generation_payload는 format_context와 prepare_scaffold가 모두 끝나야 실행
+    workflow.add_edge(["format_context", "prepare_scaffold"], "prepare_generation_payload")
     workflow.add_edge("prepare_generation_payload", "generate_mcq")
     workflow.add_edge("generate_mcq", "validate_mcq")
     
     # 4. 조건부 엣지: 유효성 검증 후
     workflow.add_conditional_edges(
         "validate_mcq",
-        should_retry_after_validation,
+        _fan_out_on_retry,
         {
             "format_output": "format_output",        # 유효 → 다음
             "retry_retrieve": "retrieve_documents",  # 재시도 → retrieve
+            "retry_scaffold": "prepare_scaffold",    # 재시도 → Few-shot 블록 재구성
             "end": END,                              # 최대 재시도 초과 → 종료
         }
     )
@@ -197,11 +230,12 @@ def get_mcq_workflow_description() -> str:
 MCQ 생성 워크플로우 구조 (간소화 버전 - 랜덤 주제):
 
 START
-  ↓
+  ↓ (병렬 실행)
 retrieve_documents (랜덤 주제 선택 및 문서 검색)
   - 전체 교재 구조에서 랜덤 Part 선택
   - 랜덤 Chapter 선택
   - 선택된 주제로 벡터 검색
+∥ prepare_scaffold (Few-shot 예시 선택 및 포맷팅)
   ↓ [조건부]
   - 성공 → select_context_chunk
   - 실패 → retrieve_documents (재시도)
@@ -215,12 +249,12 @@ select_context_chunk (중복 섹션 제거 및 우선순위 선정)
   ↓
 format_context (컨텍스트 포맷팅)
   - 문서를 LLM용 형식으로 변환
-  ↓
-prepare_generation_payload (LLM 페이로드 구성)
-  - 지시문/카테고리/컨텍스트 통합
+  ↓ (prepare_scaffold와 합류)
+prepare_generation_payload (생성 입력 검증)
+  - 컨텍스트가 비어 있는지 확인
   ↓
 generate_mcq (MCQ 생성)
-  - Few-shot 프롬프트 구성
+  - Few-shot 블록을 프롬프트 앞에 배치
   - LLM 호출
   - JSON 파싱
   ↓
@@ -228,7 +262,7 @@ validate_mcq (유효성 검증)
   - 5가지 검증 항목 확인
   ↓ [조건부]
   - 유효 → format_output
-  - 재시도 가능 → retrieve_documents (다른 랜덤 주제로)
+  - 재시도 가능 → retrieve_documents (다른 랜덤 주제로) ∥ prepare_scaffold
   - 최대 재시도 초과 → END (종료)
   ↓
 format_output (출력 포맷팅)
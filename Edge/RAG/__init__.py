@@ -11,16 +11,18 @@ RAG 워크플로우의 엣지(연결) 관리
 from Edge.RAG.workflow_edges import (
     build_workflow_edges,
     should_retry,
-    should_use_cache,
+    SHOULD_USE_CACHE_RESULT,
     WorkflowEdgeConfig,
+    WORKFLOW_EDGE_CONFIG,
     get_workflow_description,
 )
 
 __all__ = [
     "build_workflow_edges",
     "should_retry",
-    "should_use_cache",
+    "SHOULD_USE_CACHE_RESULT",
     "WorkflowEdgeConfig",
+    "WORKFLOW_EDGE_CONFIG",
     "get_workflow_description",
 ]
 
@@ -11,6 +11,7 @@
 - Generator.py의 복잡도를 낮추고 엣지 로직 중앙 관리
 """
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 from langgraph.graph import END, START
 
@@ -40,69 +41,54 @@ def should_retry(state: "State") -> Literal["retry", "continue"]:
         workflow.add_conditional_edges(
             "generate_answer",
             should_retry,
-            {"retry": "retrieve_documents", "continue": "format_output"}
+            {"retry": "retrieve_documents", "continue": END}
         )
     """
     has_error = state.get("error") is not None
     should_retry_flag = state.get("should_retry", False)
     retry_count = state.get("retry_count", 0)
-    max_retries = 3
     
-    if has_error and should_retry_flag and retry_count < max_retries:
+    if has_error and should_retry_flag and retry_count < WORKFLOW_EDGE_CONFIG.max_retries:
         return "retry"
     return "continue"
 
 
-def should_use_cache(state: "State") -> Literal["cached", "retrieve"]:
-    """
-    캐시 사용 여부 결정
-    
-    이전에 동일한 질문을 처리한 적이 있으면 캐시를 사용합니다.
-    
-    Args:
-        state: 현재 State
-    
-    Returns:
-        "cached": 캐시된 결과 사용
-        "retrieve": 새로 검색
-    
-    Note:
-        향후 캐시 기능 구현 시 활성화
-    """
-    # 캐시 기능은 향후 구현 예정
-    # 현재는 항상 새로 검색
-    return "retrieve"
+# 캐시 분기 결과 (캐시 기능 미구현 - 항상 새로 검색)
+# 분기 함수 대신 상수로 두어 엣지는 START -> retrieve_documents 단순 엣지로 유지합니다.
+# 캐시 기능 구현 시 "cached"/"retrieve"를 반환하는 조건부 엣지로 교체하세요.
+SHOULD_USE_CACHE_RESULT: Literal["cached", "retrieve"] = "retrieve"
 
 
 # ==================== 엣지 빌더 ====================
 
 
-def route_pipeline(state: "State") -> Literal["rag", "chat"]:
-    """파이프라인 라우팅 결과를 반환합니다."""
-
-    return "rag" if state.get("pipeline", "rag") == "rag" else "chat"
-
-
 def build_workflow_edges(workflow: "StateGraph") -> None:
     """
     워크플로우의 모든 엣지를 구성합니다.
     
     현재 구조 (선형):
-        START -> route_question -> (조건부) retrieve_documents -> format_context 
-              -> generate_answer -> format_output -> END
+        START -> route_question -> (Command) retrieve_documents
+              -> generate_answer -> END
+    
+    route_question 노드가 Command(goto=...)로 다음 노드를 직접 지정하므로
+    route_question 이후의 분기는 엣지로 등록하지 않습니다.
+    
+    컨텍스트/출력 포맷팅은 각각 retrieve_documents, generate_answer 노드에
+    포함되어 있습니다.
     
     향후 확장 가능:
         - 재시도 로직 (조건부 엣지)
-          generate_answer -> [should_retry] -> retrieve_documents or format_output
+          generate_answer -> [should_retry] -> retrieve_documents or END
         
         - 캐시 활용 (조건부 엣지)
-          START -> [should_use_cache] -> use_cache or retrieve_documents
+          START -> [캐시 분기] -> use_cache or retrieve_documents
+          (현재는 SHOULD_USE_CACHE_RESULT 상수로 항상 retrieve)
         
         - 병렬 검색 (멀티 소스)
-          START -> [retrieve_source1, retrieve_source2] -> merge -> format_context
+          START -> [retrieve_source1, retrieve_source2] -> merge -> generate_answer
         
         - 답변 품질 체크 (조건부 엣지)
-          generate_answer -> [check_quality] -> improve or format_output
+          generate_answer -> [check_quality] -> improve or END
     
     Args:
         workflow: StateGraph 객체
@@ -110,7 +96,7 @@ def build_workflow_edges(workflow: "StateGraph") -> None:
     Example:
         workflow = StateGraph(State)
         workflow.add_node("retrieve_documents", retrieve_func)
-        workflow.add_node("format_context", format_func)
+        workflow.add_node("generate_answer", answer_func)
         # ... 다른 노드들
         
         build_workflow_edges(workflow)  # 엣지 자동 구성
@@ -118,19 +104,11 @@ def build_workflow_edges(workflow: "StateGraph") -> None:
     # 1. 시작 엣지
     workflow.add_edge(START, "route_question")
 
-    workflow.add_conditional_edges(
-        "route_question",
-        route_pipeline,
-        {
-            "rag": "retrieve_documents",
-            "chat": "generate_answer",
-        },
-    )
+    # 2. route_question -> retrieve_documents | generate_answer
+    #    (노드가 반환하는 Command(goto=...)로 분기, 엣지 등록 불필요)
 
-    workflow.add_edge("retrieve_documents", "format_context")
-    workflow.add_edge("format_context", "generate_answer")
-    workflow.add_edge("generate_answer", "format_output")
-    workflow.add_edge("format_output", END)
+    workflow.add_edge("retrieve_documents", "generate_answer")
+    workflow.add_edge("generate_answer", END)
     
     # 3. 조건부 엣지 (향후 활성화)
     # 재시도 로직이 필요한 경우 아래 주석 해제
@@ -139,7 +117,7 @@ def build_workflow_edges(workflow: "StateGraph") -> None:
     #     should_retry,
     #     {
     #         "retry": "retrieve_documents",
-    #         "continue": "format_output",
+    #         "continue": END,
     #     }
     # )
 
@@ -147,30 +125,38 @@ def build_workflow_edges(workflow: "StateGraph") -> None:
 # ==================== 엣지 설정 ====================
 
 
+@dataclass(frozen=True, slots=True)
 class WorkflowEdgeConfig:
     """
     워크플로우 엣지 설정
     
     엣지 동작을 제어하는 플래그와 설정값들을 관리합니다.
     향후 기능 추가 시 여기서 활성화/비활성화 가능.
+    
+    불변(frozen) 객체이므로 설정을 바꾸려면 새 인스턴스를 만드세요:
+        >>> config = dataclasses.replace(WORKFLOW_EDGE_CONFIG, enable_retry=True)
     """
     
     # 재시도 설정
-    ENABLE_RETRY = False
-    MAX_RETRIES = 3
-    RETRY_DELAY_SECONDS = 1.0
+    enable_retry: bool = False
+    max_retries: int = 3
+    retry_delay_seconds: float = 1.0
     
     # 캐시 설정
-    ENABLE_CACHE = False
-    CACHE_TTL_SECONDS = 3600  # 1시간
+    enable_cache: bool = False
+    cache_ttl_seconds: int = 3600  # 1시간
     
     # 병렬 처리 설정
-    ENABLE_PARALLEL_RETRIEVAL = False
-    PARALLEL_SOURCE_COUNT = 2
+    enable_parallel_retrieval: bool = False
+    parallel_source_count: int = 2
     
     # 품질 체크 설정
-    ENABLE_QUALITY_CHECK = False
-    MIN_QUALITY_SCORE = 0.7
+    enable_quality_check: bool = False
+    min_quality_score: float = 0.7
+
+
+# 기본 엣지 설정 (모듈 싱글턴)
+WORKFLOW_EDGE_CONFIG = WorkflowEdgeConfig()
 
 
 # ==================== 헬퍼 함수 ====================
@@ -190,17 +176,14 @@ def get_workflow_description() -> str:
 
 START
   ↓
-route_question (질문 라우팅)
+route_question (질문 라우팅, Command(goto=...)로 분기)
   ↓
-조건부 분기
+파이프라인 분기
   ↙︎           ↘︎
 retrieve_documents   generate_answer (일반 대화)
+(검색 + 컨텍스트 포맷팅)
   ↓
-format_context (검색 결과 포맷팅)
-  ↓
-generate_answer (LLM 답변 생성)
-  ↓
-format_output (최종 출력 포맷팅)
+generate_answer (LLM 답변 생성 + 출력 포맷팅)
   ↓
 END
 
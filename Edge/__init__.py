@@ -31,8 +31,9 @@ Edge 모듈
 from Edge.RAG import (
     build_workflow_edges,
     should_retry,
-    should_use_cache,
+    SHOULD_USE_CACHE_RESULT,
     WorkflowEdgeConfig,
+    WORKFLOW_EDGE_CONFIG,
     get_workflow_description,
 )
 
@@ -48,8 +49,9 @@ __all__ = [
     # RAG 워크플로우
     "build_workflow_edges",
     "should_retry",
-    "should_use_cache",
+    "SHOULD_USE_CACHE_RESULT",
     "WorkflowEdgeConfig",
+    "WORKFLOW_EDGE_CONFIG",
     "get_workflow_description",
     # MCQ 워크플로우
     "build_mcq_workflow_edges",
@@ -12,12 +12,16 @@ MCQ 생성을 위한 LangGraph 노드 함수들
   - create_mcq_select_prompt_node
 - retrieve_documents.py: 문서 검색
   - create_mcq_retrieve_documents_node
+  - select_random_topic (배치 사전 검색에서도 사용)
+  - warmup_reranker (Reranking 사용 시 서버 시작에서 호출)
 - select_context.py: 컨텍스트 문서 선택
   - create_mcq_select_context_node
 - format_context.py: 컨텍스트 포맷팅
   - create_mcq_format_context_node
-- prepare_payload.py: LLM 페이로드 준비
+- prepare_payload.py: LLM 호출 전 생성 입력 검증
   - create_mcq_prepare_payload_node
+- prepare_scaffold.py: Few-shot 예시 블록 준비 (검색과 병렬 실행)
+  - create_mcq_prepare_scaffold_node
 - generate.py: MCQ 생성
   - create_mcq_generate_node
 - validate.py: 유효성 검증
@@ -31,10 +35,15 @@ MCQ 생성을 위한 LangGraph 노드 함수들
 from Node.MCQ.select_part import create_mcq_select_part_node
 from Node.MCQ.select_chapter import create_mcq_select_chapter_node
 from Node.MCQ.select_prompt import create_mcq_select_prompt_node
-from Node.MCQ.retrieve_documents import create_mcq_retrieve_documents_node
+from Node.MCQ.retrieve_documents import (
+    create_mcq_retrieve_documents_node,
+    select_random_topic,
+    warmup_reranker,
+)
 from Node.MCQ.select_context import create_mcq_select_context_node
 from Node.MCQ.format_context import create_mcq_format_context_node
 from Node.MCQ.prepare_payload import create_mcq_prepare_payload_node
+from Node.MCQ.prepare_scaffold import create_mcq_prepare_scaffold_node
 from Node.MCQ.generate import create_mcq_generate_node
 from Node.MCQ.validate import create_mcq_validate_node
 from Node.MCQ.format_output import create_mcq_format_output_node
@@ -44,9 +53,12 @@ __all__ = [
     "create_mcq_select_chapter_node",
     "create_mcq_select_prompt_node",
     "create_mcq_retrieve_documents_node",
+    "select_random_topic",
+    "warmup_reranker",
     "create_mcq_select_context_node",
     "create_mcq_format_context_node",
     "create_mcq_prepare_payload_node",
+    "create_mcq_prepare_scaffold_node",
     "create_mcq_generate_node",
     "create_mcq_validate_node",
     "create_mcq_format_output_node",
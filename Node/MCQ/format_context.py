@@ -5,20 +5,39 @@ MCQ용 컨텍스트 포맷팅 노드
 """
 
 import logging
-from typing import TYPE_CHECKING
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Tuple
 
 from Utils import format_documents_for_llm, create_error_handler
 
 if TYPE_CHECKING:
+    from langchain_core.documents import Document
     from State import State
 
 
-def create_mcq_format_context_node(logger: logging.Logger):
+def _context_cache_key(documents: List["Document"]) -> Tuple[tuple, ...]:
+    """포맷팅 결과를 결정하는 값(순서, 출처 메타데이터, 본문)만으로 캐시 키를 만듭니다."""
+    return tuple(
+        (
+            (doc.metadata or {}).get("chapter"),
+            (doc.metadata or {}).get("section"),
+            (doc.metadata or {}).get("page_number"),
+            doc.page_content,
+        )
+        for doc in documents
+    )
+
+
+def create_mcq_format_context_node(logger: logging.Logger, cache_size: int = 64):
     """
     컨텍스트 포맷팅 노드를 생성하는 팩토리 함수
     
+    재시도/배치에서 같은 문서 조합이 다시 선택되면 이전 포맷팅 결과를 재사용합니다.
+    
     Args:
         logger: 로거 객체
+        cache_size: 보관할 포맷팅 결과 수 (기본값: 64, 0이면 캐시 사용 안 함)
     
     Returns:
         컨텍스트 포맷팅 노드 함수
@@ -26,6 +45,10 @@ def create_mcq_format_context_node(logger: logging.Logger):
     # 에러 핸들러 생성
     error_handler = create_error_handler(logger)
     
+    # 문서 조합 → 포맷팅 결과 (LRU, 배치 동시 실행 대비 Lock)
+    cache: "OrderedDict[tuple, str]" = OrderedDict()
+    cache_lock = threading.Lock()
+    
     def format_context(state: "MCQState") -> dict:
         """
         노드 4: 컨텍스트 포맷팅
@@ -56,8 +79,22 @@ def create_mcq_format_context_node(logger: logging.Logger):
                     return_fields={"formatted_context": ""}
                 )
             
-            # 문서 포맷팅
-            formatted = format_documents_for_llm(documents)
+            # 문서 포맷팅 (같은 문서 조합이면 캐시 사용)
+            key = _context_cache_key(documents) if cache_size > 0 else None
+            with cache_lock:
+                formatted = cache.get(key) if key is not None else None
+                if formatted is not None:
+                    cache.move_to_end(key)
+            
+            if formatted is None:
+                formatted = format_documents_for_llm(documents)
+                if key is not None:
+                    with cache_lock:
+                        cache[key] = formatted
+                        while len(cache) > cache_size:
+                            cache.popitem(last=False)
+            else:
+                logger.debug("컨텍스트 포맷팅 캐시 사용")
             
             # 성공 처리
             return error_handler.handle_success(
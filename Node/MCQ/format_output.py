@@ -5,11 +5,10 @@ MCQ 출력 포맷팅 노드
 """
 
 import logging
-import hashlib
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from Utils import create_error_handler
+from Utils import compute_question_hash, create_error_handler
 
 if TYPE_CHECKING:
     from State import State
@@ -51,28 +50,18 @@ def create_mcq_format_output_node(logger: logging.Logger):
         try:
             logger.info("MCQ 출력 포맷팅 시작")
             
-            mcq = state["generated_mcq"].copy()
+            selected_part = state["selected_part"]
+            selected_chapter = state["selected_chapter"]
+            generated_mcq = state["generated_mcq"]
             
-            # 기본 메타데이터 추가
-            mcq["timestamp"] = datetime.now().isoformat()
-            mcq["selected_part"] = state["selected_part"]
-            mcq["selected_chapter"] = state["selected_chapter"]
-            mcq["selected_topic"] = state["selected_topic_query"]
-            mcq["available_chapters"] = state.get("available_chapters", [])
+            # 질문/보기 공백 정리는 여기서 한 번만 수행하고 결과에 반영
+            question = generated_mcq.get("question", "").strip()
+            options = [opt.strip() for opt in generated_mcq.get("options", ())]
             
-            # 검색된 문서의 메타데이터 추가
+            # 검색된 문서의 메타데이터 (첫 번째 문서를 대표값으로 사용)
             documents = state.get("retrieved_documents", [])
             if documents:
-                # 첫 번째 문서의 메타데이터 사용 (대표값)
-                first_doc = documents[0]
-                metadata = first_doc.metadata if hasattr(first_doc, 'metadata') else {}
-                
-                mcq["doc_title"] = metadata.get("title", "N/A")
-                mcq["doc_part"] = metadata.get("part", state["selected_part"])
-                mcq["doc_chapter"] = metadata.get("chapter", state["selected_chapter"])
-                mcq["doc_section"] = metadata.get("section", "N/A")
-                mcq["doc_page_number"] = metadata.get("page_number", "N/A")
-
+                metadata = getattr(documents[0], "metadata", None) or {}
                 section_ids = (
                     state.get("selected_section_ids")
                     or state.get("context_section_ids")
@@ -84,25 +73,38 @@ def create_mcq_format_output_node(logger: logging.Logger):
                     or []
                 )
             else:
-                mcq["doc_title"] = "N/A"
-                mcq["doc_part"] = state["selected_part"]
-                mcq["doc_chapter"] = state["selected_chapter"]
-                mcq["doc_section"] = "N/A"
-                mcq["doc_page_number"] = "N/A"
-
+                metadata = {}
                 section_ids = []
                 document_ids = []
-
-            mcq["doc_section_ids"] = section_ids
-            mcq["doc_section_id"] = section_ids[0] if section_ids else None
-            mcq["doc_document_ids"] = document_ids
-            mcq["doc_document_id"] = document_ids[0] if document_ids else None
-
-            question_signature = "||".join([
-                mcq.get("question", "").strip(),
-                *[opt.strip() for opt in mcq.get("options", [])],
-            ])
-            mcq["question_hash"] = hashlib.sha256(question_signature.encode("utf-8")).hexdigest()
+            
+            # 문항 해시 (generate_mcq에서 파싱 직후 계산한 값이 있으면 재사용)
+            question_hash = generated_mcq.get("question_hash") or compute_question_hash(
+                question, options
+            )
+            
+            # 생성된 MCQ + 메타데이터를 한 번에 구성
+            mcq = {
+                **generated_mcq,
+                "question": question,
+                "options": options,
+                # 기본 메타데이터
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "selected_part": selected_part,
+                "selected_chapter": selected_chapter,
+                "selected_topic": state["selected_topic_query"],
+                "available_chapters": state.get("available_chapters", []),
+                # 문서 메타데이터
+                "doc_title": metadata.get("title", "N/A"),
+                "doc_part": metadata.get("part", selected_part),
+                "doc_chapter": metadata.get("chapter", selected_chapter),
+                "doc_section": metadata.get("section", "N/A"),
+                "doc_page_number": metadata.get("page_number", "N/A"),
+                "doc_section_ids": section_ids,
+                "doc_section_id": section_ids[0] if section_ids else None,
+                "doc_document_ids": document_ids,
+                "doc_document_id": document_ids[0] if document_ids else None,
+                "question_hash": question_hash,
+            }
             
             # 성공 처리
             return error_handler.handle_success(
@@ -4,15 +4,38 @@ MCQ 생성 노드 (LLM 호출)
 Few-shot 프롬프트를 구성하고 LLM을 호출하여 MCQ를 생성합니다.
 """
 
+import json
 import logging
-from typing import TYPE_CHECKING, List, Union
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.output_parsers import JsonOutputParser, StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 
-from Utils.few_shot import build_few_shot_prompt
-from Utils import create_error_handler
+from Utils.diversity_tracker import (
+    get_question_type_constraint,
+    get_time_period_constraint,
+)
+from Utils.few_shot import attach_few_shot_block, build_few_shot_prompt
+from Utils.logic_pool_tracker import get_available_logic_prompt
+from Utils.rhythm_tracker import get_rhythm_status_text
+from Utils import compute_question_hash, create_error_handler
+
+# stream_mode="custom" 토큰 이벤트용 (구버전 langgraph에는 없음)
+try:
+    from langgraph.config import get_stream_writer
+except ImportError:
+    get_stream_writer = None
+
+# orjson이 설치되어 있으면 응답 JSON 파싱에 사용 (선택적 의존성)
+try:
+    import orjson  # type: ignore
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 if TYPE_CHECKING:
     from langchain_google_vertexai import VertexAI
@@ -28,9 +51,9 @@ class MultipleChoiceQuestion(BaseModel):
         question: 교재 Context를 기반으로 생성된 최종 질문 텍스트
         options: 4개의 보기 리스트 (길이는 반드시 4)
         answer_index: 정답 보기의 인덱스 (1-4 사이)
-        explanation: 해설 (문자열 또는 4개 항목 리스트)
-            - str: 전체 해설 (기존 방식)
-            - List[str]: 각 보기별 해설 (1번 해설, 2번 해설, 3번 해설, 4번 해설)
+        explanation: 해설 리스트 (항상 리스트)
+            - 1개 항목: 전체 해설
+            - 4개 항목: 각 보기별 해설 (1번 해설, 2번 해설, 3번 해설, 4번 해설)
     """
     question: str = Field(
         description=(
@@ -54,19 +77,129 @@ class MultipleChoiceQuestion(BaseModel):
             "**중요:** 반드시 1, 2, 3, 4 중 하나입니다. 0이나 5 이상은 허용되지 않습니다."
         )
     )
-    explanation: Union[str, List[str]] = Field(
+    explanation: List[str] = Field(
+        min_length=1,
+        max_length=4,
         description=(
-            "해설. 두 가지 형식 지원:\n"
-            "1. 문자열 형식: 전체 해설을 하나의 문자열로 작성. 예: '정답은 3번입니다. 왜냐하면...'\n"
-            "2. 리스트 형식: 각 보기별 해설을 4개의 문자열 리스트로 작성. "
+            "해설 문자열 리스트. 각 보기별 해설 4개(1번~4번 순서) 또는 전체 해설 1개.\n"
             "예: ['1번은 틀렸습니다. 왜냐하면...', '2번은 틀렸습니다. 왜냐하면...', '3번이 정답입니다. 왜냐하면...', '4번은 틀렸습니다. 왜냐하면...']"
         )
     )
 
 
+# ==================== 출력 형식 (모듈 로드 시 한 번만 생성) ====================
+
+# JSON 파서는 format_instructions 생성과 파싱 실패 시 폴백에만 사용
+_MCQ_PARSER = JsonOutputParser(pydantic_object=MultipleChoiceQuestion)
+# options 개수/answer_index 범위 규칙은 스키마(Field description)에 이미 포함되어 있으므로
+# 여기서는 스키마에 없는 응답 형식 규칙만 짧게 덧붙입니다 (매 호출 입력 토큰 절감).
+_ENHANCED_FORMAT_INSTRUCTIONS = (
+    _MCQ_PARSER.get_format_instructions() + "\n\n"
+    "**중요:** 코드블록 없이 순수 JSON만 응답하고, 모든 필드를 빠짐없이 채우세요."
+)
+
+
+# Few-shot 예시 블록 위치: 컨텍스트 문단 바로 앞
+# 시스템 프롬프트 → 지침/format_instructions(고정) → Few-shot → 컨텍스트/주제(매번 변경) 순서가 되어
+# 고정된 앞부분이 길어지므로 Gemini 등의 prefix(컨텍스트) 캐싱 적중 범위가 넓어집니다.
+# 템플릿에 {context}가 없으면 템플릿 앞에 배치합니다.
+_FEW_SHOT_ANCHOR = "{context}"
+
+
+def _current_stream_writer():
+    """실행 중인 그래프의 StreamWriter를 반환합니다 (그래프 밖이거나 미지원이면 None)."""
+    if get_stream_writer is None:
+        return None
+    try:
+        return get_stream_writer()
+    except RuntimeError:
+        return None
+
+
+# 응답 앞뒤의 ```json / ``` 코드블록 표시 (모듈 로드 시 한 번만 컴파일)
+_CODE_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
+
+
+def _parse_mcq_response(text: str) -> Any:
+    """
+    LLM 응답 문자열을 MCQ 딕셔너리로 파싱합니다.
+    
+    코드블록 제거, JSON 로드, 최상위 리스트 언래핑, 문자열 해설의 리스트 변환을
+    한 번에 처리합니다.
+    JSON 모드 응답은 순수 JSON이므로 바로 로드하고,
+    코드블록 제거 후에도 실패하면 JsonOutputParser(부분 JSON 복구 포함)로 처리합니다.
+    필드 검증은 validate_mcq 노드에서 수행합니다.
+    
+    Raises:
+        ValueError: JSON 파싱 실패 또는 빈 리스트 응답
+    """
+    try:
+        parsed = _json_loads(_CODE_FENCE_RE.sub("", text))
+    except ValueError:
+        parsed = _MCQ_PARSER.parse(text)
+    
+    # 리스트로 반환된 경우 첫 번째 항목 사용 (방어 코드)
+    if isinstance(parsed, list):
+        if not parsed:
+            raise ValueError("LLM이 빈 리스트를 반환했습니다")
+        parsed = parsed[0]
+    
+    # 해설은 리스트로 통일 (스키마를 따르지 않고 문자열로 답한 경우)
+    if isinstance(parsed, dict) and isinstance(parsed.get("explanation"), str):
+        parsed["explanation"] = [parsed["explanation"]]
+    return parsed
+
+
+# ==================== 다양성 제약 텍스트 캐시 ====================
+# 배치 중 카운터는 호출마다 한 항목 정도만 바뀌므로
+# 카운터 내용(frozenset)이 같으면 렌더링된 제약 텍스트를 재사용합니다.
+
+@lru_cache(maxsize=256)
+def _render_logic_constraint(used_logics: frozenset, max_show: int) -> str:
+    return get_available_logic_prompt(set(used_logics), max_show=max_show)
+
+
+@lru_cache(maxsize=256)
+def _render_rhythm_constraint(counter_items: frozenset, max_count: int) -> str:
+    return get_rhythm_status_text(dict(counter_items), max_count=max_count)
+
+
+@lru_cache(maxsize=256)
+def _render_question_type_constraint(counter_items: frozenset) -> str:
+    return get_question_type_constraint(
+        dict(counter_items),
+        max_positive=5,
+        max_negative=2,
+        max_sequential=2,
+        max_comparative=1,
+        max_multiple=1
+    )
+
+
+@lru_cache(maxsize=256)
+def _render_time_constraint(counter_items: frozenset, max_per_period: int) -> str:
+    return get_time_period_constraint(dict(counter_items), max_per_period=max_per_period)
+
+
+def _update_recent_indices(
+    recent_indices: List[int], selected_indices: List[int], limit: int = 10
+) -> List[int]:
+    """
+    최근 사용 Few-shot 인덱스를 갱신합니다.
+    
+    다시 선택된 인덱스는 기존 위치에서 빼고 맨 뒤(가장 최근)로 옮겨
+    중복 없이 최근 limit개만 유지합니다.
+    """
+    selected = set(selected_indices)
+    updated = [i for i in recent_indices if i not in selected]
+    updated.extend(selected_indices)
+    return updated[-limit:]
+
+
 def create_mcq_generate_node(
     llm: "VertexAI",
     logger: logging.Logger,
+    use_async: bool = False,
 ):
     """
     MCQ 생성 노드를 생성하는 팩토리 함수
@@ -76,9 +209,10 @@ def create_mcq_generate_node(
     Args:
         llm: VertexAI LLM 객체
         logger: 로거 객체
+        use_async: True면 chain.astream을 사용하는 async 노드를 반환
     
     Returns:
-        MCQ 생성 노드 함수
+        MCQ 생성 노드 함수 (use_async=True면 코루틴 함수)
     
     Note:
         이 노드는 select_prompt 노드 이후에 실행되어야 합니다.
@@ -87,183 +221,233 @@ def create_mcq_generate_node(
     # 에러 핸들러 생성
     error_handler = create_error_handler(logger)
     
-    def generate_mcq(state: "MCQState") -> dict:
+    @lru_cache(maxsize=128)
+    def compile_chain(system_template: str, human_template: str):
         """
-        노드 5: MCQ 생성 (LLM 호출)
+        프롬프트 템플릿을 파싱해 LLM 체인을 만듭니다 (템플릿 조합별로 한 번만).
         
-        Few-shot 프롬프트를 구성하고 LLM을 호출하여 MCQ를 생성합니다.
-        
-        Args:
-            state: State
+        Part/Chapter별 프롬프트와 정렬된 Few-shot 조합은 반복되므로
+        같은 조합이면 파싱된 ChatPromptTemplate과 체인을 재사용합니다.
+        체인은 응답 문자열을 반환하며 JSON 파싱은 _parse_mcq_response에서
+        한 번에 수행합니다 (스트리밍 시 전체 응답을 받은 뒤 파싱).
+        """
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", system_template),
+            ("human", human_template),
+        ]).partial(format_instructions=_ENHANCED_FORMAT_INSTRUCTIONS)
+        return prompt | llm | StrOutputParser()
+    
+    def build_request(state: "MCQState") -> Tuple[Any, Dict[str, Any], Optional[List[int]]]:
+        """
+        State에서 프롬프트/입력을 구성합니다 (동기/비동기 노드 공용).
         
         Returns:
-            업데이트할 필드:
-            - generated_mcq: 생성된 MCQ
-            - error: 에러 메시지
-            - should_retry: 재시도 여부
+            (LLM 체인, 체인 입력, 갱신할 recent_few_shot_indices 또는 None)
         """
-        try:
-            logger.info("MCQ 생성 시작 (LLM 호출)")
-            
-            # JSON 파서 생성
-            parser = JsonOutputParser(pydantic_object=MultipleChoiceQuestion)
-            
-            payload = state.get("generation_payload", {})
-            formatted_context = payload.get("context") or state.get("formatted_context", "")
-            if not formatted_context:
-                raise ValueError("LLM에 전달할 컨텍스트가 없습니다")
+        # State 필드를 한 번에 로컬로 바인딩 (노드 실행마다 반복 조회 방지)
+        s_get = state.get
 
-            selected_topic = payload.get("selected_topic") or state.get("selected_topic_query")
-            instruction = payload.get("instruction") or state.get("instruction", "")
+        formatted_context = s_get("formatted_context", "")
+        selected_topic = s_get("selected_topic_query")
+        instruction = s_get("instruction", "")
+        few_shot_examples = s_get("few_shot_examples", [])
+        max_few_shot_examples = s_get("max_few_shot_examples", 5)
+        category_examples = s_get("category_examples", {})
+        category_weights = s_get("category_weights", {})
 
-            # State에서 프롬프트 가져오기 (select_prompt 노드에서 설정됨)
-            system_template = state.get("system_prompt")
-            human_template = state.get("retriever_prompt")
-            
-            if not system_template or not human_template:
-                raise ValueError(
-                    "프롬프트가 State에 없습니다. "
-                    "select_prompt 노드가 먼저 실행되었는지 확인하세요."
-                )
-            
-            # 선택된 범위 로깅
-            selected_part = state.get("selected_part")
-            selected_chapter = state.get("selected_chapter")
-            logger.info(
-                f"프롬프트 사용: Part={selected_part}, Chapter={selected_chapter}"
+        # State에서 프롬프트 가져오기 (select_prompt 노드에서 설정됨)
+        system_template = s_get("system_prompt")
+        human_template = s_get("retriever_prompt")
+        selected_part = s_get("selected_part")
+        selected_chapter = s_get("selected_chapter")
+        recent_indices = s_get("recent_few_shot_indices", [])
+        few_shot_block = s_get("few_shot_block")
+        logic_counter = s_get("logic_counter", {})
+        rhythm_counter = s_get("rhythm_counter", {})
+        question_type_counter = s_get("question_type_counter", {})
+        time_counter = s_get("time_counter", {})
+
+        if not formatted_context:
+            raise ValueError("LLM에 전달할 컨텍스트가 없습니다")
+        
+        if not system_template or not human_template:
+            raise ValueError(
+                "프롬프트가 State에 없습니다. "
+                "select_prompt 노드가 먼저 실행되었는지 확인하세요."
             )
-            
-            # Few-shot 예시 추가
-            few_shot_examples = payload.get("few_shot_examples") or state.get("few_shot_examples", [])
-            max_few_shot_examples = payload.get("max_few_shot_examples") or state.get("max_few_shot_examples", 5)
-            category_examples = payload.get("category_examples") or state.get("category_examples", {})
-            category_weights = payload.get("category_weights") or state.get("category_weights", {})
-            
-            logger.debug(f"Few-shot 설정: max={max_few_shot_examples}, 카테고리={len(category_examples)}개")
-            
-            recent_indices = state.get("recent_few_shot_indices", [])
-            if few_shot_examples:
-                human_template, selected_indices = build_few_shot_prompt(
-                    human_template, 
-                    few_shot_examples,
-                    max_examples=max_few_shot_examples,
-                    category_examples=category_examples,
-                    category_weights=category_weights,
-                    recent_few_shot_indices=recent_indices
-                )
-                # 선택된 인덱스를 recent_few_shot_indices에 추가 (최대 10개 유지)
-                updated_indices = (recent_indices + selected_indices)[-10:]
-                logger.info(f"Few-shot 예시 {max_few_shot_examples}개 적용 (카테고리 가중치 선택)")
-            else:
-                selected_indices = []
-                updated_indices = recent_indices
-            
-            # 논리(5H5T) 다양성 제약 추가 (배치 생성 시) - 가장 우선!
-            logic_counter = state.get("logic_counter", {})
+        
+        # 선택된 범위 로깅
+        # (배치 생성 시 노드가 반복 실행되므로 %-포맷으로 지연 포맷팅)
+        logger.info("프롬프트 사용: Part=%s, Chapter=%s", selected_part, selected_chapter)
+        
+        # Few-shot 예시 추가
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Few-shot 설정: max=%s, 카테고리=%d개",
+                max_few_shot_examples,
+                len(category_examples),
+            )
+        
+        if few_shot_examples and few_shot_block:
+            # prepare_scaffold 노드가 검색과 병렬로 미리 구성한 예시 블록 사용
+            human_template = attach_few_shot_block(
+                human_template, few_shot_block, prepend=True, anchor=_FEW_SHOT_ANCHOR
+            )
+            selected_indices = s_get("few_shot_indices", [])
+            updated_indices = _update_recent_indices(recent_indices, selected_indices)
+            logger.info("Few-shot 예시 %d개 적용 (사전 구성)", len(selected_indices))
+        elif few_shot_examples:
+            human_template, selected_indices = build_few_shot_prompt(
+                human_template, 
+                few_shot_examples,
+                max_examples=max_few_shot_examples,
+                category_examples=category_examples,
+                category_weights=category_weights,
+                recent_few_shot_indices=recent_indices,
+                num_buckets=s_get("few_shot_buckets", 0),
+                prepend=True,
+                anchor=_FEW_SHOT_ANCHOR,
+            )
+            # 선택된 인덱스를 recent_few_shot_indices에 추가 (중복 없이 최대 10개 유지)
+            updated_indices = _update_recent_indices(recent_indices, selected_indices)
+            logger.info("Few-shot 예시 %s개 적용 (카테고리 가중치 선택)", max_few_shot_examples)
+        else:
+            selected_indices = []
+            updated_indices = recent_indices
+        
+        # 다양성 제약 (배치 생성 시에만 카운터가 채워짐)
+        if any((logic_counter, rhythm_counter, question_type_counter, time_counter)):
+            # 논리(5H5T) 다양성 제약 추가 - 가장 우선!
             if logic_counter:
-                from Utils.logic_pool_tracker import get_available_logic_prompt
-                used_logics = set(logic_counter.keys())
-                logic_constraint = get_available_logic_prompt(used_logics, max_show=5)
+                logic_constraint = _render_logic_constraint(frozenset(logic_counter), 5)
                 human_template = human_template + logic_constraint
-                logger.info(f"논리 제약 추가: {len(logic_counter)}가지 5H5T 원인 추적 중")
+                logger.info("논리 제약 추가: %d가지 5H5T 원인 추적 중", len(logic_counter))
             
-            # 리듬 다양성 제약 추가 (배치 생성 시)
-            rhythm_counter = state.get("rhythm_counter", {})
+            # 리듬 다양성 제약 추가
             if rhythm_counter:
-                from Utils.rhythm_tracker import get_rhythm_status_text
-                rhythm_constraint = get_rhythm_status_text(rhythm_counter, max_count=2)
+                rhythm_constraint = _render_rhythm_constraint(frozenset(rhythm_counter.items()), 2)
                 human_template = human_template + rhythm_constraint
-                logger.info(f"리듬 제약 추가: {len(rhythm_counter)}가지 리듬 추적 중")
+                logger.info("리듬 제약 추가: %d가지 리듬 추적 중", len(rhythm_counter))
             
-            # 질문 형식 다양성 제약 추가 (배치 생성 시)
-            question_type_counter = state.get("question_type_counter", {})
+            # 질문 형식 다양성 제약 추가
             if question_type_counter:
-                from Utils.diversity_tracker import get_question_type_constraint
-                qtype_constraint = get_question_type_constraint(
-                    question_type_counter,
-                    max_positive=5,
-                    max_negative=2,
-                    max_sequential=2,
-                    max_comparative=1,
-                    max_multiple=1
+                qtype_constraint = _render_question_type_constraint(
+                    frozenset(question_type_counter.items())
                 )
                 human_template = human_template + qtype_constraint
-                logger.info(f"질문 형식 제약 추가: {len(question_type_counter)}가지 형식 추적 중")
+                logger.info("질문 형식 제약 추가: %d가지 형식 추적 중", len(question_type_counter))
             
-            # 시간대 다양성 제약 추가 (배치 생성 시)
-            time_counter = state.get("time_counter", {})
+            # 시간대 다양성 제약 추가
             if time_counter:
-                from Utils.diversity_tracker import get_time_period_constraint
-                time_constraint = get_time_period_constraint(time_counter, max_per_period=3)
+                time_constraint = _render_time_constraint(frozenset(time_counter.items()), 3)
                 human_template = human_template + time_constraint
-                logger.info(f"시간대 제약 추가: {len(time_counter)}개 시간대 추적 중")
-            
-            # format_instructions 강화
-            base_format_instructions = parser.get_format_instructions()
-            enhanced_format_instructions = (
-                base_format_instructions + "\n\n"
-                "**중요: JSON 형식 준수 규칙**\n"
-                "- 반드시 유효한 JSON 형식으로 응답하세요. 마크다운 코드블록(```json ... ```) 없이 순수 JSON만 응답하세요.\n"
-                "- options는 반드시 정확히 4개의 문자열 리스트입니다. 3개나 5개는 허용되지 않습니다.\n"
-                "- answer_index는 반드시 1, 2, 3, 4 중 하나입니다. 0이나 5 이상은 허용되지 않습니다.\n"
-                "- 모든 필드는 필수이며 누락되어서는 안 됩니다."
-            )
-            
-            # 프롬프트 생성
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", system_template),
-                ("human", human_template),
-            ]).partial(format_instructions=enhanced_format_instructions)
-            
-            # LLM 체인 실행
-            chain = prompt | llm | parser
-            
-            # LLM 호출 전 로깅
-            topic_preview = (selected_topic or "")[:50]
+                logger.info("시간대 제약 추가: %d개 시간대 추적 중", len(time_counter))
+        
+        # 프롬프트 생성 및 LLM 체인 (템플릿 조합별 캐시)
+        chain = compile_chain(system_template, human_template)
+        
+        # LLM 호출 전 로깅
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "LLM 호출: 쿼리='%s...', 컨텍스트=%s자",
-                topic_preview,
+                (selected_topic or "")[:50],
                 len(formatted_context),
             )
+        
+        inputs = {
+            "context": formatted_context,
+            "question": selected_topic,
+            "instruction": instruction,
+        }
+        return chain, inputs, (updated_indices if few_shot_examples else None)
+    
+    def finish(generated_mcq: Any, updated_indices: Optional[List[int]]) -> dict:
+        """파싱된 MCQ로 성공 결과를 만듭니다 (동기/비동기 노드 공용)."""
+        # 문항 해시를 파싱 직후 한 번만 계산 (캐시/풀/출력 노드에서 재사용)
+        # 형식이 잘못된 응답은 validate_mcq에서 걸러지므로 여기서는 건너뜀
+        if isinstance(generated_mcq, dict):
+            try:
+                generated_mcq["question_hash"] = compute_question_hash(
+                    generated_mcq.get("question", ""), generated_mcq.get("options", ())
+                )
+            except (AttributeError, TypeError):
+                pass
+        
+        # 성공 처리
+        question_preview = generated_mcq.get('question', 'N/A')[:50] if isinstance(generated_mcq, dict) else 'N/A'
+        
+        return_fields = {"generated_mcq": generated_mcq}
+        # recent_few_shot_indices 업데이트
+        if updated_indices is not None:
+            return_fields["recent_few_shot_indices"] = updated_indices
+        
+        return error_handler.handle_success(
+            node_name="generate_mcq",
+            message=f"MCQ 생성 완료: '{question_preview}...'",
+            return_fields=return_fields
+        )
+    
+    def handle_failure(e: Exception, state: "MCQState") -> dict:
+        # 예외 처리 (복구 가능)
+        return error_handler.handle_error(
+            error=e,
+            state=state,
+            node_name="generate_mcq",
+            recoverable=True,
+            custom_message="MCQ 생성 실패",
+            return_fields={"generated_mcq": None}
+        )
+    
+    def generate_mcq(state: "MCQState") -> dict:
+        """
+        노드 5: MCQ 생성 (LLM 호출)
+        
+        Few-shot 프롬프트를 구성하고 LLM을 호출하여 MCQ를 생성합니다.
+        
+        Args:
+            state: State
+        
+        Returns:
+            업데이트할 필드:
+            - generated_mcq: 생성된 MCQ
+            - error: 에러 메시지
+            - should_retry: 재시도 여부
+        """
+        try:
+            logger.info("MCQ 생성 시작 (LLM 호출)")
+            chain, inputs, updated_indices = build_request(state)
+            return finish(_parse_mcq_response(chain.invoke(inputs)), updated_indices)
+        except Exception as e:
+            return handle_failure(e, state)
+    
+    async def agenerate_mcq(state: "MCQState") -> dict:
+        """
+        노드 5: MCQ 생성 (비동기 스트리밍 LLM 호출)
+        
+        generate_mcq와 동일하지만 chain.astream으로 응답을 받으므로
+        workflow.ainvoke 배치에서 실행기 스레드를 점유하지 않습니다.
+        stream_mode="custom"으로 실행하면 응답 조각을
+        {"node": "generate_mcq", "token": ...} 이벤트로 즉시 내보냅니다.
+        """
+        try:
+            logger.info("MCQ 생성 시작 (비동기 LLM 호출)")
+            chain, inputs, updated_indices = build_request(state)
+            writer = _current_stream_writer()
             
-            generated_mcq = chain.invoke({
-                "context": formatted_context,
-                "question": selected_topic,
-                "instruction": instruction,
-            })
-            
-            # 리스트로 반환된 경우 첫 번째 항목 사용 (방어 코드)
-            if isinstance(generated_mcq, list):
-                if generated_mcq:
-                    generated_mcq = generated_mcq[0]
-                    logger.warning("⚠️ LLM이 리스트를 반환했습니다. 첫 번째 항목을 사용합니다.")
-                else:
-                    raise ValueError("LLM이 빈 리스트를 반환했습니다")
-            
-            # 성공 처리
-            question_preview = generated_mcq.get('question', 'N/A')[:50] if isinstance(generated_mcq, dict) else 'N/A'
-            
-            return_fields = {"generated_mcq": generated_mcq}
-            # recent_few_shot_indices 업데이트
-            if few_shot_examples:
-                return_fields["recent_few_shot_indices"] = updated_indices
-            
-            return error_handler.handle_success(
-                node_name="generate_mcq",
-                message=f"MCQ 생성 완료: '{question_preview}...'",
-                return_fields=return_fields
-            )
+            chunks = []
+            async for chunk in chain.astream(inputs):
+                if not chunk:
+                    continue
+                chunks.append(chunk)
+                if writer is not None:
+                    writer({"node": "generate_mcq", "token": chunk})
             
+            # 코드블록 제거/JSON 파싱/리스트 언래핑은 응답이 모두 도착한 뒤 한 번만 수행
+            return finish(_parse_mcq_response("".join(chunks)), updated_indices)
         except Exception as e:
-            # 예외 처리 (복구 가능)
-            return error_handler.handle_error(
-                error=e,
-                state=state,
-                node_name="generate_mcq",
-                recoverable=True,
-                custom_message="MCQ 생성 실패",
-                return_fields={"generated_mcq": None}
-            )
+            return handle_failure(e, state)
     
+    if use_async:
+        return agenerate_mcq
     return generate_mcq
 
@@ -1,4 +1,10 @@
-"""MCQ 페이로드 준비 노드"""
+"""
+MCQ 생성 입력 검증 노드
+
+format_context와 prepare_scaffold가 합류하는 지점에서 생성용 컨텍스트가
+비어 있지 않은지 확인합니다. generate_mcq는 필요한 값을 State에서 직접 읽으므로
+별도 페이로드를 만들지 않습니다 (같은 컨텍스트/예시가 State에 중복 저장되지 않도록).
+"""
 
 import logging
 from typing import TYPE_CHECKING
@@ -10,40 +16,24 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 def create_mcq_prepare_payload_node(logger: logging.Logger):
-    """LLM 호출 이전에 페이로드를 구성하는 노드"""
+    """LLM 호출 이전에 생성 입력을 검증하는 노드"""
 
     error_handler = create_error_handler(logger)
 
     def prepare_payload(state: "State") -> dict:
         try:
-            formatted_context = state.get("formatted_context", "")
+            formatted_context = state.get("formatted_context") or ""
             if not formatted_context.strip():
                 return error_handler.handle_error(
                     error=ValueError("생성용 컨텍스트가 비어 있습니다"),
                     state=state,
                     node_name="prepare_generation_payload",
                     recoverable=True,
-                    return_fields={"generation_payload": {}},
                 )
 
-            payload = {
-                "context": formatted_context,
-                "instruction": state.get("instruction", ""),
-                "selected_topic": state.get("selected_topic_query"),
-                "category_weights": state.get("category_weights", {}),
-                "few_shot_examples": state.get("few_shot_examples", []),
-                "category_examples": state.get("category_examples", {}),
-                "max_few_shot_examples": state.get("max_few_shot_examples", 0),
-                "selected_section_ids": state.get("selected_section_ids", []),
-                "selected_document_ids": state.get("selected_document_ids", []),
-            }
-
-            logger.info("LLM 페이로드 구성 완료")
-
             return error_handler.handle_success(
                 node_name="prepare_generation_payload",
-                message="페이로드 준비 완료",
-                return_fields={"generation_payload": payload},
+                message="생성 입력 확인 완료",
             )
 
         except Exception as exc:  # pragma: no cover
@@ -52,9 +42,6 @@ def create_mcq_prepare_payload_node(logger: logging.Logger):
                 state=state,
                 node_name="prepare_generation_payload",
                 recoverable=True,
-                return_fields={"generation_payload": {}},
             )
 
     return prepare_payload
-
-
@@ -0,0 +1,43 @@
+"""
+프롬프트 스캐폴드 준비 노드
+
+Few-shot 예시 선택과 포맷팅은 검색 결과와 무관하므로
+retrieve_documents와 병렬로 실행하여 벡터 검색 대기 시간 동안 미리 준비합니다.
+"""
+
+import logging
+from typing import TYPE_CHECKING
+
+from Utils.few_shot import build_few_shot_block
+
+if TYPE_CHECKING:  # pragma: no cover
+    from State import State
+
+
+def create_mcq_prepare_scaffold_node(logger: logging.Logger):
+    """Few-shot 예시 블록을 미리 구성하는 노드"""
+
+    def prepare_scaffold(state: "State") -> dict:
+        # retrieve_documents와 같은 단계에서 실행되므로
+        # error/should_retry 등 공용 필드는 쓰지 않고 전용 필드만 반환합니다.
+        try:
+            few_shot_block, few_shot_indices = build_few_shot_block(
+                state.get("few_shot_examples", []),
+                max_examples=state.get("max_few_shot_examples", 5),
+                category_examples=state.get("category_examples", {}),
+                category_weights=state.get("category_weights", {}),
+                recent_few_shot_indices=state.get("recent_few_shot_indices", []),
+                num_buckets=state.get("few_shot_buckets", 0),
+            )
+            logger.info("✅ prepare_scaffold: Few-shot 예시 %s개 준비", len(few_shot_indices))
+            return {
+                "few_shot_block": few_shot_block or None,
+                "few_shot_indices": few_shot_indices,
+            }
+
+        except Exception as exc:  # pragma: no cover
+            # 실패 시 generate_mcq에서 기존 방식으로 예시를 구성합니다.
+            logger.warning(f"⚠️ prepare_scaffold 실패 (generate_mcq에서 재구성): {exc}")
+            return {"few_shot_block": None, "few_shot_indices": []}
+
+    return prepare_scaffold
@@ -6,12 +6,26 @@ Cross-Encoder Reranking을 통해 가장 관련성 높은 문서만 선택합니
 """
 
 import logging
+import os
 import random
 import hashlib
-from typing import TYPE_CHECKING, List
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from Utils import create_error_handler
 
+# xxhash가 설치되어 있으면 내용 해시 ID 계산에 사용 (선택적 의존성)
+# 없으면 기존과 같은 MD5 앞 16자리를 사용합니다 (둘 다 16자리 16진수)
+try:
+    from xxhash import xxh3_64_hexdigest as _content_hash  # type: ignore
+except ImportError:
+    def _content_hash(data: bytes) -> str:
+        return hashlib.md5(data).hexdigest()[:16]
+
 if TYPE_CHECKING:
     from langchain_google_vertexai import VectorSearchVectorStore
     from Utils import VectorSearchUtils
@@ -20,14 +34,41 @@ if TYPE_CHECKING:
 
 # Reranking을 위한 Cross-Encoder (lazy loading)
 _reranker = None
+# 동시 요청이 모델을 중복 로드하지 않도록 로딩 구간을 보호
+_reranker_lock = threading.Lock()
+# 후보 문서 전체를 한 번의 forward로 처리 (기본값 32는 후보가 많으면 배치가 나뉨)
+_RERANK_BATCH_SIZE = 1024
+
+def _configure_cpu_threads() -> None:
+    """
+    CPU 추론 시 PyTorch 연산 스레드 수를 설정합니다.
+    
+    컨테이너 환경에서는 기본 스레드 수가 1로 잡히는 경우가 많으므로
+    RERANKER_THREADS(기본값: CPU 코어 수)로 지정합니다. GPU가 있으면 건드리지 않습니다.
+    """
+    import torch
+    
+    if torch.cuda.is_available():
+        return
+    torch.set_num_threads(int(os.getenv("RERANKER_THREADS", os.cpu_count() or 4)))
+
 
 def get_reranker():
-    """Cross-Encoder 모델을 lazy loading으로 가져옵니다."""
+    """Cross-Encoder 모델을 lazy loading으로 가져옵니다 (스레드 안전)."""
     global _reranker
-    if _reranker is None:
+    if _reranker is not None:
+        return _reranker if _reranker != "not_available" else None
+    
+    with _reranker_lock:
+        if _reranker is not None:
+            return _reranker if _reranker != "not_available" else None
         try:
             from sentence_transformers import CrossEncoder
-            _reranker = CrossEncoder('cross-encoder/ms-marco-MiniLM-L-12-v2')
+            reranker = CrossEncoder('cross-encoder/ms-marco-MiniLM-L-12-v2')
+            # 추론 전용 (dropout 비활성화)
+            reranker.model.eval()
+            _configure_cpu_threads()
+            _reranker = reranker
         except ImportError as e:
             # sentence-transformers가 없으면 None 반환 (Reranking 건너뜀)
             print(f"⚠️  sentence-transformers 미설치: {e}")
@@ -40,6 +81,23 @@ def get_reranker():
     return _reranker if _reranker != "not_available" else None
 
 
+def warmup_reranker() -> bool:
+    """
+    Cross-Encoder를 미리 로드하고 한 번 추론하여 토크나이저/커널을 준비합니다.
+    
+    Reranking을 사용하는 경우 서버 시작 시 호출하면
+    첫 요청이 모델 로드 시간을 떠안지 않습니다.
+    
+    Returns:
+        bool: Reranker 사용 가능 여부
+    """
+    reranker = get_reranker()
+    if reranker is None:
+        return False
+    reranker.predict([["warmup", "warmup"]])
+    return True
+
+
 def get_document_id(doc: "Document") -> str:
     """
     문서의 고유 ID를 생성합니다.
@@ -50,29 +108,35 @@ def get_document_id(doc: "Document") -> str:
     Returns:
         문서 ID (metadata의 고유 ID 또는 내용 해시값)
     """
-    # metadata에 고유 ID가 있으면 사용
-    if hasattr(doc, 'metadata') and doc.metadata:
-        doc_id = doc.metadata.get('id') or doc.metadata.get('document_id')
+    metadata = getattr(doc, 'metadata', None)
+    if metadata:
+        # metadata에 고유 ID가 있으면 사용
+        doc_id = metadata.get('id') or metadata.get('document_id')
         if doc_id:
             return str(doc_id)
-    
-    # metadata에 title과 page_number 조합 사용
-    if hasattr(doc, 'metadata') and doc.metadata:
-        title = doc.metadata.get('title', '')
-        page = doc.metadata.get('page_number', '')
+        
+        # metadata에 title과 page_number 조합 사용
+        title = metadata.get('title', '')
+        page = metadata.get('page_number', '')
         if title and page:
             return f"{title}_{page}"
     
     # 내용 기반 해시값 생성 (fallback)
-    content = doc.page_content if hasattr(doc, 'page_content') else str(doc)
-    doc_hash = hashlib.md5(content.encode('utf-8')).hexdigest()[:16]
-    return f"hash_{doc_hash}"
+    content = getattr(doc, 'page_content', None)
+    if content is None:
+        content = str(doc)
+    return f"hash_{_content_hash(content.encode('utf-8'))}"
 
 
-def build_section_id(doc: "Document") -> str:
-    """문서 메타데이터를 활용해 섹션 ID를 생성합니다."""
-    metadata = doc.metadata if hasattr(doc, "metadata") and doc.metadata else {}
-    base_id = get_document_id(doc)
+def build_section_id(doc: "Document", base_id: Optional[str] = None) -> str:
+    """
+    문서 메타데이터를 활용해 섹션 ID를 생성합니다.
+    
+    base_id에 이미 계산한 get_document_id(doc) 값을 넘기면 재계산하지 않습니다.
+    """
+    metadata = getattr(doc, "metadata", None) or {}
+    if base_id is None:
+        base_id = get_document_id(doc)
     title = metadata.get("title", "")
     chapter = metadata.get("chapter", "")
     section = metadata.get("section", "")
@@ -117,18 +181,27 @@ def rerank_documents(
         # Query-Document 쌍 생성
         pairs = [[query, doc.page_content] for doc in documents]
         
-        # Cross-Encoder로 점수 계산
-        scores = reranker.predict(pairs)
+        # Cross-Encoder로 점수 계산 (진행 표시줄 출력 없이 단일 배치)
+        # inference_mode: autograd 기록 없이 추론 (버전에 관계없이 고정)
+        import torch
         
-        # 점수 기준 정렬
-        doc_scores = list(zip(documents, scores))
-        doc_scores.sort(key=lambda x: x[1], reverse=True)
+        with torch.inference_mode():
+            scores = reranker.predict(
+                pairs,
+                batch_size=_RERANK_BATCH_SIZE,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+            )
         
-        # 상위 K개 반환
-        reranked_docs = [doc for doc, score in doc_scores[:top_k]]
+        # 상위 K개만 부분 선택(O(N)) 후 그 안에서만 점수 순 정렬
+        # (len(documents) > top_k는 위에서 보장됨)
+        scores = np.asarray(scores)
+        top_idx = np.argpartition(-scores, top_k)[:top_k]
+        top_idx = top_idx[np.argsort(-scores[top_idx], kind="stable")]
+        reranked_docs = [documents[i] for i in top_idx]
         
         if logger:
-            logger.info(f"✅ Reranking 완료: {len(documents)}개 → {len(reranked_docs)}개")
+            logger.info("✅ Reranking 완료: %s개 → %s개", len(documents), len(reranked_docs))
         
         return reranked_docs
         
@@ -138,6 +211,331 @@ def rerank_documents(
         return documents[:top_k]
 
 
+class _AliasTable:
+    """
+    가중치 랜덤 선택용 별칭 테이블 (Vose's alias method)
+    
+    구성은 O(n), 선택은 난수 1회로 O(1)입니다.
+    """
+    
+    def __init__(self, items: List[str], weights: List[float]):
+        total = sum(weights)
+        if not items or total <= 0:
+            raise ValueError("가중치 합은 0보다 커야 합니다")
+        
+        n = len(items)
+        scaled = [w * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        
+        self.items = items
+        self._prob = prob
+        self._alias = alias
+    
+    def sample(self) -> str:
+        u = random.random() * len(self.items)
+        i = int(u)
+        return self.items[i] if u - i < self._prob[i] else self.items[self._alias[i]]
+
+
+class TopicSampler:
+    """
+    교재 구조 + Part/Chapter 가중치로 만든 주제 선택기
+    
+    가중치 목록과 별칭 테이블을 한 번만 구성해 두고 재시도/배치마다 재사용합니다.
+    get_topic_sampler로 얻으면 같은 구조·가중치에 대해 캐시된 인스턴스를 돌려줍니다.
+    """
+    
+    def __init__(
+        self,
+        topics_hierarchical: Dict[str, List[str]],
+        mcq_config: dict,
+        logger: Optional[logging.Logger] = None,
+    ):
+        if not topics_hierarchical:
+            raise ValueError("교재 구조가 없습니다 (topics_hierarchical 필요)")
+        
+        # Chapter 가중치 설정 가져오기
+        chapter_weights_config = mcq_config.get("chapter_weights", {})
+        part_weights = mcq_config.get("part_weights", {})
+        
+        # Part와 Chapter를 동일한 레벨에서 선택
+        # Part/Chapter 통합 선택 목록 생성
+        selection_options = {}  # {name: weight, ...}
+        part_to_chapters = {}   # {part: [chapters], ...}
+        
+        for part, chapters in topics_hierarchical.items():
+            # Part에 chapter_weights가 정의되어 있는지 확인
+            if part in chapter_weights_config:
+                # Chapter별로 개별 가중치 적용 (전체 비율)
+                part_chapter_weights = chapter_weights_config[part]
+                for chapter in chapters:
+                    weight = part_chapter_weights.get(chapter, 1.0)
+                    selection_options[chapter] = weight
+                    if chapter not in part_to_chapters:
+                        part_to_chapters[chapter] = part
+            else:
+                # Part 전체 가중치 사용
+                selection_options[part] = part_weights.get(part, 1.0)
+                part_to_chapters[part] = part
+        
+        if not selection_options:
+            raise ValueError("선택 가능한 Part/Chapter가 없습니다")
+        
+        if logger:
+            logger.debug("선택 옵션 (%s개): %s", len(selection_options), selection_options)
+        
+        self.topics_hierarchical = topics_hierarchical
+        self.chapter_weights_config = chapter_weights_config
+        self.part_to_chapters = part_to_chapters
+        self._names = _AliasTable(
+            list(selection_options.keys()), list(selection_options.values())
+        )
+        # Part가 선택된 경우의 Chapter 선택 테이블 (최근 Chapter 제외가 없을 때 사용)
+        self._chapters: Dict[str, _AliasTable] = {}
+        # Part별 Chapter 가중치 (chapters와 같은 순서, 최근 Chapter 제외 시 사용)
+        self._chapter_weights: Dict[str, List[float]] = {}
+        for part, chapters in topics_hierarchical.items():
+            if not chapters:
+                continue
+            chapter_weights_for_part = chapter_weights_config.get(part, {})
+            weights = [chapter_weights_for_part.get(ch, 1.0) for ch in chapters]
+            self._chapter_weights[part] = weights
+            if sum(weights) > 0:
+                self._chapters[part] = _AliasTable(list(chapters), weights)
+    
+    def sample(
+        self,
+        recent_chapters: List[str],
+        logger: logging.Logger,
+    ) -> Tuple[str, str, str]:
+        """가중치 기반으로 Part/Chapter를 선택하고 (part, chapter, query)를 반환합니다."""
+        selected_name = self._names.sample()
+        
+        # 선택된 것이 Part인지 Chapter인지 판단
+        if selected_name in self.topics_hierarchical:
+            # Part가 선택됨 → Chapter 가중치 기반 선택
+            selected_part = selected_name
+            chapters = self.topics_hierarchical[selected_part]
+            
+            if not chapters:
+                raise ValueError(f"Part '{selected_part}'에 Chapter가 없습니다")
+            
+            chapter_weights_for_part = self.chapter_weights_config.get(selected_part, {})
+            recent = set(recent_chapters)
+            available_chapters = [ch for ch in chapters if ch not in recent]
+            
+            table = self._chapters.get(selected_part)
+            if table is not None and (
+                len(available_chapters) == len(chapters) or not available_chapters
+            ):
+                # 제외할 최근 Chapter가 없거나 전부 최근 Chapter → 미리 만든 테이블 사용
+                selected_chapter = table.sample()
+                mode = "가중치 적용" if chapter_weights_for_part else (
+                    "균등 선택" if available_chapters else "전체 재사용"
+                )
+            elif chapter_weights_for_part:
+                # 미리 계산한 가중치에서 최근 Chapter만 빼고 선택 (모두 최근이면 전체에서 선택)
+                if not available_chapters:
+                    available_chapters, recent = chapters, set()
+                weights = [
+                    weight
+                    for ch, weight in zip(chapters, self._chapter_weights[selected_part])
+                    if ch not in recent
+                ]
+                selected_chapter = random.choices(available_chapters, weights=weights, k=1)[0]
+                mode = "가중치 적용"
+            else:
+                selected_chapter = random.choice(available_chapters or chapters)
+                mode = "균등 선택" if available_chapters else "전체 재사용"
+            logger.info("Part '%s' 선택 → Chapter '%s' (%s)", selected_part, selected_chapter, mode)
+        else:
+            # Chapter가 직접 선택됨
+            selected_chapter = selected_name
+            selected_part = self.part_to_chapters.get(selected_chapter, "N/A")
+            logger.info("✅ Chapter 직접 선택 (가중치): '%s' (Part: %s)", selected_chapter, selected_part)
+        
+        # 검색 쿼리 생성
+        if selected_part and selected_part != "N/A":
+            query = f"{selected_part} - {selected_chapter}"
+        else:
+            query = selected_chapter
+        logger.info("검색 쿼리: '%s'", query)
+        
+        return selected_part, selected_chapter, query
+
+
+# 구조/가중치 지문 → TopicSampler (구조가 바뀌면 새로 구성)
+_TOPIC_SAMPLER_CACHE: "OrderedDict[tuple, TopicSampler]" = OrderedDict()
+_TOPIC_SAMPLER_CACHE_SIZE = 8
+
+
+def get_topic_sampler(
+    topics_hierarchical: Dict[str, List[str]],
+    mcq_config: dict,
+    logger: Optional[logging.Logger] = None,
+) -> TopicSampler:
+    """
+    교재 구조와 가중치 설정에 해당하는 TopicSampler를 캐시에서 가져옵니다.
+    
+    캐시 키는 구조와 가중치의 내용(지문)이므로 내용이 바뀌면 자동으로 새로 구성됩니다.
+    """
+    chapter_weights = mcq_config.get("chapter_weights", {})
+    key = (
+        tuple((part, tuple(chapters)) for part, chapters in (topics_hierarchical or {}).items()),
+        tuple(sorted(mcq_config.get("part_weights", {}).items())),
+        tuple(
+            (part, tuple(sorted(weights.items())))
+            for part, weights in sorted(chapter_weights.items())
+        ),
+    )
+    sampler = _TOPIC_SAMPLER_CACHE.get(key)
+    if sampler is None:
+        sampler = TopicSampler(topics_hierarchical, mcq_config, logger)
+        _TOPIC_SAMPLER_CACHE[key] = sampler
+        while len(_TOPIC_SAMPLER_CACHE) > _TOPIC_SAMPLER_CACHE_SIZE:
+            _TOPIC_SAMPLER_CACHE.popitem(last=False)
+    else:
+        _TOPIC_SAMPLER_CACHE.move_to_end(key)
+    return sampler
+
+
+def select_random_topic(
+    topics_hierarchical: Dict[str, List[str]],
+    recent_chapters: List[str],
+    mcq_config: dict,
+    logger: logging.Logger,
+) -> Tuple[str, str, str]:
+    """
+    가중치 기반으로 Part/Chapter를 랜덤 선택하고 검색 쿼리를 만듭니다.
+    
+    retrieve_documents 노드와 배치 사전 검색(ForgeMode)에서 함께 사용합니다.
+    선택 테이블은 get_topic_sampler로 캐시되어 재시도/배치 간에 재사용됩니다.
+    
+    Args:
+        topics_hierarchical: 전체 교재 구조
+        recent_chapters: 최근 선택된 Chapter (가능하면 제외)
+        mcq_config: MCQ 생성 설정 (part_weights, chapter_weights)
+        logger: 로거 객체
+    
+    Returns:
+        (selected_part, selected_chapter, query)
+    
+    Raises:
+        ValueError: 교재 구조가 없거나 선택 가능한 항목이 없는 경우
+    """
+    if not topics_hierarchical:
+        raise ValueError("교재 구조가 없습니다 (topics_hierarchical 필요)")
+    
+    sampler = get_topic_sampler(topics_hierarchical, mcq_config, logger)
+    return sampler.sample(recent_chapters, logger)
+
+
+# 최근 사용 문서 ID 보관 개수 (recent_document_ids 순환 큐 크기)
+_RECENT_DOCUMENT_WINDOW = 20
+# 중복 방지에 사용하는 최근 사용 섹션/문서 수 (나머지는 재사용 허용)
+_USED_WINDOW = 5
+
+
+def _postprocess_documents(
+    documents: List["Document"],
+    state: "State",
+    k: int,
+    logger: logging.Logger,
+) -> Dict[str, Any]:
+    """
+    검색된 문서를 최종 컨텍스트 후보로 정리합니다 (주제 검색/랜덤 검색 공용).
+    
+    1. 최근 사용 문서 제외 (남은 문서가 k개 미만이면 전체 사용)
+    2. 랜덤 샘플링으로 k개 선택 (다양성 극대화)
+    3. 최근 사용 섹션/문서(각 최근 5개) 제외 (남은 문서가 부족하면 건너뜀)
+    4. recent_document_ids 갱신 (최근 20개 유지)
+    
+    문서 ID는 문서마다 한 번만 계산하여 필터링과 섹션 ID 구성에 재사용하며,
+    제외할 최근 문서가 없으면 샘플링 후 남은 k개에 대해서만 계산합니다.
+    
+    Returns:
+        State 업데이트 필드 (retrieved_documents, num_documents,
+        context_document_ids, context_section_ids, recent_document_ids)
+    """
+    # 최근 사용 문서 제외하여 다양성 보장
+    recent_doc_ids = state.get("recent_document_ids", [])
+    if recent_doc_ids:
+        doc_pairs = [(doc, get_document_id(doc)) for doc in documents]
+        recent_doc_id_set = set(recent_doc_ids)
+        filtered_pairs = [pair for pair in doc_pairs if pair[1] not in recent_doc_id_set]
+        
+        if len(filtered_pairs) >= k:
+            doc_pairs = filtered_pairs
+            logger.info("   최근 사용 문서 %s개 제외: %s개 문서 유지", len(recent_doc_ids), len(doc_pairs))
+        else:
+            # 필터링 결과가 k개 미만이면 전체 문서 사용 (다양성보다 품질 우선)
+            logger.info("   최근 사용 문서 제외 후 %s개만 남음, 전체 사용", len(filtered_pairs))
+    else:
+        # ID는 샘플링 후 남은 문서에 대해서만 계산
+        doc_pairs = [(doc, None) for doc in documents]
+    
+    # 랜덤 샘플링 (다양성 극대화)
+    if len(doc_pairs) > k:
+        original_count = len(doc_pairs)
+        doc_pairs = random.sample(doc_pairs, k)
+        logger.info("✅ 랜덤 선택: %s개 → %s개 (다양성 우선)", original_count, k)
+    else:
+        logger.info("   랜덤 선택 건너뜀 (문서 %s개 ≤ %s개)", len(doc_pairs), k)
+    
+    triplets = []
+    for doc, doc_id in doc_pairs:
+        doc_id = doc_id or get_document_id(doc)
+        triplets.append((doc, doc_id, build_section_id(doc, doc_id)))
+    
+    # 중복 방지: 최근 5개만 추적 (완화된 정책, 나머지는 재사용 허용)
+    used_sections = set(state.get("used_section_ids", [])[-_USED_WINDOW:])
+    used_docs = set(state.get("used_document_ids", [])[-_USED_WINDOW:])
+
+    if used_sections or used_docs:
+        filtered_triplets = [
+            triplet for triplet in triplets
+            if triplet[2] not in used_sections and triplet[1] not in used_docs
+        ]
+
+        # 필터링 후 문서가 충분하면 사용, 부족하면 필터링 무시
+        min_required = max(3, k // 2)  # 최소 3개 또는 k의 절반
+        
+        if len(filtered_triplets) >= min_required:
+            triplets = filtered_triplets
+            logger.info("   중복 제거: %s개 (최근 5개 제외)", len(triplets))
+        else:
+            # 필터링하지 않고 원본 사용 (다양성보다 문서 수 우선)
+            logger.info("   중복 제거 건너뜀 (필터링 후 %s개 < %s개)", len(filtered_triplets), min_required)
+
+    documents = [triplet[0] for triplet in triplets]
+    document_ids = [triplet[1] for triplet in triplets]
+    section_ids = [triplet[2] for triplet in triplets]
+    
+    fields: Dict[str, Any] = {
+        "retrieved_documents": documents,
+        "num_documents": len(documents),
+        "context_document_ids": document_ids,
+        "context_section_ids": section_ids,
+    }
+    if documents:
+        # 검색된 문서 ID를 recent_document_ids에 추가 (순환 큐 방식, 최대 20개)
+        # State에는 체크포인트 직렬화를 위해 리스트로 저장
+        recent = deque(recent_doc_ids, maxlen=_RECENT_DOCUMENT_WINDOW)
+        recent.extend(document_ids)
+        fields["recent_document_ids"] = list(recent)
+    return fields
+
+
 def create_mcq_retrieve_documents_node(
     vector_store: "VectorSearchVectorStore",
     vector_search_utils: "VectorSearchUtils",
@@ -147,6 +545,14 @@ def create_mcq_retrieve_documents_node(
     """
     MCQ용 문서 검색 노드를 생성하는 팩토리 함수 (랜덤 주제 선택)
     
+    랜덤 주제 쿼리("Part - Chapter")는 교재 Chapter 수만큼의 유한한 집합이므로
+    (쿼리, initial_k)별 검색 결과를 LRU + TTL로 캐시하여 벡터 검색 RPC를 생략합니다.
+    retriever_config의 search_cache_size(기본값: 64, 0이면 사용 안 함)와
+    search_cache_ttl(초, 기본값: 600)로 조정합니다.
+    
+    use_reranker가 True이면 검색된 initial_k개 문서를 Cross-Encoder로 재순위화하여
+    상위 2k개만 남긴 뒤 그 안에서 랜덤 샘플링합니다 (관련성 확보 + 다양성 유지).
+    
     Args:
         vector_store: 벡터 스토어 객체
         vector_search_utils: 벡터 검색 유틸리티
@@ -159,10 +565,50 @@ def create_mcq_retrieve_documents_node(
     # 에러 핸들러 생성
     error_handler = create_error_handler(logger)
     
-    # MCQ 설정에서 Part 가중치 가져오기
+    # MCQ 설정 (Part/Chapter 가중치)
     from config import get_mcq_generation_config
     mcq_config = get_mcq_generation_config()
-    part_weights = mcq_config.get("part_weights", {})
+    
+    # (쿼리, initial_k) → (저장 시각, 문서 리스트) (LRU, 배치 동시 실행 대비 Lock)
+    search_cache_size = int(retriever_config.get("search_cache_size", 64))
+    search_cache_ttl = float(retriever_config.get("search_cache_ttl", 600.0))
+    search_cache: "OrderedDict[Tuple[str, int], Tuple[float, List[Document]]]" = OrderedDict()
+    search_cache_lock = threading.Lock()
+    
+    use_reranker = bool(retriever_config.get("use_reranker", False))
+    
+    def narrow_candidates(query: str, documents: List["Document"], k: int) -> List["Document"]:
+        """Reranking 사용 시 관련성 상위 2k개로 후보를 좁힙니다 (랜덤 샘플링 전)."""
+        if not use_reranker:
+            return documents
+        return rerank_documents(query, documents, top_k=2 * k, logger=logger)
+    
+    def search_documents(query: str, initial_k: int) -> List["Document"]:
+        """벡터 검색 (같은 쿼리는 캐시된 결과의 복사본 반환)"""
+        if search_cache_size <= 0:
+            return vector_search_utils.search_similar_documents(
+                vector_store, query, initial_k, logger
+            )
+        
+        key = (query, initial_k)
+        now = time.monotonic()
+        with search_cache_lock:
+            entry = search_cache.get(key)
+            if entry is not None and now - entry[0] <= search_cache_ttl:
+                search_cache.move_to_end(key)
+                logger.debug("검색 결과 캐시 사용: '%s'", query)
+                return list(entry[1])
+        
+        documents = vector_search_utils.search_similar_documents(
+            vector_store, query, initial_k, logger
+        )
+        if documents:
+            with search_cache_lock:
+                search_cache[key] = (now, list(documents))
+                search_cache.move_to_end(key)
+                while len(search_cache) > search_cache_size:
+                    search_cache.popitem(last=False)
+        return documents
     
     def retrieve_documents(state: "State") -> dict:
         """
@@ -189,38 +635,36 @@ def create_mcq_retrieve_documents_node(
             
             if user_topic:
                 # 사용자가 주제를 입력한 경우
-                logger.info(f"사용자 입력 주제로 검색: '{user_topic}'")
+                logger.info("사용자 입력 주제로 검색: '%s'", user_topic)
                 query = user_topic
                 
                 # 벡터 검색 수행
                 initial_k = retriever_config.get("initial_k", 10)
                 k = retriever_config.get("k", 3)
-                logger.debug(f"주제 기반 검색: '{query}', initial_k={initial_k}, final_k={k}")
+                logger.debug("주제 기반 검색: '%s', initial_k=%s, final_k=%s", query, initial_k, k)
                 
-                documents = vector_search_utils.search_similar_documents(
-                    vector_store, query, initial_k, logger
-                )
+                documents = search_documents(query, initial_k)
+                
+                # 문서별 메타데이터를 한 번만 읽어 필터링/다수결에 함께 사용
+                rows = [(doc, getattr(doc, 'metadata', None) or {}) for doc in documents]
                 
                 # 주제 기반 필터링 (Part/Chapter 키워드 포함)
-                if documents and user_topic:
-                    # 사용자 주제에 Part/Chapter 키워드가 있으면 필터링
-                    filtered_docs = []
-                    for doc in documents:
-                        metadata = doc.metadata if hasattr(doc, 'metadata') else {}
-                        part = metadata.get('part', '')
-                        chapter = metadata.get('chapter', '')
-                        
-                        # 주제가 Part나 Chapter에 포함되어 있는지 확인
-                        if (user_topic.lower() in part.lower() or 
-                            user_topic.lower() in chapter.lower()):
-                            filtered_docs.append(doc)
+                if rows:
+                    # 주제가 Part나 Chapter에 포함되어 있는지 확인
+                    topic_lower = user_topic.lower()
+                    filtered_rows = [
+                        (doc, metadata) for doc, metadata in rows
+                        if topic_lower in metadata.get('part', '').lower()
+                        or topic_lower in metadata.get('chapter', '').lower()
+                    ]
                     
                     # 필터링 결과가 있으면 사용
-                    if filtered_docs:
-                        logger.info(f"주제 필터링: {len(documents)}개 → {len(filtered_docs)}개 ('{user_topic}' 포함)")
-                        documents = filtered_docs
+                    if filtered_rows:
+                        logger.info("주제 필터링: %s개 → %s개 ('%s' 포함)", len(rows), len(filtered_rows), user_topic)
+                        rows = filtered_rows
+                        documents = [doc for doc, _ in rows]
                     else:
-                        logger.info(f"주제 필터링 결과 없음. 전체 검색 결과 사용")
+                        logger.info("주제 필터링 결과 없음. 전체 검색 결과 사용")
                 
                 if not documents:
                     # 주제로 검색 실패 시 랜덤으로 fallback
@@ -228,97 +672,31 @@ def create_mcq_retrieve_documents_node(
                     user_topic = None  # 랜덤 모드로 전환
                 else:
                     # 문서 메타데이터에서 Part/Chapter 추출 (다수결 방식)
-                    part_counts = {}
-                    chapter_counts = {}
-                    
-                    for doc in documents:
-                        metadata = doc.metadata if hasattr(doc, 'metadata') else {}
-                        part = metadata.get('part', 'N/A')
-                        chapter = metadata.get('chapter', 'N/A')
-                        
-                        part_counts[part] = part_counts.get(part, 0) + 1
-                        chapter_counts[chapter] = chapter_counts.get(chapter, 0) + 1
-                    
-                    # 가장 많이 나온 Part/Chapter 선택
-                    selected_part = max(part_counts, key=part_counts.get) if part_counts else 'N/A'
-                    selected_chapter = max(chapter_counts, key=chapter_counts.get) if chapter_counts else 'N/A'
+                    # (문서 목록을 한 번만 순회하여 두 카운터를 함께 채움)
+                    part_counts: "Counter[str]" = Counter()
+                    chapter_counts: "Counter[str]" = Counter()
                     
-                    logger.info(f"주제 검색 성공: {len(documents)}개 문서 발견")
-                    logger.info(f"추출된 범위 (다수결): {selected_part} - {selected_chapter}")
-                    logger.debug(f"Part 분포: {part_counts}")
-                    logger.debug(f"Chapter 분포: {chapter_counts}")
+                    for _, metadata in rows:
+                        part_counts[metadata.get('part', 'N/A')] += 1
+                        chapter_counts[metadata.get('chapter', 'N/A')] += 1
                     
-                    # 최근 사용 문서 제외하여 다양성 보장
-                    recent_doc_ids = state.get("recent_document_ids", [])
-                    if recent_doc_ids:
-                        filtered_documents = []
-                        for doc in documents:
-                            doc_id = get_document_id(doc)
-                            if doc_id not in recent_doc_ids:
-                                filtered_documents.append(doc)
-                        
-                        if len(filtered_documents) >= k:
-                            documents = filtered_documents
-                            logger.info(f"   최근 사용 문서 {len(recent_doc_ids)}개 제외: {len(documents)}개 문서 유지")
-                        else:
-                            logger.info(f"   최근 사용 문서 제외 후 {len(filtered_documents)}개만 남음, 전체 사용")
-                            # 필터링 결과가 k개 미만이면 전체 문서 사용 (다양성보다 품질 우선)
+                    # 가장 많이 나온 Part/Chapter 선택 (동률이면 먼저 나온 값)
+                    selected_part = part_counts.most_common(1)[0][0] if part_counts else 'N/A'
+                    selected_chapter = chapter_counts.most_common(1)[0][0] if chapter_counts else 'N/A'
                     
-                    # 랜덤 샘플링 (다양성 극대화)
-                    if len(documents) > k:
-                        original_count = len(documents)
-                        documents = random.sample(documents, k)
-                        logger.info(f"✅ 랜덤 선택: {original_count}개 → {k}개 (다양성 우선)")
-                    else:
-                        logger.info(f"   랜덤 선택 건너뜀 (문서 {len(documents)}개 ≤ {k}개)")
-                    
-                    section_ids = [build_section_id(doc) for doc in documents]
-                    document_ids = [get_document_id(doc) for doc in documents]
-                    
-                    # 중복 방지: 최근 5개만 추적 (완화된 정책)
-                    used_sections_all = state.get("used_section_ids", [])
-                    used_docs_all = state.get("used_document_ids", [])
+                    logger.info("주제 검색 성공: %s개 문서 발견", len(documents))
+                    logger.info("추출된 범위 (다수결): %s - %s", selected_part, selected_chapter)
+                    logger.debug("Part 분포: %s", part_counts)
+                    logger.debug("Chapter 분포: %s", chapter_counts)
                     
-                    # 최근 5개만 사용 (나머지는 재사용 허용)
-                    used_sections = set(used_sections_all[-5:]) if used_sections_all else set()
-                    used_docs = set(used_docs_all[-5:]) if used_docs_all else set()
-
-                    if used_sections or used_docs:
-                        filtered_triplets = [
-                            (doc, doc_id, section_id)
-                            for doc, doc_id, section_id in zip(documents, document_ids, section_ids)
-                            if section_id not in used_sections and doc_id not in used_docs
-                        ]
-
-                        # 필터링 후 문서가 충분하면 사용, 부족하면 필터링 무시
-                        min_required = max(3, k // 2)  # 최소 3개 또는 k의 절반
-                        
-                        if len(filtered_triplets) >= min_required:
-                            documents = [triplet[0] for triplet in filtered_triplets]
-                            document_ids = [triplet[1] for triplet in filtered_triplets]
-                            section_ids = [triplet[2] for triplet in filtered_triplets]
-                            logger.info(f"   중복 제거: {len(documents)}개 (최근 5개 제외)")
-                        else:
-                            logger.info(f"   중복 제거 건너뜀 (필터링 후 {len(filtered_triplets)}개 < {min_required}개)")
-                            # 필터링하지 않고 원본 사용 (다양성보다 문서 수 우선)
-
-                    # recent_document_ids 업데이트
+                    documents = narrow_candidates(query, documents, k)
                     return_fields = {
                         "selected_part": selected_part,
                         "selected_chapter": selected_chapter,
                         "selected_topic_query": query,
-                        "retrieved_documents": documents,
-                        "num_documents": len(documents),
+                        **_postprocess_documents(documents, state, k, logger),
                     }
-                    
-                    if documents:
-                        updated_recent_ids = (recent_doc_ids + document_ids)[-20:]  # 최근 20개만 유지
-                        return_fields["recent_document_ids"] = updated_recent_ids
-                        return_fields["context_document_ids"] = document_ids
-                        return_fields["context_section_ids"] = section_ids
-                    else:
-                        return_fields["context_document_ids"] = []
-                        return_fields["context_section_ids"] = []
+                    documents = return_fields["retrieved_documents"]
                     
                     # 성공 처리 (early return)
                     return error_handler.handle_success(
@@ -327,107 +705,31 @@ def create_mcq_retrieve_documents_node(
                         return_fields=return_fields
                     )
             
-            # 1. 교재 구조 가져오기 (랜덤 모드)
-            topics_hierarchical = state.get("topics_hierarchical", {})
-            
-            if not topics_hierarchical:
-                raise ValueError("교재 구조가 없습니다 (topics_hierarchical 필요)")
-            
-            # 2. Chapter 가중치 설정 가져오기
-            chapter_weights_config = mcq_config.get("chapter_weights", {})
-            
-            # 3. Part와 Chapter를 동일한 레벨에서 선택
-            # Part/Chapter 통합 선택 목록 생성
-            selection_options = {}  # {name: weight, ...}
-            part_to_chapters = {}   # {part: [chapters], ...}
-            
-            for part, chapters in topics_hierarchical.items():
-                # Part에 chapter_weights가 정의되어 있는지 확인
-                if part in chapter_weights_config:
-                    # Chapter별로 개별 가중치 적용 (전체 비율)
-                    part_chapter_weights = chapter_weights_config[part]
-                    for chapter in chapters:
-                        weight = part_chapter_weights.get(chapter, 1.0)
-                        selection_options[chapter] = weight
-                        if chapter not in part_to_chapters:
-                            part_to_chapters[chapter] = part
-                    logger.debug(f"Part '{part}': Chapter별 개별 가중치 적용")
-                else:
-                    # Part 전체 가중치 사용
-                    part_weight = part_weights.get(part, 1.0)
-                    selection_options[part] = part_weight
-                    part_to_chapters[part] = part
-                    logger.debug(f"Part '{part}': 전체 가중치 {part_weight}")
-            
-            if not selection_options:
-                raise ValueError("선택 가능한 Part/Chapter가 없습니다")
-            
-            # 4. 가중치 기반 랜덤 선택
-            names = list(selection_options.keys())
-            weights = list(selection_options.values())
-            
-            logger.debug(f"선택 옵션 ({len(names)}개): {dict(zip(names, weights))}")
-            
-            selected_name = random.choices(names, weights=weights, k=1)[0]
-            
-            # 5. 선택된 것이 Part인지 Chapter인지 판단
-            if selected_name in topics_hierarchical:
-                # Part가 선택됨 → Chapter 가중치 기반 선택
-                selected_part = selected_name
-                chapters = topics_hierarchical[selected_part]
-                
-                if not chapters:
-                    raise ValueError(f"Part '{selected_part}'에 Chapter가 없습니다")
-                
-                # Chapter 가중치 확인
-                chapter_weights_for_part = chapter_weights_config.get(selected_part, {})
-                
-                if chapter_weights_for_part:
-                    # Chapter 가중치 적용
-                    recent_chapters = state.get("recent_chapters", [])
-                    available_chapters = [ch for ch in chapters if ch not in recent_chapters]
-                    
-                    if not available_chapters:
-                        available_chapters = chapters
-                    
-                    chapter_weights_list = [
-                        chapter_weights_for_part.get(ch, 1.0) for ch in available_chapters
-                    ]
-                    
-                    selected_chapter = random.choices(available_chapters, weights=chapter_weights_list, k=1)[0]
-                    logger.info(f"Part '{selected_part}' 선택 → Chapter '{selected_chapter}' (가중치 적용)")
-                else:
-                    # Chapter 가중치 없으면 균등 선택
-                    recent_chapters = state.get("recent_chapters", [])
-                    available_chapters = [ch for ch in chapters if ch not in recent_chapters]
-                    
-                    if available_chapters:
-                        selected_chapter = random.choice(available_chapters)
-                        logger.info(f"Part '{selected_part}' 선택 → Chapter '{selected_chapter}' (균등 선택)")
-                    else:
-                        selected_chapter = random.choice(chapters)
-                        logger.info(f"Part '{selected_part}' 선택 → Chapter '{selected_chapter}' (전체 재사용)")
+            # 1~6. 주제 선택 및 검색 쿼리 생성
+            #      배치 생성 시에는 ForgeMode가 미리 검색한 결과(precomputed_retrieval)를 사용
+            precomputed = state.get("precomputed_retrieval")
+            if precomputed:
+                selected_part = precomputed["selected_part"]
+                selected_chapter = precomputed["selected_chapter"]
+                query = precomputed["query"]
+                logger.info("사전 검색 결과 사용: '%s'", query)
             else:
-                # Chapter가 직접 선택됨
-                selected_chapter = selected_name
-                selected_part = part_to_chapters.get(selected_chapter, "N/A")
-                logger.info(f"✅ Chapter 직접 선택 (가중치): '{selected_chapter}' (Part: {selected_part})")
-            
-            # 6. 검색 쿼리 생성
-            if selected_part and selected_part != "N/A":
-                query = f"{selected_part} - {selected_chapter}"
-            else:
-                query = selected_chapter
-            logger.info(f"검색 쿼리: '{query}'")
+                selected_part, selected_chapter, query = select_random_topic(
+                    state.get("topics_hierarchical", {}),
+                    state.get("recent_chapters", []),
+                    mcq_config,
+                    logger,
+                )
             
             # 7. 벡터 검색 수행 (초기 검색)
             initial_k = retriever_config.get("initial_k", 10)  # Reranking 전 초기 검색 개수
             k = retriever_config.get("k", 3)  # 최종 반환할 개수
-            logger.debug(f"검색 파라미터: initial_k={initial_k}, final_k={k}")
+            logger.debug("검색 파라미터: initial_k=%s, final_k=%s", initial_k, k)
             
-            documents = vector_search_utils.search_similar_documents(
-                vector_store, query, initial_k, logger
-            )
+            if precomputed:
+                documents = list(precomputed.get("documents") or [])
+            else:
+                documents = search_documents(query, initial_k)
             
             if not documents:
                 # 검색 결과 없음 에러 (복구 가능)
@@ -442,85 +744,24 @@ def create_mcq_retrieve_documents_node(
                         "selected_topic_query": query,
                         "retrieved_documents": [],
                         "num_documents": 0,
-                                    "context_document_ids": [],
                         "context_document_ids": [],
                         "context_section_ids": [],
+                        "precomputed_retrieval": None,  # 재시도 시 새로 검색
                     }
                 )
             
-            logger.info(f"✅ 초기 문서 검색 완료: {len(documents)}개 문서 발견")
-            
-            # 7-1. 최근 사용 문서 제외하여 다양성 보장
-            recent_doc_ids = state.get("recent_document_ids", [])
-            if recent_doc_ids:
-                filtered_documents = []
-                for doc in documents:
-                    doc_id = get_document_id(doc)
-                    if doc_id not in recent_doc_ids:
-                        filtered_documents.append(doc)
-                
-                if len(filtered_documents) >= k:
-                    documents = filtered_documents
-                    logger.info(f"   최근 사용 문서 {len(recent_doc_ids)}개 제외: {len(documents)}개 문서 유지")
-                else:
-                    logger.info(f"   최근 사용 문서 제외 후 {len(filtered_documents)}개만 남음, 전체에서 재검색")
-                    # 필터링 결과가 k개 미만이면 전체 문서 사용 (다양성보다 품질 우선)
-            
-            # 8. 랜덤 샘플링 (다양성 극대화)
-            if len(documents) > k:
-                original_count = len(documents)
-                documents = random.sample(documents, k)
-                logger.info(f"✅ 랜덤 선택: {original_count}개 → {k}개 (다양성 우선)")
-            else:
-                logger.info(f"   랜덤 선택 건너뜀 (문서 {len(documents)}개 ≤ {k}개)")
-            
-            section_ids = [build_section_id(doc) for doc in documents]
-            document_ids = [get_document_id(doc) for doc in documents]
-            
-            # 중복 방지: 최근 5개만 추적 (완화된 정책)
-            used_sections_all = state.get("used_section_ids", [])
-            used_docs_all = state.get("used_document_ids", [])
+            logger.info("✅ 초기 문서 검색 완료: %s개 문서 발견", len(documents))
             
-            # 최근 5개만 사용 (나머지는 재사용 허용)
-            used_sections = set(used_sections_all[-5:]) if used_sections_all else set()
-            used_docs = set(used_docs_all[-5:]) if used_docs_all else set()
-
-            if used_sections or used_docs:
-                filtered_triplets = [
-                    (doc, doc_id, section_id)
-                    for doc, doc_id, section_id in zip(documents, document_ids, section_ids)
-                    if section_id not in used_sections and doc_id not in used_docs
-                ]
-
-                # 필터링 후 문서가 충분하면 사용, 부족하면 필터링 무시
-                min_required = max(3, k // 2)  # 최소 3개 또는 k의 절반
-                
-                if len(filtered_triplets) >= min_required:
-                    documents = [triplet[0] for triplet in filtered_triplets]
-                    document_ids = [triplet[1] for triplet in filtered_triplets]
-                    section_ids = [triplet[2] for triplet in filtered_triplets]
-                    logger.info(f"   중복 제거: {len(documents)}개 (최근 5개 제외)")
-                else:
-                    logger.info(f"   중복 제거 건너뜀 (필터링 후 {len(filtered_triplets)}개 < {min_required}개)")
-                    # 필터링하지 않고 원본 사용 (다양성보다 문서 수 우선)
-
-            # 8-1. 검색된 문서 ID를 recent_document_ids에 추가 (순환 큐 방식, 최대 20개)
+            # 7-1 ~ 8-1. (Reranking) 최근/사용 문서 제외, 랜덤 샘플링, 문서/섹션 ID 구성
+            documents = narrow_candidates(query, documents, k)
             return_fields = {
                 "selected_part": selected_part,
                 "selected_chapter": selected_chapter,
                 "selected_topic_query": query,
-                "retrieved_documents": documents,
-                "num_documents": len(documents),
+                **_postprocess_documents(documents, state, k, logger),
+                "precomputed_retrieval": None,  # 사전 검색 결과는 한 번만 사용
             }
-            
-            if documents:
-                updated_recent_ids = (recent_doc_ids + document_ids)[-20:]  # 최근 20개만 유지
-                return_fields["recent_document_ids"] = updated_recent_ids
-                return_fields["context_document_ids"] = document_ids
-                return_fields["context_section_ids"] = section_ids
-            else:
-                return_fields["context_document_ids"] = []
-                return_fields["context_section_ids"] = []
+            documents = return_fields["retrieved_documents"]
             
             return error_handler.handle_success(
                 node_name="retrieve_documents",
@@ -541,6 +782,7 @@ def create_mcq_retrieve_documents_node(
                     "num_documents": 0,
                     "context_document_ids": [],
                     "context_section_ids": [],
+                    "precomputed_retrieval": None,
                 }
             )
     
@@ -70,7 +70,7 @@ def create_mcq_select_prompt_node(logger: logging.Logger):
             selected_part = state.get("selected_part")
             selected_chapter = state.get("selected_chapter")
             
-            logger.info(f"선택된 범위: Part={selected_part}, Chapter={selected_chapter}")
+            logger.info("선택된 범위: Part=%s, Chapter=%s", selected_part, selected_chapter)
             
             # 프롬프트 디렉토리 경로 (절대 경로)
             base_path = Path(__file__).resolve().parent.parent.parent
@@ -99,7 +99,7 @@ def create_mcq_select_prompt_node(logger: logging.Logger):
             retriever_prompt = default_retriever_file.read_text(encoding="utf-8")
             
             prompt_source = "기본"
-            logger.info(f"기본 프롬프트 로드 완료")
+            logger.info("기본 프롬프트 로드 완료")
             
             # Part별 프롬프트 확인 및 오버라이드
             if selected_part:
@@ -111,15 +111,15 @@ def create_mcq_select_prompt_node(logger: logging.Logger):
                     if part_system_file.exists():
                         system_prompt = part_system_file.read_text(encoding="utf-8")
                         prompt_source = f"Part({selected_part})"
-                        logger.info(f"Part별 시스템 프롬프트 적용: {selected_part}")
+                        logger.info("Part별 시스템 프롬프트 적용: %s", selected_part)
                     
                     # Part별 retriever 프롬프트
                     part_retriever_file = part_dir / "retriever_prompt.txt"
                     if part_retriever_file.exists():
                         retriever_prompt = part_retriever_file.read_text(encoding="utf-8")
-                        logger.info(f"Part별 retriever 프롬프트 적용: {selected_part}")
+                        logger.info("Part별 retriever 프롬프트 적용: %s", selected_part)
                 else:
-                    logger.debug(f"Part 디렉토리 없음: {part_dir}")
+                    logger.debug("Part 디렉토리 없음: %s", part_dir)
             
             # Chapter별 프롬프트 확인 및 오버라이드 (최우선)
             if selected_part and selected_chapter:
@@ -147,7 +147,7 @@ def create_mcq_select_prompt_node(logger: logging.Logger):
                             f"{selected_part}/{selected_chapter}"
                         )
                 else:
-                    logger.debug(f"Chapter 디렉토리 없음: {chapter_dir}")
+                    logger.debug("Chapter 디렉토리 없음: %s", chapter_dir)
             
             # 프롬프트 크기 정보
             system_size = len(system_prompt)
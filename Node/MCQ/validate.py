@@ -138,17 +138,17 @@ def create_mcq_validate_node(logger: logging.Logger):
         if not mcq["question"].strip():
             errors.append("question이 비어있음")
         
-        # explanation 검증 (문자열 또는 리스트)
+        # explanation 검증 (리스트, 캐시된 이전 형식의 문자열도 허용)
         explanation = mcq["explanation"]
         if isinstance(explanation, str):
             # 문자열 형식
             if not explanation.strip():
                 errors.append("explanation이 비어있음")
         elif isinstance(explanation, list):
-            # 리스트 형식: 4개 항목이어야 함
-            if len(explanation) != 4:
+            # 리스트 형식: 전체 해설 1개 또는 보기별 해설 4개
+            if len(explanation) not in (1, 4):
                 errors.append(
-                    f"explanation 리스트가 4개가 아님 (현재: {len(explanation)})"
+                    f"explanation 리스트가 1개 또는 4개가 아님 (현재: {len(explanation)})"
                 )
             # 각 항목이 비어있지 않은지 확인
             for i, expl in enumerate(explanation):
@@ -4,23 +4,18 @@ RAG 노드 모듈
 RAG 워크플로우의 노드 함수들
 
 구조:
-- retrieve.py: 문서 검색
-- context.py: 컨텍스트 포맷팅
-- answer.py: 답변 생성
-- output.py: 출력 포맷팅
+- route.py: 질문 라우팅
+- retrieve.py: 문서 검색 + 컨텍스트 포맷팅
+- answer.py: 답변 생성 + 출력 포맷팅
 """
 
 from Node.RAG.route import create_route_question_node
 from Node.RAG.retrieve import create_retrieve_documents_node
-from Node.RAG.context import create_format_context_node
 from Node.RAG.answer import create_generate_answer_node
-from Node.RAG.output import create_format_output_node
 
 __all__ = [
     "create_route_question_node",
     "create_retrieve_documents_node",
-    "create_format_context_node",
     "create_generate_answer_node",
-    "create_format_output_node",
 ]
 
@@ -1,15 +1,16 @@
 """
 Answer 노드
 
-LLM을 사용하여 답변을 생성하는 노드
+LLM을 사용하여 답변을 생성하고 최종 출력(출처 문서)을 정리하는 노드
 """
 
 import logging
 from typing import TYPE_CHECKING
 
 from langchain_core.output_parsers import StrOutputParser
+from langgraph.types import StreamWriter
 from State import State
-from Utils import create_error_handler
+from Utils import build_source_documents, create_error_handler
 
 if TYPE_CHECKING:
     from langchain_core.prompts import ChatPromptTemplate
@@ -26,7 +27,10 @@ def create_generate_answer_node(
     답변 생성 노드를 생성하는 팩토리 함수
     
     LangChain 체인 방식을 사용하여 프롬프트 -> LLM -> 문자열 변환을
-    파이프라인으로 처리합니다.
+    파이프라인으로 처리합니다. 답변은 chain.astream으로 토큰 단위로 받아
+    stream_mode="custom" 이벤트({"node", "token"})로 즉시 내보냅니다.
+    출처 문서 정리도 함께 수행하여
+    별도 format_output 노드(추가 super-step)를 두지 않습니다.
     
     Args:
         llm: VertexAI LLM 객체
@@ -45,18 +49,31 @@ def create_generate_answer_node(
     # 에러 핸들러 생성
     error_handler = create_error_handler(logger)
     
-    def generate_answer(state: State) -> dict:
+    async def _stream_answer(chain, inputs: dict, writer: StreamWriter) -> str:
+        """체인 출력을 토큰 단위로 writer에 전달하고 전체 답변을 반환합니다."""
+        chunks = []
+        async for chunk in chain.astream(inputs):
+            if not chunk:
+                continue
+            chunks.append(chunk)
+            writer({"node": "generate_answer", "token": chunk})
+        return "".join(chunks)
+    
+    async def generate_answer(state: State, writer: StreamWriter) -> dict:
         """
-        노드 3: 답변 생성
+        노드 3: 답변 생성 + 출력 포맷팅
         
-        LLM을 사용하여 질문에 대한 답변을 생성합니다.
+        LLM을 사용하여 질문에 대한 답변을 생성하고,
+        출처 문서 메타데이터를 사용자 표시 형식으로 정리합니다.
         
         Args:
             state: 현재 State
+            writer: LangGraph StreamWriter (stream_mode="custom"이 아니면 no-op)
         
         Returns:
             업데이트할 필드만 포함한 딕셔너리
             - answer: 생성된 답변
+            - source_documents: 출처 문서 정보 리스트
         
         Note:
             StrOutputParser를 사용하여 LLM 응답을 자동으로 문자열로 변환합니다.
@@ -74,19 +91,31 @@ def create_generate_answer_node(
                 if chat_chain is None:
                     answer = "죄송합니다. 현재 일반 대화를 처리할 수 없습니다."
                 else:
-                    answer = chat_chain.invoke({"question": question})
+                    answer = await _stream_answer(
+                        chat_chain, {"question": question}, writer
+                    )
             else:
                 logger.debug(f"파이프라인: rag (컨텍스트 길이: {len(context)}자)")
-                answer = rag_chain.invoke({
-                    "question": question,
-                    "context": context,
-                })
+                answer = await _stream_answer(
+                    rag_chain,
+                    {"question": question, "context": context},
+                    writer,
+                )
+            
+            # 출처 문서 정리 (chat 파이프라인은 context가 비어 있음)
+            source_documents = build_source_documents(state.get("context") or [])
             
             # 성공 처리
             return error_handler.handle_success(
                 node_name="generate_answer",
-                message=f"{len(answer)}자 답변 생성 완료",
-                return_fields={"answer": answer}
+                message=(
+                    f"{len(answer)}자 답변 생성 완료 "
+                    f"(출처 {len(source_documents)}개)"
+                ),
+                return_fields={
+                    "answer": answer,
+                    "source_documents": source_documents,
+                }
             )
             
         except Exception as e:
@@ -97,7 +126,10 @@ def create_generate_answer_node(
                 node_name="generate_answer",
                 recoverable=True,
                 custom_message="답변 생성 실패",
-                return_fields={"answer": "죄송합니다. 답변 생성 중 오류가 발생했습니다."}
+                return_fields={
+                    "answer": "죄송합니다. 답변 생성 중 오류가 발생했습니다.",
+                    "source_documents": [],
+                }
             )
     
     return generate_answer
@@ -1,14 +1,14 @@
 """
 Retrieve 노드
 
-벡터 스토어에서 관련 문서를 검색하는 노드
+벡터 스토어에서 관련 문서를 검색하고 LLM용 컨텍스트로 포맷팅하는 노드
 """
 
 import logging
 from typing import TYPE_CHECKING
 
 from State import State
-from Utils import create_error_handler
+from Utils import create_error_handler, format_documents_for_llm
 
 if TYPE_CHECKING:
     from langchain_google_vertexai import VectorSearchVectorStore
@@ -24,6 +24,9 @@ def create_retrieve_documents_node(
     """
     문서 검색 노드를 생성하는 팩토리 함수
     
+    검색 직후 컨텍스트 포맷팅까지 수행하여 별도 format_context 노드
+    (추가 super-step)를 두지 않습니다.
+    
     Args:
         vector_store: 벡터 스토어 객체
         vector_search_utils: 벡터 검색 유틸리티
@@ -38,9 +41,10 @@ def create_retrieve_documents_node(
     
     def retrieve_documents(state: State) -> dict:
         """
-        노드 1: 문서 검색
+        노드 1: 문서 검색 + 컨텍스트 포맷팅
         
-        벡터 스토어에서 질문과 관련된 문서를 검색합니다.
+        벡터 스토어에서 질문과 관련된 문서를 검색하고,
+        LLM 프롬프트에 사용할 형식으로 포맷팅합니다.
         
         Args:
             state: 현재 State
@@ -49,6 +53,7 @@ def create_retrieve_documents_node(
             업데이트할 필드만 포함한 딕셔너리
             - context: 검색된 문서 리스트
             - num_sources: 문서 수
+            - formatted_context: 포맷팅된 컨텍스트 문자열
             
         Note:
             LangGraph 권장 방식: 노드는 업데이트할 필드만 반환
@@ -60,19 +65,46 @@ def create_retrieve_documents_node(
             question = state["question"]
             logger.info(f"문서 검색 시작: {question[:50]}...")
             
-            # 벡터 검색 수행
+            # 벡터 검색 수행 (미리 계산된 질문 임베딩이 있으면 재사용)
             k = retriever_config["k"]
-            documents = vector_search_utils.search_similar_documents(
-                vector_store, question, k, logger
-            )
+            question_embedding = state.get("question_embedding")
+            if question_embedding is not None:
+                documents = vector_search_utils.search_similar_documents_by_vector(
+                    vector_store, question_embedding, k, logger
+                )
+            else:
+                documents = vector_search_utils.search_similar_documents(
+                    vector_store, question, k, logger
+                )
+            
+            if not documents:
+                # 문서 없음 에러 (복구 가능)
+                return error_handler.handle_error(
+                    error=ValueError("검색된 문서가 없습니다"),
+                    state=state,
+                    node_name="retrieve_documents",
+                    recoverable=True,
+                    return_fields={
+                        "context": [],
+                        "num_sources": 0,
+                        "formatted_context": "관련 문서를 찾을 수 없습니다.",
+                    }
+                )
+            
+            # 컨텍스트 포맷팅 (검색 결과를 그대로 이어서 처리)
+            formatted = format_documents_for_llm(documents)
             
             # 성공 처리
             return error_handler.handle_success(
                 node_name="retrieve_documents",
-                message=f"{len(documents)}개 문서 검색 완료",
+                message=(
+                    f"{len(documents)}개 문서 검색 완료 "
+                    f"(컨텍스트 {len(formatted)}자)"
+                ),
                 return_fields={
                     "context": documents,
                     "num_sources": len(documents),
+                    "formatted_context": formatted,
                 }
             )
             
@@ -88,6 +120,7 @@ def create_retrieve_documents_node(
                     "answer": "죄송합니다. 문서 검색 중 오류가 발생했습니다.",
                     "context": [],
                     "num_sources": 0,
+                    "formatted_context": "",
                 }
             )
     
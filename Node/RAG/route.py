@@ -1,15 +1,27 @@
 """Route 노드
 
 현재는 질문 라우팅을 비활성화하고 모든 요청을 RAG 파이프라인으로 보냅니다.
+
+라우팅 결과는 Command(goto=...)로 다음 노드를 직접 지정하므로
+route_question 이후에는 조건부 엣지가 필요하지 않습니다.
 """
 
 import logging
-from typing import Optional
+from typing import Literal, Optional
+
+from langgraph.types import Command
 
 from State import State
 from Utils import create_error_handler
 
 
+# 파이프라인별 다음 노드
+_PIPELINE_TARGETS = {
+    "rag": "retrieve_documents",
+    "chat": "generate_answer",
+}
+
+
 def create_route_question_node(
     llm,
     logger: logging.Logger,
@@ -20,20 +32,22 @@ def create_route_question_node(
     error_handler = create_error_handler(logger)
     _ = llm, prompt_template
 
-    def route_question(state: State) -> dict:
+    def route_question(
+        state: State,
+    ) -> Command[Literal["retrieve_documents", "generate_answer"]]:
         """모든 질문을 RAG 파이프라인으로 보냅니다."""
 
         logger.info("라우팅 비활성화 - 항상 RAG 파이프라인 사용")
 
-        return error_handler.handle_success(
+        pipeline = "rag"
+        update = error_handler.handle_success(
             node_name="route_question",
             message="질문 라우팅 생략, RAG 파이프라인 적용",
             return_fields={
-                "pipeline": "rag",
+                "pipeline": pipeline,
                 "routing_reason": "라우팅 기능 비활성화",
             },
         )
+        return Command(update=update, goto=_PIPELINE_TARGETS[pipeline])
 
     return route_question
-
-
@@ -14,9 +14,7 @@ LangGraph 워크플로우의 노드 함수들
 from Node.RAG import (
     create_route_question_node,
     create_retrieve_documents_node,
-    create_format_context_node,
     create_generate_answer_node,
-    create_format_output_node,
 )
 
 # MCQ 노드
@@ -34,9 +32,7 @@ __all__ = [
     # RAG 노드
     "create_route_question_node",
     "create_retrieve_documents_node",
-    "create_format_context_node",
     "create_generate_answer_node",
-    "create_format_output_node",
     # MCQ 노드
     "create_mcq_select_part_node",
     "create_mcq_select_chapter_node",
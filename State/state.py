@@ -49,6 +49,7 @@ class State(TypedDict):
     
     # ===== Ask Mode 필드 (RAG 질의응답) =====
     question: Optional[str]  # 현재 질문
+    question_embedding: Optional[List[float]]  # 질문 임베딩 (캐시 조회 시 계산, 검색에 재사용)
     context: Annotated[List[Document], operator.add]  # 검색된 문서
     formatted_context: Optional[str]  # LLM용 포맷팅된 컨텍스트
     answer: Optional[str]  # 생성된 답변
@@ -77,11 +78,11 @@ class State(TypedDict):
     selected_documents: List[Document]  # 선택된 문서 서브셋
     num_documents: int  # 문서 수 (MCQ용)
     recent_document_ids: List[str]  # 최근 사용된 문서 ID (문서 다양성 보장용, 최대 20개)
+    precomputed_retrieval: Optional[Dict[str, Any]]  # 배치 사전 검색 결과 (첫 검색에서 한 번만 사용)
     context_document_ids: List[str]  # 검색된 문서 ID 리스트
     context_section_ids: List[str]  # 검색된 문서의 섹션 ID 리스트
     selected_document_ids: List[str]  # 선택된 문서 ID 리스트
     selected_section_ids: List[str]  # 선택된 문서의 섹션 ID 리스트
-    generation_payload: Dict[str, Any]  # LLM 호출에 필요한 페이로드
     
     # MCQ 생성
     instruction: str  # MCQ 생성 지침
@@ -89,9 +90,13 @@ class State(TypedDict):
     category_examples: Dict[str, List[Dict[str, Any]]]  # 카테고리별 예시
     category_weights: Dict[str, float]  # 카테고리별 가중치
     max_few_shot_examples: int  # Few-shot 예시 최대 개수
+    few_shot_buckets: int  # 카테고리별 고정 Few-shot 조합 개수 (0이면 매번 임의 선택)
     max_context_docs: int  # 컨텍스트로 사용할 문서 최대 개수
     recent_few_shot_indices: List[int]  # 최근 사용된 Few-shot 예시 인덱스 (다양성 보장용, 최대 10개)
+    few_shot_block: Optional[str]  # 미리 구성된 Few-shot 예시 블록 (prepare_scaffold 노드)
+    few_shot_indices: List[int]  # few_shot_block에 포함된 예시 인덱스
     generated_mcq: Optional[Dict[str, Any]]  # 생성된 MCQ
+    allow_semantic_cache: Optional[bool]  # MCQ 응답 캐시 의미 유사도 적중 허용 (None이면 캐시 설정)
     
     # 프롬프트 (범위별 동적 로딩)
     system_prompt: Optional[str]  # 동적으로 로드된 시스템 프롬프트
@@ -133,6 +138,7 @@ def create_state(
     category_examples: Optional[Dict[str, List[Dict[str, Any]]]] = None,
     category_weights: Optional[Dict[str, float]] = None,
     max_few_shot_examples: int = 5,
+    few_shot_buckets: int = 0,
     max_retries: int = 6,
     max_context_docs: int = 3,
     used_section_ids: Optional[List[str]] = None,
@@ -143,6 +149,8 @@ def create_state(
     question_type_counter: Optional[Dict[str, int]] = None,
     time_counter: Optional[Dict[str, int]] = None,
     logic_counter: Optional[Dict[str, int]] = None,
+    precomputed_retrieval: Optional[Dict[str, Any]] = None,
+    allow_semantic_cache: Optional[bool] = None,
 ) -> State:
     """
     통합 State 초기화 함수
@@ -158,8 +166,13 @@ def create_state(
         category_examples: MCQ 카테고리별 예시
         category_weights: MCQ 카테고리별 가중치
         max_few_shot_examples: MCQ Few-shot 최대 개수
+        few_shot_buckets: MCQ Few-shot 고정 조합 개수 (0이면 매번 임의 선택)
         max_retries: MCQ 최대 재시도 횟수
         recent_chapters: MCQ 최근 선택 Chapter
+        precomputed_retrieval: 배치 생성 시 미리 검색한 주제/문서
+            (selected_part, selected_chapter, query, documents)
+        allow_semantic_cache: MCQ 응답 캐시의 의미 유사도 적중 허용 여부
+            (None이면 캐시 설정을 따름)
     
     Returns:
         초기화된 UnifiedState
@@ -193,6 +206,7 @@ def create_state(
         
         # Ask Mode
         question=None,
+        question_embedding=None,
         context=[],
         formatted_context=None,
         answer=None,
@@ -219,11 +233,11 @@ def create_state(
         selected_documents=[],
         num_documents=0,
         recent_document_ids=[],  # 최근 사용된 문서 ID (문서 다양성 보장용)
+        precomputed_retrieval=precomputed_retrieval,
         context_document_ids=[],
         context_section_ids=[],  # 검색된 문서 섹션 ID 리스트
         selected_document_ids=[],
         selected_section_ids=[],
-        generation_payload={},
         
         # Forge Mode - 생성
         instruction=instruction,
@@ -231,9 +245,13 @@ def create_state(
         category_examples=category_examples or {},
         category_weights=category_weights or {},
         max_few_shot_examples=max_few_shot_examples,
+        few_shot_buckets=few_shot_buckets,
         max_context_docs=max_context_docs,
         recent_few_shot_indices=[],  # 최근 사용된 Few-shot 예시 인덱스 (다양성 보장용)
+        few_shot_block=None,
+        few_shot_indices=[],
         generated_mcq=None,
+        allow_semantic_cache=allow_semantic_cache,
         
         # Forge Mode - 프롬프트 (동적 로딩)
         system_prompt=None,
@@ -298,8 +316,11 @@ def reset_forge_fields(state: State) -> None:
     
     state["retrieved_documents"] = []
     state["num_documents"] = 0
+    state["precomputed_retrieval"] = None
     state["formatted_context"] = None
     
+    state["few_shot_block"] = None
+    state["few_shot_indices"] = []
     state["generated_mcq"] = None
     state["is_valid"] = False
     state["validation_errors"] = []
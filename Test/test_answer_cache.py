@@ -0,0 +1,106 @@
+"""
+답변 캐시 테스트
+
+AskMode의 정확 일치(정규화 질문)/의미 일치(임베딩 코사인 유사도) 캐시의
+적중, 미스, LRU 삭제, 통계를 확인합니다.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+pytest.importorskip("langgraph")
+pytest.importorskip("langchain_google_vertexai")
+
+from Core.ask_mode import AskMode
+
+
+class _FakeEmbeddings:
+    """질문별로 미리 정한 벡터를 반환하는 임베딩"""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.calls = 0
+
+    async def aembed_query(self, text):
+        self.calls += 1
+        return self.vectors[text]
+
+
+def _ask_mode(vectors, **config):
+    """워크플로우/클라이언트 없이 답변 캐시만 초기화한 AskMode"""
+    ask_mode = AskMode.__new__(AskMode)
+    ask_mode.logger = logging.getLogger("Test.answer_cache")
+    ask_mode.retriever_config = dict({"enable_semantic_cache": True}, **config)
+    ask_mode.embeddings = _FakeEmbeddings(vectors)
+    ask_mode.vector_store = None
+    ask_mode._initialize_cache()
+    return ask_mode
+
+
+def _lookup(ask_mode, question):
+    return asyncio.run(ask_mode._lookup_cache(question))
+
+
+def _result(answer):
+    return {"question": "q", "answer": answer, "source_documents": [], "num_sources": 0}
+
+
+def test_exact_hit_uses_normalized_question():
+    """대소문자/공백만 다른 질문은 임베딩 없이 정확 일치로 적중"""
+    ask_mode = _ask_mode({"What is EMS?": [1.0, 0.0]})
+
+    cached, embedding = _lookup(ask_mode, "What is EMS?")
+    assert cached is None
+    ask_mode._store_cache("What is EMS?", _result("답변"), embedding)
+
+    cached, _ = _lookup(ask_mode, "  what   is ems? ")
+    assert cached["answer"] == "답변"
+    assert ask_mode.embeddings.calls == 1
+    assert ask_mode.cache_stats()["exact_hits"] == 1
+
+
+def test_semantic_hit_and_miss_by_threshold():
+    """코사인 유사도가 임계값 이상이면 적중, 미만이면 미스"""
+    ask_mode = _ask_mode(
+        {
+            "응급의료기관의 종류는?": [1.0, 0.0],
+            "응급의료기관 종류를 알려주세요": [0.99, 0.05],
+            "심폐소생술 순서는?": [0.0, 1.0],
+        },
+        semantic_cache_threshold=0.97,
+    )
+    _, embedding = _lookup(ask_mode, "응급의료기관의 종류는?")
+    ask_mode._store_cache("응급의료기관의 종류는?", _result("기관 답변"), embedding)
+
+    cached, _ = _lookup(ask_mode, "응급의료기관 종류를 알려주세요")
+    assert cached["answer"] == "기관 답변"
+
+    cached, embedding = _lookup(ask_mode, "심폐소생술 순서는?")
+    assert cached is None
+    assert embedding is not None  # 미스 후 저장에 재사용
+
+    stats = ask_mode.cache_stats()
+    assert stats["semantic_hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_lru_eviction():
+    """semantic_cache_size를 넘으면 가장 오래된 항목이 삭제되어야 함"""
+    vectors = {f"질문 {i}": [float(i == j) for j in range(3)] for i in range(3)}
+    ask_mode = _ask_mode(vectors, semantic_cache_size=2)
+
+    for question in vectors:
+        _, embedding = _lookup(ask_mode, question)
+        ask_mode._store_cache(question, _result(question), embedding)
+
+    stats = ask_mode.cache_stats()
+    assert stats["exact_entries"] == 2
+    assert stats["semantic_entries"] == 2
+    assert _lookup(ask_mode, "질문 0")[0] is None
+    assert _lookup(ask_mode, "질문 2")[0]["answer"] == "질문 2"
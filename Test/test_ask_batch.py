@@ -0,0 +1,113 @@
+"""
+AskMode 일괄 처리 테스트
+
+process_batch_async가 호출마다 고유한 thread_id를 사용하여 이전 배치의
+상태(operator.add 필드)를 이어받지 않고, 실행 후 체크포인트를 삭제하는지,
+답변 캐시 적중 질문은 워크플로우에서 제외하는지 확인합니다.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+pytest.importorskip("langgraph")
+pytest.importorskip("langchain_google_vertexai")
+
+from langgraph.graph import END, START, StateGraph  # type: ignore
+
+from Core._bounded_memsaver import BoundedMemorySaver, EndOfWorkflowSaver
+from Core.ask_mode import AskMode
+from State import State
+
+
+_RETRIEVED = []
+
+
+class _FakeEmbeddings:
+    """질문마다 서로 직교하는 벡터를 반환하는 임베딩 (의미 일치는 같은 질문만)"""
+
+    def __init__(self):
+        self.index = {}
+
+    async def aembed_query(self, text):
+        i = self.index.setdefault(text, len(self.index))
+        return [float(i == j) for j in range(8)]
+
+
+def _retrieve_documents(state):
+    _RETRIEVED.append(state["question"])
+    doc = {"content": f"{state['question']} 문서"}
+    return {"context": [doc["content"]], "source_documents": [doc], "num_sources": 1}
+
+
+def _generate_answer(state):
+    return {"answer": f"{state['question']} 답변"}
+
+
+def _ask_mode(checkpointer, embeddings=None, **config):
+    """노드 대신 간단한 검색/생성 함수로 워크플로우를 구성한 AskMode"""
+    workflow = StateGraph(State)
+    workflow.add_node("retrieve_documents", _retrieve_documents)
+    workflow.add_node("generate_answer", _generate_answer)
+    workflow.add_edge(START, "retrieve_documents")
+    workflow.add_edge("retrieve_documents", "generate_answer")
+    workflow.add_edge("generate_answer", END)
+
+    ask_mode = AskMode.__new__(AskMode)
+    ask_mode.logger = logging.getLogger("Test.ask_batch")
+    ask_mode.retriever_config = dict(config)
+    ask_mode.embeddings = embeddings
+    ask_mode.vector_store = None
+    ask_mode.checkpointer = checkpointer
+    ask_mode.workflow = workflow.compile(checkpointer=checkpointer)
+    ask_mode._initialize_cache()
+    return ask_mode
+
+
+@pytest.mark.parametrize("saver_class", [BoundedMemorySaver, EndOfWorkflowSaver])
+def test_batches_do_not_share_threads(saver_class):
+    """두 번째 배치의 출처 문서에 첫 번째 배치의 문서가 섞이지 않아야 함"""
+    saver = saver_class()
+    ask_mode = _ask_mode(saver)
+
+    first = asyncio.run(ask_mode.process_batch_async(["질문 A", "질문 B"]))
+    second = asyncio.run(ask_mode.process_batch_async(["질문 C", "질문 D"]))
+
+    assert [r["source_documents"] for r in first] == [
+        [{"content": "질문 A 문서"}],
+        [{"content": "질문 B 문서"}],
+    ]
+    assert [r["source_documents"] for r in second] == [
+        [{"content": "질문 C 문서"}],
+        [{"content": "질문 D 문서"}],
+    ]
+    # 배치 스레드는 실행 후 삭제됨
+    assert not saver.storage
+    assert not saver._thread_order
+
+
+def test_batch_uses_answer_cache():
+    """캐시 적중 질문은 실행하지 않고, 미스 결과는 저장되어 이후 요청에서 적중해야 함"""
+    ask_mode = _ask_mode(None, _FakeEmbeddings(), enable_semantic_cache=True)
+    _RETRIEVED.clear()
+
+    first = asyncio.run(ask_mode.process_batch_async(["질문 A", "질문 B"]))
+    assert _RETRIEVED == ["질문 A", "질문 B"]
+
+    _RETRIEVED.clear()
+    second = asyncio.run(ask_mode.process_batch_async(["질문 b", "질문 C", "질문 A"]))
+    assert _RETRIEVED == ["질문 C"]
+    assert [r["answer"] for r in second] == ["질문 B 답변", "질문 C 답변", "질문 A 답변"]
+    assert [r["question"] for r in second] == ["질문 b", "질문 C", "질문 A"]
+    assert second[2]["source_documents"] == first[0]["source_documents"]
+
+    _RETRIEVED.clear()
+    result = asyncio.run(ask_mode.aprocess("질문 C"))
+    assert result["answer"] == "질문 C 답변"
+    assert not _RETRIEVED
+    assert ask_mode.cache_stats()["exact_hits"] == 3
@@ -0,0 +1,200 @@
+"""
+Checkpointer 테스트
+
+EndOfWorkflowSaver가 종료 시점에 한 번만 저장하면서도 모든 State 필드를
+복원할 수 있는지, 부모 체크포인트 연결이 올바른지, 실패/조기 종료한 실행의
+버퍼가 남지 않는지 확인합니다. 실행은 AskMode와 같이 checkpoint_scope로 감쌉니다.
+"""
+
+import asyncio
+import operator
+from contextlib import aclosing
+import os
+import sys
+from typing import Annotated, List, TypedDict
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+pytest.importorskip("langgraph")
+
+from langgraph.graph import END, START, StateGraph  # type: ignore
+
+from Core._bounded_memsaver import EndOfWorkflowSaver, checkpoint_scope
+
+
+class _AskState(TypedDict):
+    """Ask 워크플로우와 같은 모양의 축소 State"""
+    question: str
+    context: Annotated[List[str], operator.add]
+    formatted_context: str
+    answer: str
+
+
+def _route_question(state: _AskState) -> dict:
+    return {"question": state["question"].strip()}
+
+
+def _retrieve_documents(state: _AskState) -> dict:
+    docs = [f"{state['question']} 문서 1", f"{state['question']} 문서 2"]
+    return {"context": docs, "formatted_context": "\n".join(docs)}
+
+
+def _generate_answer(state: _AskState) -> dict:
+    if state["question"] == "실패":
+        raise RuntimeError("LLM 호출 실패")
+    return {"answer": f"답변: {state['formatted_context']}"}
+
+
+def _build_graph(checkpointer):
+    workflow = StateGraph(_AskState)
+    workflow.add_node("route_question", _route_question)
+    workflow.add_node("retrieve_documents", _retrieve_documents)
+    workflow.add_node("generate_answer", _generate_answer)
+    workflow.add_edge(START, "route_question")
+    workflow.add_edge("route_question", "retrieve_documents")
+    workflow.add_edge("retrieve_documents", "generate_answer")
+    workflow.add_edge("generate_answer", END)
+    return workflow.compile(checkpointer=checkpointer)
+
+
+def _initial(question: str) -> dict:
+    return {"question": question, "context": [], "formatted_context": "", "answer": ""}
+
+
+def _run(graph, saver, question: str, thread_id: str = "t1") -> dict:
+    config = {"configurable": {"thread_id": thread_id}}
+    with checkpoint_scope(saver, [thread_id]):
+        return graph.invoke(_initial(question), config)
+
+
+def test_end_of_workflow_restores_all_fields():
+    """종료 시 저장된 체크포인트에서 모든 필드가 복원되어야 함"""
+    saver = EndOfWorkflowSaver()
+    graph = _build_graph(saver)
+    config = {"configurable": {"thread_id": "t1"}}
+
+    final_state = _run(graph, saver, " 응급의료기관 ")
+
+    values = graph.get_state(config).values
+    assert set(values) == set(_AskState.__annotations__)
+    assert values == final_state
+    assert values["question"] == "응급의료기관"
+    assert values["context"] == ["응급의료기관 문서 1", "응급의료기관 문서 2"]
+
+    # 노드마다가 아니라 워크플로우당 한 번만 저장
+    assert len(list(saver.list(config))) == 1
+
+
+def test_end_of_workflow_links_to_previous_run():
+    """같은 스레드의 두 번째 실행은 첫 실행의 체크포인트를 부모로 가져야 함"""
+    saver = EndOfWorkflowSaver()
+    graph = _build_graph(saver)
+    config = {"configurable": {"thread_id": "t1"}}
+
+    _run(graph, saver, "첫 질문")
+    first_id = graph.get_state(config).config["configurable"]["checkpoint_id"]
+
+    _run(graph, saver, "둘째 질문")
+    snapshot = graph.get_state(config)
+    assert snapshot.parent_config["configurable"]["checkpoint_id"] == first_id
+    assert snapshot.values["question"] == "둘째 질문"
+    assert len(list(saver.list(config))) == 2
+
+
+def test_end_of_workflow_keeps_threads_separate():
+    """flush(thread_id)는 해당 스레드의 버퍼만 저장해야 함"""
+    saver = EndOfWorkflowSaver()
+    graph = _build_graph(saver)
+
+    _run(graph, saver, "질문 A", thread_id="a")
+    _run(graph, saver, "질문 B", thread_id="b")
+
+    assert graph.get_state({"configurable": {"thread_id": "a"}}).values["question"] == "질문 A"
+    assert graph.get_state({"configurable": {"thread_id": "b"}}).values["question"] == "질문 B"
+
+
+def test_end_of_workflow_buffers_until_scope_ends():
+    """checkpoint_scope를 벗어나기 전에는 실행이 끝나도 저장되지 않아야 함"""
+    saver = EndOfWorkflowSaver()
+    graph = _build_graph(saver)
+    config = {"configurable": {"thread_id": "t1"}}
+
+    with checkpoint_scope(saver, ["t1"]):
+        graph.invoke(_initial("질문"), config)
+        assert graph.get_state(config).values == {}
+
+    assert graph.get_state(config).values["answer"]
+    assert not saver._pending
+
+
+def test_end_of_workflow_discards_failed_runs():
+    """실패한 실행의 버퍼는 저장되지 않고 버려져야 함 (스레드마다 남지 않음)"""
+    saver = EndOfWorkflowSaver()
+    graph = _build_graph(saver)
+
+    for thread_id in ("a", "b", "c"):
+        with pytest.raises(RuntimeError):
+            _run(graph, saver, "실패", thread_id=thread_id)
+
+    assert not saver._pending
+    assert not saver._thread_order
+    assert graph.get_state({"configurable": {"thread_id": "a"}}).values == {}
+
+    # 실패 후 같은 스레드의 정상 실행은 처음 저장되는 체크포인트가 됨
+    _run(graph, saver, "질문", thread_id="a")
+    snapshot = graph.get_state({"configurable": {"thread_id": "a"}})
+    assert snapshot.values["question"] == "질문"
+    assert snapshot.parent_config is None
+
+
+def test_end_of_workflow_discards_closed_stream():
+    """스트림을 중간에 닫으면(process_stream 조기 종료) 버퍼가 버려져야 함"""
+    saver = EndOfWorkflowSaver()
+    graph = _build_graph(saver)
+    config = {"configurable": {"thread_id": "t1"}}
+
+    async def stream():
+        with checkpoint_scope(saver, ["t1"]):
+            async with aclosing(graph.astream(_initial("질문"), config)) as events:
+                async for event in events:
+                    yield event
+
+    async def consume_first_event():
+        events = stream()
+        await events.__anext__()
+        await events.aclose()
+
+    asyncio.run(consume_first_event())
+
+    assert not saver._pending
+    assert graph.get_state(config).values == {}
+
+
+def test_bounded_saver_evicts_oldest_thread():
+    """max_threads를 넘으면 가장 오래 사용하지 않은 스레드의 체크포인트가 삭제되어야 함"""
+    from Core._bounded_memsaver import BoundedMemorySaver
+
+    saver = BoundedMemorySaver(max_threads=2)
+    graph = _build_graph(saver)
+    for thread_id in ("a", "b", "c"):
+        graph.invoke(_initial("질문"), {"configurable": {"thread_id": thread_id}})
+
+    assert graph.get_state({"configurable": {"thread_id": "a"}}).values == {}
+    assert graph.get_state({"configurable": {"thread_id": "b"}}).values["answer"]
+    assert graph.get_state({"configurable": {"thread_id": "c"}}).values["answer"]
+
+
+def test_bounded_saver_release():
+    """release()는 해당 스레드의 체크포인트를 즉시 삭제해야 함"""
+    from Core._bounded_memsaver import BoundedMemorySaver
+
+    saver = BoundedMemorySaver(max_threads=4)
+    graph = _build_graph(saver)
+    config = {"configurable": {"thread_id": "a"}}
+    graph.invoke(_initial("질문"), config)
+
+    saver.release("a")
+    assert graph.get_state(config).values == {}
+    assert not any(key[0] == "a" for key in saver.blobs)
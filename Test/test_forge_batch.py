@@ -0,0 +1,90 @@
+"""
+ForgeMode 배치 스트림 테스트
+
+같은 풀 스냅샷으로 동시에 시작한 작업이 같은 문항을 만들었을 때
+완료 시점에 중복을 다시 확인하여 재생성하거나 제외하는지 확인합니다.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+pytest.importorskip("langgraph")
+pytest.importorskip("langchain_google_vertexai")
+
+import Core.forge_mode as forge_mode
+from Core.forge_mode import ForgeMode, QuestionPoolManager
+from Utils import get_question_hash
+
+
+class _StubWorkflow:
+    """호출 순서대로 미리 정한 문항을 반환하는 워크플로우"""
+
+    def __init__(self, questions):
+        self.questions = list(questions)
+        self.calls = 0
+
+    async def ainvoke(self, state, config):
+        question = self.questions[min(self.calls, len(self.questions) - 1)]
+        self.calls += 1
+        # 모든 작업이 같은 스냅샷으로 시작한 뒤에 완료되도록 양보
+        await asyncio.sleep(0)
+        mcq = {"question": question, "options": ["가", "나", "다", "라"], "answer_index": 0}
+        return {"final_mcq": mcq, "selected_section_ids": [f"sec_{question}"]}
+
+
+def _make_forge(questions, max_concurrency=3):
+    forge = ForgeMode.__new__(ForgeMode)
+    forge.logger = logging.getLogger("test_forge_batch")
+    forge.mcq_types = {}
+    forge.mcq_config = {}
+    forge.max_context_docs = 5
+    forge.retriever_config = {"max_concurrency": max_concurrency, "batch_prefetch": False}
+    forge.pool_manager = QuestionPoolManager()
+    forge.checkpointer = None
+    forge.workflow = _StubWorkflow(questions)
+    return forge
+
+
+async def _collect(forge, count):
+    return [mcq async for mcq in forge.stream_mcq_batch(topics_hierarchical={}, count=count)]
+
+
+def test_duplicate_is_regenerated():
+    # 동시에 시작한 세 작업이 모두 같은 문항을 만들고, 재생성은 새 문항을 만든다
+    forge = _make_forge(["Q1", "Q1", "Q1", "Q2", "Q3"])
+
+    mcqs = asyncio.run(_collect(forge, 3))
+
+    hashes = [get_question_hash(mcq) for mcq in mcqs]
+    assert len(mcqs) == 3
+    assert len(set(hashes)) == 3
+    assert set(hashes) == forge.pool_manager.used_question_hashes
+    assert forge.workflow.calls == 5
+
+
+def test_duplicate_is_skipped_after_retries(monkeypatch):
+    monkeypatch.setattr(forge_mode, "_MAX_DUPLICATE_RETRIES", 1)
+    forge = _make_forge(["Q1"])
+
+    mcqs = asyncio.run(_collect(forge, 2))
+
+    assert [mcq["question"] for mcq in mcqs] == ["Q1"]
+    # 첫 결과 1회 + 중복 항목 1회 + 재생성 1회
+    assert forge.workflow.calls == 3
+
+
+def test_already_used_question_is_not_returned():
+    forge = _make_forge(["Q1", "Q2"], max_concurrency=1)
+    forge.pool_manager.register_question(
+        {"question": "Q1", "options": ["가", "나", "다", "라"], "answer_index": 0}
+    )
+
+    mcqs = asyncio.run(_collect(forge, 1))
+
+    assert [mcq["question"] for mcq in mcqs] == ["Q2"]
@@ -0,0 +1,96 @@
+"""
+컨텍스트 포맷팅 캐시 테스트
+
+format_context 노드가 같은 문서 조합의 포맷팅 결과를 재사용하고,
+cache_size를 넘으면 오래된 결과를 버리는지 확인합니다.
+"""
+
+import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from langchain_core.documents import Document
+
+import Node.MCQ.format_context as format_context_module
+from Node.MCQ.format_context import create_mcq_format_context_node
+
+
+_LOGGER = logging.getLogger("Test.format_context")
+
+
+def _doc(text: str, chapter: str = "Ch1") -> Document:
+    return Document(page_content=text, metadata={"chapter": chapter, "page_number": 1})
+
+
+@pytest.fixture
+def format_calls(monkeypatch):
+    """format_documents_for_llm 호출 횟수를 기록합니다."""
+    calls = []
+
+    def fake_format(documents):
+        calls.append(len(documents))
+        return "\n".join(doc.page_content for doc in documents)
+
+    monkeypatch.setattr(format_context_module, "format_documents_for_llm", fake_format)
+    return calls
+
+
+def test_same_documents_reuse_cached_result(format_calls):
+    """같은 문서 조합이면 두 번째 호출은 캐시를 사용해야 함"""
+    node = create_mcq_format_context_node(_LOGGER, cache_size=4)
+    state = {"selected_documents": [_doc("문서 A"), _doc("문서 B")]}
+
+    first = node(state)
+    second = node({"selected_documents": [_doc("문서 A"), _doc("문서 B")]})
+
+    assert first["formatted_context"] == second["formatted_context"] == "문서 A\n문서 B"
+    assert len(format_calls) == 1
+
+
+def test_metadata_change_is_cache_miss(format_calls):
+    """출처 메타데이터가 다르면 다시 포맷팅해야 함"""
+    node = create_mcq_format_context_node(_LOGGER, cache_size=4)
+    node({"selected_documents": [_doc("문서 A", chapter="Ch1")]})
+    node({"selected_documents": [_doc("문서 A", chapter="Ch2")]})
+    assert len(format_calls) == 2
+
+
+def test_lru_eviction(format_calls):
+    """cache_size를 넘으면 가장 오래 사용하지 않은 결과가 삭제되어야 함"""
+    node = create_mcq_format_context_node(_LOGGER, cache_size=2)
+    a, b, c = ([_doc(text)] for text in ("A", "B", "C"))
+
+    node({"selected_documents": a})
+    node({"selected_documents": b})
+    node({"selected_documents": a})  # A를 최근 사용으로 갱신 (캐시 적중)
+    node({"selected_documents": c})  # B 삭제
+    assert len(format_calls) == 3
+
+    node({"selected_documents": a})  # 적중
+    assert len(format_calls) == 3
+    node({"selected_documents": b})  # 삭제되었으므로 다시 포맷팅
+    assert len(format_calls) == 4
+
+
+def test_cache_disabled(format_calls):
+    """cache_size=0이면 매번 포맷팅해야 함"""
+    node = create_mcq_format_context_node(_LOGGER, cache_size=0)
+    state = {"selected_documents": [_doc("문서 A")]}
+    node(state)
+    node(state)
+    assert len(format_calls) == 2
+
+
+def test_empty_documents_is_recoverable_error(format_calls):
+    """문서가 없으면 빈 컨텍스트와 함께 에러를 반환해야 함"""
+    node = create_mcq_format_context_node(_LOGGER)
+    result = node({"selected_documents": []})
+    assert result["formatted_context"] == ""
+    assert result["error"]
+    assert not format_calls
@@ -0,0 +1,151 @@
+"""
+MCQ 응답 캐시 테스트
+
+MCQResponseCache의 정확 일치/의미 일치 적중, TTL 만료, 버전 태그,
+근거 문서 Jaccard 조건, 재시도/사용 문항 제외를 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+pytest.importorskip("langgraph")
+pytest.importorskip("langchain_google_vertexai")
+
+import Core.forge_mode as forge_mode
+from Core.forge_mode import MCQResponseCache
+from Utils import get_question_hash
+
+
+_MCQ = {
+    "question": "응급의료기관의 종류로 옳은 것은?",
+    "options": ["권역응급의료센터", "보건소", "약국", "한의원", "요양병원"],
+    "answer": 1,
+    "explanation": ["통합 해설"],
+}
+
+
+class _FakeEmbeddings:
+    """모든 텍스트를 같은 벡터로 임베딩 (의미 일치 조건만 검증)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed_query(self, text):
+        self.calls += 1
+        return [1.0, 0.0, 0.0]
+
+
+def _state(**overrides):
+    state = {
+        "formatted_context": "응급의료기관 관련 컨텍스트",
+        "instruction": "문항을 1개 생성하세요",
+        "selected_part": "Part 1",
+        "selected_chapter": "Ch1",
+        "selected_topic_query": "Part 1 - Ch1",
+        "selected_document_ids": ["doc-1", "doc-2"],
+        "topics_hierarchical": {"Part 1": ["Ch1"]},
+        "system_prompt": "system",
+        "retry_count": 0,
+    }
+    state.update(overrides)
+    return state
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """time.monotonic을 테스트에서 조정할 수 있는 시계로 바꿉니다."""
+    now = [1000.0]
+    monkeypatch.setattr(forge_mode.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_exact_miss_then_hit(clock):
+    """저장 전에는 미스, 같은 State로 저장 후에는 정확 일치 적중"""
+    cache = MCQResponseCache(semantic=False)
+    assert cache.lookup(_state()) == (None, None)
+
+    cache.store(_state(), _MCQ)
+    cached, _ = cache.lookup(_state())
+
+    assert cached == _MCQ
+    assert cached is not _MCQ  # 호출자가 수정해도 캐시가 바뀌지 않도록 복사본 반환
+    assert cache.stats()["exact_hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_expiry(clock):
+    """ttl_seconds가 지나면 만료되어 미스"""
+    cache = MCQResponseCache(ttl_seconds=60.0, semantic=False)
+    cache.store(_state(), _MCQ)
+
+    clock[0] += 59.0
+    assert cache.lookup(_state())[0] == _MCQ
+
+    clock[0] += 2.0
+    assert cache.lookup(_state())[0] is None
+    assert cache.stats()["exact_entries"] == 0
+
+
+def test_version_change_invalidates(clock):
+    """교재 구조나 프롬프트가 바뀌면 기존 항목은 적중하지 않아야 함"""
+    cache = MCQResponseCache(embeddings=_FakeEmbeddings())
+    cache.store(_state(), _MCQ)
+
+    assert cache.lookup(_state(system_prompt="new system"))[0] is None
+    assert cache.lookup(_state(topics_hierarchical={"Part 1": ["Ch1", "Ch2"]}))[0] is None
+
+
+def test_semantic_hit_requires_document_overlap(clock):
+    """의미 일치는 같은 범위이고 근거 문서 Jaccard >= min_jaccard일 때만 적중"""
+    cache = MCQResponseCache(embeddings=_FakeEmbeddings(), min_jaccard=0.5)
+    cache.store(_state(), _MCQ)
+
+    # 키 텍스트는 다르지만(지침 변경) 근거 문서가 같음 → 의미 일치 적중
+    cached, embedding = cache.lookup(_state(instruction="다른 지침"))
+    assert cached == _MCQ
+    assert embedding is not None
+    assert cache.stats()["semantic_hits"] == 1
+
+    # 근거 문서 Jaccard = 1/3 < 0.5 → 미스
+    assert cache.lookup(
+        _state(instruction="다른 지침", selected_document_ids=["doc-1", "doc-3"])
+    )[0] is None
+
+    # 다른 Chapter → 미스
+    assert cache.lookup(_state(instruction="다른 지침", selected_chapter="Ch2"))[0] is None
+
+
+def test_semantic_disabled_per_request(clock):
+    """allow_semantic_cache=False이면 임베딩 없이 정확 일치만 사용"""
+    embeddings = _FakeEmbeddings()
+    cache = MCQResponseCache(embeddings=embeddings)
+    cache.store(_state(), _MCQ)
+    calls = embeddings.calls
+
+    state = _state(instruction="다른 지침", allow_semantic_cache=False)
+    assert cache.lookup(state) == (None, None)
+    assert embeddings.calls == calls
+
+
+def test_retry_and_used_questions_are_skipped(clock):
+    """재시도 중이거나 이미 사용된 문항이면 적중으로 취급하지 않아야 함"""
+    cache = MCQResponseCache(semantic=False)
+    cache.store(_state(), _MCQ)
+
+    assert cache.lookup(_state(retry_count=1))[0] is None
+    assert cache.lookup(_state(used_question_hashes=[get_question_hash(_MCQ)]))[0] is None
+    assert cache.lookup(_state())[0] == _MCQ
+
+
+def test_lru_eviction(clock):
+    """max_size를 넘으면 가장 오래 사용하지 않은 항목이 삭제되어야 함"""
+    cache = MCQResponseCache(max_size=2, semantic=False)
+    for chapter in ("Ch1", "Ch2", "Ch3"):
+        cache.store(_state(selected_chapter=chapter), dict(_MCQ, question=chapter))
+
+    assert cache.lookup(_state(selected_chapter="Ch1"))[0] is None
+    assert cache.lookup(_state(selected_chapter="Ch3"))[0]["question"] == "Ch3"
@@ -0,0 +1,63 @@
+"""
+MCQ 응답 파싱 테스트
+
+_parse_mcq_response가 코드블록, 최상위 리스트, 문자열 해설 응답을
+MCQ 딕셔너리로 정규화하는지 확인합니다.
+"""
+
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+pytest.importorskip("langchain_core")
+pytest.importorskip("pydantic")
+
+from Node.MCQ.generate import _parse_mcq_response
+
+
+_MCQ = {
+    "question": "응급의료기관의 종류로 옳은 것은?",
+    "options": ["권역응급의료센터", "보건소", "약국", "한의원", "요양병원"],
+    "answer": 1,
+    "explanation": ["정답 해설", "오답 해설 1", "오답 해설 2", "오답 해설 3"],
+}
+
+
+def test_plain_json():
+    """순수 JSON(JSON 모드 응답)은 그대로 로드되어야 함"""
+    assert _parse_mcq_response(json.dumps(_MCQ, ensure_ascii=False)) == _MCQ
+
+
+def test_code_fenced_json():
+    """```json 코드블록으로 감싼 응답도 파싱되어야 함"""
+    text = "```json\n" + json.dumps(_MCQ, ensure_ascii=False) + "\n```"
+    assert _parse_mcq_response(text) == _MCQ
+
+
+def test_list_wrapped_response_uses_first_item():
+    """최상위 리스트 응답은 첫 번째 항목을 사용해야 함"""
+    other = dict(_MCQ, question="다른 문항")
+    text = json.dumps([_MCQ, other], ensure_ascii=False)
+    assert _parse_mcq_response(text) == _MCQ
+
+
+def test_empty_list_raises():
+    """빈 리스트 응답은 ValueError를 발생시켜야 함"""
+    with pytest.raises(ValueError):
+        _parse_mcq_response("[]")
+
+
+def test_string_explanation_wrapped_in_list():
+    """문자열 해설은 항목 1개짜리 리스트(통합 해설)로 변환되어야 함"""
+    text = json.dumps(dict(_MCQ, explanation="통합 해설"), ensure_ascii=False)
+    assert _parse_mcq_response(text)["explanation"] == ["통합 해설"]
+
+
+def test_invalid_json_raises():
+    """JSON이 아닌 응답은 예외를 발생시켜야 함 (generate_mcq 노드에서 재시도 처리)"""
+    with pytest.raises(Exception):
+        _parse_mcq_response("JSON이 아닌 응답입니다")
@@ -0,0 +1,61 @@
+"""
+질문 라우팅 테스트
+
+route_question 노드가 조건부 엣지 대신 Command(goto=...)로 다음 노드를 지정하고,
+build_workflow_edges로 구성한 그래프가 그 경로를 따라 실행되는지 확인합니다.
+"""
+
+import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+pytest.importorskip("langgraph")
+
+from langgraph.graph import StateGraph  # type: ignore
+from langgraph.types import Command  # type: ignore
+
+from Edge import build_workflow_edges
+from Node.RAG.route import create_route_question_node
+from State import State
+
+
+_LOGGER = logging.getLogger("Test.route_command")
+
+
+def test_route_question_returns_command_to_retrieve():
+    """RAG 파이프라인이면 retrieve_documents로 이동하는 Command를 반환해야 함"""
+    route_question = create_route_question_node(llm=None, logger=_LOGGER)
+    result = route_question({"question": "응급의료기관의 종류는?"})
+
+    assert isinstance(result, Command)
+    assert result.goto == "retrieve_documents"
+    assert result.update["pipeline"] == "rag"
+
+
+def test_workflow_follows_command_route():
+    """컴파일된 그래프가 route_question → retrieve_documents → generate_answer 순으로 실행되어야 함"""
+    visited = []
+
+    def retrieve_documents(state):
+        visited.append("retrieve_documents")
+        return {"formatted_context": "컨텍스트"}
+
+    def generate_answer(state):
+        visited.append("generate_answer")
+        return {"answer": f"답변 ({state['formatted_context']})"}
+
+    workflow = StateGraph(State)
+    workflow.add_node("route_question", create_route_question_node(llm=None, logger=_LOGGER))
+    workflow.add_node("retrieve_documents", retrieve_documents)
+    workflow.add_node("generate_answer", generate_answer)
+    build_workflow_edges(workflow)
+
+    final_state = workflow.compile().invoke({"question": "질문"})
+
+    assert visited == ["retrieve_documents", "generate_answer"]
+    assert final_state["pipeline"] == "rag"
+    assert final_state["answer"] == "답변 (컨텍스트)"
@@ -0,0 +1,94 @@
+"""
+주제 선택기 테스트
+
+_AliasTable의 선택 분포가 가중치를 따르는지, TopicSampler가 교재 구조 안에서
+Part/Chapter를 고르고 최근 Chapter를 피하는지 확인합니다.
+"""
+
+import logging
+import os
+import random
+import sys
+from collections import Counter
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from Node.MCQ.retrieve_documents import TopicSampler, _AliasTable, get_topic_sampler
+
+
+_LOGGER = logging.getLogger("Test.topic_sampler")
+
+_TOPICS = {
+    "Part 1": ["Ch1", "Ch2", "Ch3"],
+    "Part 2": ["Ch4", "Ch5"],
+}
+
+
+def test_alias_table_distribution():
+    """선택 빈도가 가중치 비율에 가까워야 함"""
+    random.seed(1234)
+    items = ["a", "b", "c", "d"]
+    weights = [0.1, 0.2, 0.3, 0.4]
+    table = _AliasTable(items, weights)
+
+    trials = 40000
+    counts = Counter(table.sample() for _ in range(trials))
+
+    for item, weight in zip(items, weights):
+        assert abs(counts[item] / trials - weight) < 0.01
+
+
+def test_alias_table_zero_weight_never_selected():
+    """가중치 0인 항목은 선택되지 않아야 함"""
+    random.seed(0)
+    table = _AliasTable(["a", "b", "c"], [0.0, 1.0, 3.0])
+    assert "a" not in {table.sample() for _ in range(5000)}
+
+
+def test_alias_table_rejects_invalid_weights():
+    """항목이 없거나 가중치 합이 0이면 ValueError"""
+    with pytest.raises(ValueError):
+        _AliasTable([], [])
+    with pytest.raises(ValueError):
+        _AliasTable(["a", "b"], [0.0, 0.0])
+
+
+def test_topic_sampler_returns_valid_topic():
+    """선택 결과는 교재 구조 안의 (Part, Chapter)이고 쿼리는 "Part - Chapter" 형식"""
+    random.seed(7)
+    sampler = TopicSampler(_TOPICS, {})
+    for _ in range(200):
+        part, chapter, query = sampler.sample([], _LOGGER)
+        assert chapter in _TOPICS[part]
+        assert query == f"{part} - {chapter}"
+
+
+def test_topic_sampler_avoids_recent_chapters():
+    """최근 Chapter는 다른 Chapter가 남아 있는 한 선택되지 않아야 함"""
+    random.seed(7)
+    sampler = TopicSampler(_TOPICS, {"part_weights": {"Part 1": 1.0, "Part 2": 0.0}})
+    chapters = {sampler.sample(["Ch1", "Ch2"], _LOGGER)[1] for _ in range(200)}
+    assert chapters == {"Ch3"}
+
+
+def test_topic_sampler_chapter_weights():
+    """chapter_weights가 있는 Part는 Chapter를 직접 가중치로 선택해야 함"""
+    random.seed(7)
+    mcq_config = {
+        "part_weights": {"Part 2": 0.0},
+        "chapter_weights": {"Part 1": {"Ch1": 1.0, "Ch2": 0.0, "Ch3": 0.0}},
+    }
+    sampler = TopicSampler(_TOPICS, mcq_config)
+    results = {sampler.sample([], _LOGGER) for _ in range(200)}
+    assert results == {("Part 1", "Ch1", "Part 1 - Ch1")}
+
+
+def test_get_topic_sampler_is_cached_by_content():
+    """같은 구조/가중치면 같은 인스턴스, 내용이 바뀌면 새 인스턴스"""
+    first = get_topic_sampler(_TOPICS, {})
+    assert get_topic_sampler(dict(_TOPICS), {}) is first
+    assert get_topic_sampler(_TOPICS, {"part_weights": {"Part 1": 2.0}}) is not first
@@ -0,0 +1,49 @@
+"""
+워크플로우 캐시 테스트
+
+WorkflowCache가 최근 사용 순서(LRU)로 항목 수를 제한하는지 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from Core._workflow_cache import WorkflowCache
+
+
+def test_get_miss_and_hit():
+    """없는 키는 None, 저장한 키는 같은 항목을 반환해야 함"""
+    cache = WorkflowCache(max_size=2)
+    assert cache.get("a") is None
+
+    entry = {"workflow": object()}
+    cache.put("a", entry)
+    assert cache.get("a") is entry
+
+
+def test_evicts_least_recently_used():
+    """max_size를 넘으면 가장 오래 사용하지 않은 항목이 삭제되어야 함"""
+    cache = WorkflowCache(max_size=2)
+    cache.put("a", {"workflow": 1})
+    cache.put("b", {"workflow": 2})
+    cache.get("a")  # a를 최근 사용으로 갱신
+    cache.put("c", {"workflow": 3})
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == {"workflow": 1}
+    assert cache.get("c") == {"workflow": 3}
+
+
+def test_clear_and_invalid_size():
+    """clear()는 모든 항목을 삭제하고, max_size < 1은 거부해야 함"""
+    cache = WorkflowCache(max_size=1)
+    cache.put("a", {})
+    cache.clear()
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        WorkflowCache(max_size=0)
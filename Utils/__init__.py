@@ -11,6 +11,7 @@ Utils 모듈 패키지
 - system: 시스템 정보 수집
 - few_shot: Few-shot Learning 지원
 - session: 세션 및 히스토리 관리
+- mcq_hash: MCQ 문항 해시
 """
 
 # 로깅
@@ -20,7 +21,11 @@ from .logging import setup_logging
 from .file import FileProcessor
 
 # 문서 처리
-from .document import format_documents_for_llm, extract_texts_and_metadatas_from_documents
+from .document import (
+    format_documents_for_llm,
+    extract_texts_and_metadatas_from_documents,
+    build_source_documents,
+)
 
 # 벡터 검색
 from .search import VectorSearchUtils
@@ -31,6 +36,8 @@ from .system import SystemInfoCollector
 # Few-shot Learning
 from .few_shot import (
     build_few_shot_prompt,
+    build_few_shot_block,
+    attach_few_shot_block,
     load_few_shot_examples_from_json,
     load_few_shot_examples_from_folder,
     format_single_example,
@@ -60,6 +67,9 @@ from .session import (
     get_session_statistics,
 )
 
+# MCQ 문항 해시
+from .mcq_hash import compute_question_hash, get_question_hash
+
 __all__ = [
     # 로깅
     "setup_logging",
@@ -68,12 +78,15 @@ __all__ = [
     # 문서 처리
     "format_documents_for_llm",
     "extract_texts_and_metadatas_from_documents",
+    "build_source_documents",
     # 벡터 검색
     "VectorSearchUtils",
     # 시스템 정보
     "SystemInfoCollector",
     # Few-shot Learning
     "build_few_shot_prompt",
+    "build_few_shot_block",
+    "attach_few_shot_block",
     "load_few_shot_examples_from_json",
     "load_few_shot_examples_from_folder",
     "format_single_example",
@@ -95,6 +108,9 @@ __all__ = [
     "save_session",
     "load_session",
     "get_session_statistics",
+    # MCQ 문항 해시
+    "compute_question_hash",
+    "get_question_hash",
 ]
 
 __version__ = "1.0.0"
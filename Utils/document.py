@@ -4,6 +4,7 @@
 주요 기능:
 - format_documents_for_llm: 문서를 LLM이 이해하기 쉽게 포맷팅
 - extract_texts_and_metadatas_from_documents: 문서에서 텍스트와 메타데이터 추출
+- build_source_documents: 문서를 사용자 표시용 출처 정보로 변환
 """
 
 from typing import List, Dict, Any, Tuple
@@ -70,3 +71,40 @@ def extract_texts_and_metadatas_from_documents(
     metadatas = [doc.metadata or {} for doc in documents]
     return texts, metadatas
 
+
+def build_source_documents(
+    documents: List[Document], max_chars: int = 300
+) -> List[Dict[str, Any]]:
+    """
+    검색된 문서를 사용자에게 표시할 출처 정보로 변환합니다.
+
+    동일한 청크(metadata의 id/document_id, 없으면 본문 기준)가
+    여러 번 검색된 경우 첫 번째 항목만 남깁니다.
+
+    Args:
+        documents: Document 객체 리스트
+        max_chars: 본문 미리보기 최대 길이 (초과 시 "..." 추가)
+
+    Returns:
+        {"content", "metadata"} 딕셔너리 리스트
+
+    예제:
+        sources = build_source_documents(state["context"])
+    """
+    seen = set()
+    sources = []
+    for doc in documents:
+        metadata = doc.metadata or {}
+        key = metadata.get("id") or metadata.get("document_id") or doc.page_content
+        if key in seen:
+            continue
+        seen.add(key)
+        sources.append({
+            "content": (
+                doc.page_content[:max_chars] + "..."
+                if len(doc.page_content) > max_chars
+                else doc.page_content
+            ),
+            "metadata": doc.metadata,
+        })
+    return sources
@@ -6,8 +6,9 @@ Few-shot 예시를 프롬프트에 통합하는 헬퍼 함수들을 제공합니
 
 import json
 import random
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 
 def load_few_shot_examples_from_json(
@@ -117,7 +118,10 @@ def build_few_shot_prompt(
     randomize: bool = True,
     category_examples: Dict[str, List[Dict[str, Any]]] = None,
     category_weights: Dict[str, float] = None,
-    recent_few_shot_indices: List[int] = None
+    recent_few_shot_indices: List[int] = None,
+    prepend: bool = False,
+    anchor: Optional[str] = None,
+    num_buckets: int = 0,
 ) -> tuple[str, List[int]]:
     """
     Few-shot 예시를 프롬프트에 추가
@@ -129,6 +133,14 @@ def build_few_shot_prompt(
         randomize: 예시를 랜덤으로 선택할지 여부 (기본값: True)
         category_examples: 카테고리별 예시 딕셔너리 (균등 선택용)
         category_weights: 카테고리별 가중치 (예: {"SIMPLE": 0.3, "MULTIPLE": 0.2, ...})
+        prepend: True면 예시 블록을 템플릿 앞에 배치 (기본값: False)
+            컨텍스트 등 호출마다 바뀌는 내용을 프롬프트 뒤쪽에 두어
+            LLM 제공자의 prefix 캐싱이 적용될 수 있도록 합니다.
+        anchor: 지정하면 이 문자열이 포함된 문단 바로 앞에 예시 블록을 배치
+            (예: "{context}" - 고정 지침 뒤, 호출마다 바뀌는 컨텍스트 앞).
+            템플릿에 없으면 prepend 설정을 따릅니다.
+        num_buckets: 0보다 크면 카테고리별 고정 조합 K개 중에서 예시를 선택
+            (프롬프트 prefix가 K가지로 반복되어 prefix 캐싱 적중률이 높아짐, 기본값: 0=임의 선택)
     
     Returns:
         tuple[str, List[int]]: (Few-shot 예시를 포함한 프롬프트, 선택된 예시의 인덱스 리스트)
@@ -145,12 +157,128 @@ def build_few_shot_prompt(
         ... ]
         >>> prompt = build_few_shot_prompt(template, examples)
     """
-    if not examples and not category_examples:
+    examples_text, selected_indices = build_few_shot_block(
+        examples,
+        max_examples=max_examples,
+        randomize=randomize,
+        category_examples=category_examples,
+        category_weights=category_weights,
+        recent_few_shot_indices=recent_few_shot_indices,
+        num_buckets=num_buckets,
+    )
+    if not examples_text:
         return template, []
     
-    # 최근 사용 인덱스 초기화
-    if recent_few_shot_indices is None:
-        recent_few_shot_indices = []
+    return (
+        attach_few_shot_block(template, examples_text, prepend=prepend, anchor=anchor),
+        selected_indices,
+    )
+
+
+def attach_few_shot_block(
+    template: str,
+    examples_text: str,
+    prepend: bool = False,
+    anchor: Optional[str] = None,
+) -> str:
+    """
+    build_few_shot_block으로 만든 예시 블록을 템플릿에 붙입니다.
+    
+    Args:
+        template: 원본 프롬프트 템플릿
+        examples_text: Few-shot 예시 블록
+        prepend: True면 예시 블록을 템플릿 앞에 배치
+        anchor: 지정하면 이 문자열이 포함된 문단 바로 앞에 예시 블록을 배치
+            (템플릿에 없으면 prepend 설정을 따름)
+    
+    Returns:
+        예시 블록이 포함된 프롬프트
+    """
+    if not examples_text:
+        return template
+    if anchor:
+        anchor_pos = template.find(anchor)
+        if anchor_pos >= 0:
+            # anchor가 속한 문단의 시작 (라벨 줄 "교재 내용:" 등을 함께 유지)
+            paragraph_start = template.rfind("\n\n", 0, anchor_pos)
+            paragraph_start = 0 if paragraph_start < 0 else paragraph_start + 2
+            return (
+                template[:paragraph_start]
+                + examples_text.strip("\n")
+                + "\n\n"
+                + template[paragraph_start:]
+            )
+    if prepend:
+        return examples_text.lstrip("\n") + "\n" + template
+    return template + "\n" + examples_text
+
+
+@lru_cache(maxsize=256)
+def _few_shot_buckets(
+    category_key: str, num_examples: int, max_examples: int, num_buckets: int
+) -> Tuple[Tuple[int, ...], ...]:
+    """
+    카테고리별로 고정된 Few-shot 인덱스 조합 K개를 생성합니다.
+
+    (카테고리, 예시 수, 선택 개수, K)가 같으면 항상 같은 조합을 반환하므로
+    프롬프트 앞부분이 K가지 중 하나로 반복되어 LLM 제공자의 prefix 캐싱이 적용됩니다.
+    """
+    k = min(max_examples, num_examples)
+    buckets = []
+    for bucket_id in range(num_buckets):
+        rng = random.Random(f"{category_key}:{num_examples}:{k}:{bucket_id}")
+        buckets.append(tuple(sorted(rng.sample(range(num_examples), k))))
+    # 예시 수가 적으면 조합이 겹칠 수 있으므로 중복 제거 (순서 유지)
+    return tuple(dict.fromkeys(buckets))
+
+
+def _select_few_shot_bucket(
+    category_key: str,
+    num_examples: int,
+    max_examples: int,
+    num_buckets: int,
+    recent_few_shot_indices: frozenset,
+) -> List[int]:
+    """
+    고정 조합 중 하나를 선택합니다.
+
+    최근 사용 예시와 겹치지 않는 조합을 우선 선택하고,
+    모두 겹치면 전체 조합에서 선택합니다.
+    """
+    buckets = _few_shot_buckets(category_key, num_examples, max_examples, num_buckets)
+    candidates = [
+        bucket for bucket in buckets if recent_few_shot_indices.isdisjoint(bucket)
+    ] or buckets
+    return list(random.choice(candidates))
+
+
+def build_few_shot_block(
+    examples: List[Dict[str, Any]],
+    max_examples: int = 3,
+    randomize: bool = True,
+    category_examples: Dict[str, List[Dict[str, Any]]] = None,
+    category_weights: Dict[str, float] = None,
+    recent_few_shot_indices: List[int] = None,
+    num_buckets: int = 0,
+) -> tuple[str, List[int]]:
+    """
+    Few-shot 예시를 선택하고 프롬프트용 텍스트 블록으로 포맷팅
+    
+    프롬프트 템플릿과 무관하므로 문서 검색과 병렬로 미리 만들어 둘 수 있습니다.
+    인자는 build_few_shot_prompt와 같습니다.
+    
+    num_buckets가 0보다 크면 카테고리별 예시를 매번 임의로 뽑지 않고
+    카테고리마다 고정된 K(num_buckets)개 조합 중 하나를 선택합니다.
+    
+    Returns:
+        tuple[str, List[int]]: (예시 블록 텍스트, 선택된 예시의 인덱스 리스트)
+            예시가 없으면 ("", [])
+    """
+    if not examples and not category_examples:
+        return "", []
+    
+    # 최근 사용 인덱스 (후보마다 포함 여부를 검사하므로 frozenset으로 변환)
+    recent_few_shot_indices = frozenset(recent_few_shot_indices or ())
     
     # 카테고리 이름 매핑 (새로운 파일 구조에 맞게 수정)
     category_names = {
@@ -197,7 +325,14 @@ def build_few_shot_prompt(
                     available_indices = list(range(len(selected_cat_examples)))
                 
                 # 선택된 카테고리에서 지정된 개수만큼 Few-Shot 선택
-                chosen_indices = random.sample(available_indices, min(max_examples, len(available_indices)))
+                # 인덱스 순으로 정렬하여 같은 예시 조합이면 항상 같은 프롬프트가 되도록 함
+                if num_buckets > 0:
+                    chosen_indices = _select_few_shot_bucket(
+                        selected_cat, len(selected_cat_examples), max_examples,
+                        num_buckets, recent_few_shot_indices,
+                    )
+                else:
+                    chosen_indices = sorted(random.sample(available_indices, min(max_examples, len(available_indices))))
                 for idx in chosen_indices:
                     selected_examples.append(selected_cat_examples[idx])
                     selected_indices.append(idx)
@@ -218,7 +353,14 @@ def build_few_shot_prompt(
                     available_indices = list(range(len(selected_cat_examples)))
                 
                 # 선택된 카테고리에서 지정된 개수만큼 Few-Shot 선택
-                chosen_indices = random.sample(available_indices, min(max_examples, len(available_indices)))
+                # 인덱스 순으로 정렬하여 같은 예시 조합이면 항상 같은 프롬프트가 되도록 함
+                if num_buckets > 0:
+                    chosen_indices = _select_few_shot_bucket(
+                        selected_cat_key, len(selected_cat_examples), max_examples,
+                        num_buckets, recent_few_shot_indices,
+                    )
+                else:
+                    chosen_indices = sorted(random.sample(available_indices, min(max_examples, len(available_indices))))
                 for idx in chosen_indices:
                     selected_examples.append(selected_cat_examples[idx])
                     selected_indices.append(idx)
@@ -232,7 +374,7 @@ def build_few_shot_prompt(
             available_indices = [i for i in range(len(examples)) if i not in recent_few_shot_indices]
             if len(available_indices) < num_examples:
                 available_indices = list(range(len(examples)))
-            chosen_indices = random.sample(available_indices, min(num_examples, len(available_indices)))
+            chosen_indices = sorted(random.sample(available_indices, min(num_examples, len(available_indices))))
             selected_examples = [examples[i] for i in chosen_indices]
             selected_indices = chosen_indices
     else:
@@ -242,7 +384,7 @@ def build_few_shot_prompt(
         if len(available_indices) < num_examples:
             available_indices = list(range(len(examples)))
         if randomize and len(examples) > num_examples:
-            chosen_indices = random.sample(available_indices, min(num_examples, len(available_indices)))
+            chosen_indices = sorted(random.sample(available_indices, min(num_examples, len(available_indices))))
             selected_examples = [examples[i] for i in chosen_indices]
             selected_indices = chosen_indices
         else:
@@ -262,8 +404,7 @@ def build_few_shot_prompt(
         "- ⚠️ 단, 내용은 반드시 제공된 교재에서 가져와야 합니다 (예시 내용 복사 금지)\n"
     )
     
-    # 원본 템플릿에 예시 추가
-    return template + "\n" + examples_text, selected_indices
+    return examples_text, selected_indices
 
 
 def format_single_example(example: Dict[str, Any], index: int = 1) -> str:
@@ -289,6 +430,10 @@ def format_single_example(example: Dict[str, Any], index: int = 1) -> str:
     # 해설 처리 (문자열/배열 형식 모두 지원)
     explanation = example.get('explanation', example.get('explanations'))
     
+    if isinstance(explanation, list) and len(explanation) == 1:
+        # 1개 항목 배열: 전체 해설
+        explanation = explanation[0]
+    
     if isinstance(explanation, list):
         # 배열 형식: 각 보기별 해설
         text += f"해설:\n"
@@ -6,10 +6,13 @@
 - ColorFormatter: 컬러 로그 포맷터 (콘솔용)
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
 
 # config import (fallback 메커니즘 사용)
@@ -46,6 +49,20 @@ class ColorFormatter(logging.Formatter):
         return super().format(record)
 
 
+# 로거 이름 → 실행 중인 QueueListener (재설정 시 이전 리스너 정리용)
+_QUEUE_LISTENERS: Dict[str, QueueListener] = {}
+
+
+def _stop_queue_listeners() -> None:
+    """프로세스 종료 시 큐에 남은 로그를 모두 출력하고 리스너를 정리합니다."""
+    for listener in _QUEUE_LISTENERS.values():
+        listener.stop()
+    _QUEUE_LISTENERS.clear()
+
+
+atexit.register(_stop_queue_listeners)
+
+
 def setup_logging(
     logger_name: str,
     level: Optional[str] = None,
@@ -53,6 +70,7 @@ def setup_logging(
     console: Optional[bool] = None,
     file_logging: Optional[bool] = None,
     log_file: Optional[Path] = None,
+    use_queue: Optional[bool] = None,
 ) -> logging.Logger:
     """
     공통 로깅 설정 함수 (콘솔 + 파일 로깅)
@@ -64,6 +82,8 @@ def setup_logging(
         console: 콘솔 로깅 활성화 여부
         file_logging: 파일 로깅 활성화 여부
         log_file: 로그 파일 경로 (None이면 config에서 가져옴)
+        use_queue: True면 로거에는 QueueHandler만 두고 콘솔/파일 출력은
+            백그라운드 QueueListener 스레드에서 처리 (None이면 config에서 가져옴)
 
     Returns:
         설정된 로거 객체
@@ -90,6 +110,9 @@ def setup_logging(
     if console is None:
         console = logging_config.get("console", True)
     
+    if use_queue is None:
+        use_queue = logging_config.get("queue", False)
+    
     if log_file is None and file_logging:
         # 로그 디렉토리 생성
         log_dir = paths["logs"]
@@ -105,6 +128,11 @@ def setup_logging(
     
     # 기존 핸들러 제거 (중복 방지)
     logger.handlers.clear()
+    previous_listener = _QUEUE_LISTENERS.pop(logger_name, None)
+    if previous_listener is not None:
+        previous_listener.stop()
+    
+    handlers = []
     
     # 콘솔 핸들러
     if console:
@@ -114,7 +142,7 @@ def setup_logging(
         # 컬러 포맷터 사용 (콘솔용)
         console_formatter = ColorFormatter(format_str)
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # 파일 핸들러
     if file_logging and log_file:
@@ -127,8 +155,20 @@ def setup_logging(
         # 일반 포맷터 사용 (파일용)
         file_formatter = logging.Formatter(format_str)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
-        
+        handlers.append(file_handler)
+    
+    if use_queue and handlers:
+        # 호출 스레드는 큐에 넣기만 하고, 핸들러 락/출력 I/O는 리스너 스레드에서 처리
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _QUEUE_LISTENERS[logger_name] = listener
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
+    
+    if file_logging and log_file:
         logger.info(f"로그 파일: {log_file}")
     
     # propagate 방지 (중복 로그 방지)
@@ -0,0 +1,50 @@
+"""
+MCQ 문항 해시 유틸리티
+
+질문과 보기로 문항 해시(question_hash)를 계산합니다.
+generate_mcq(파싱 직후), format_output, ForgeMode 문항 풀/캐시가
+모두 같은 해시를 사용하도록 계산 방식을 한 곳에서 관리합니다.
+"""
+
+import hashlib
+from typing import Any, Dict, Iterable
+
+
+def compute_question_hash(question: str, options: Iterable[str]) -> str:
+    """
+    질문과 보기로 문항 해시를 계산합니다.
+
+    공백을 정리한 질문과 보기를 "||"로 구분해 BLAKE2b-128로 점진 해싱합니다
+    (중간 문자열을 만들지 않음).
+
+    Args:
+        question: 질문 텍스트
+        options: 보기 리스트
+
+    Returns:
+        str: 32자리 16진수 해시
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(question.strip().encode("utf-8"))
+    for opt in options:
+        hasher.update(b"||")
+        hasher.update(opt.strip().encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def get_question_hash(mcq: Dict[str, Any]) -> str:
+    """
+    MCQ의 문항 해시를 반환합니다.
+
+    generate_mcq에서 미리 계산한 question_hash가 있으면 재사용하고,
+    없으면 새로 계산합니다.
+
+    Args:
+        mcq: MCQ 딕셔너리 (question, options 포함)
+
+    Returns:
+        str: 문항 해시
+    """
+    return mcq.get("question_hash") or compute_question_hash(
+        mcq.get("question", ""), mcq.get("options", ())
+    )
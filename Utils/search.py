@@ -5,6 +5,7 @@
 - VectorSearchUtils: 벡터 검색 유틸리티 및 통계 수집
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
 from langchain_core.documents import Document
@@ -56,6 +57,119 @@ class VectorSearchUtils:
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
+    def search_similar_documents_by_vector(
+        self, vector_store, embedding: List[float], k: int = 5, logger=None
+    ) -> List[Document]:
+        """
+        미리 계산된 쿼리 임베딩으로 유사한 문서를 검색합니다.
+
+        질문 임베딩을 이미 가지고 있을 때 사용하면
+        similarity_search 내부의 임베딩 API 호출을 생략할 수 있습니다.
+
+        Args:
+            vector_store: 벡터 스토어 객체
+            embedding: 쿼리 임베딩 벡터
+            k: 반환할 문서 수
+            logger: 로거 객체 (선택사항)
+
+        Returns:
+            유사 문서 리스트
+
+        Raises:
+            RuntimeError: 벡터 스토어가 설정되지 않은 경우
+        """
+        if logger is None:
+            logger = self.logger
+
+        if not vector_store:
+            error_msg = "벡터 스토어가 설정되지 않았습니다."
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        try:
+            results = vector_store.similarity_search_by_vector(embedding, k=k)
+            logger.info(f"임베딩 벡터로 {len(results)}개 문서를 찾았습니다.")
+            return results
+
+        except Exception as e:
+            error_msg = f"벡터 검색 실패: {e}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+    def search_similar_documents_batch(
+        self,
+        vector_store,
+        queries: List[str],
+        k: int = 5,
+        logger=None,
+        max_workers: int = 8,
+    ) -> List[List[Document]]:
+        """
+        여러 쿼리를 한 번에 검색합니다.
+
+        쿼리 임베딩을 한 번의 임베딩 API 호출로 계산한 뒤
+        벡터 검색을 동시에 실행합니다. 중복 쿼리는 한 번만 검색합니다.
+
+        Args:
+            vector_store: 벡터 스토어 객체
+            queries: 검색 쿼리 리스트
+            k: 쿼리당 반환할 문서 수
+            logger: 로거 객체 (선택사항)
+            max_workers: 동시에 실행할 최대 검색 수 (기본값: 8)
+
+        Returns:
+            queries와 같은 순서의 유사 문서 리스트들
+
+        Raises:
+            RuntimeError: 벡터 스토어가 설정되지 않았거나 검색에 실패한 경우
+        """
+        if logger is None:
+            logger = self.logger
+
+        if not vector_store:
+            error_msg = "벡터 스토어가 설정되지 않았습니다."
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        if not queries:
+            return []
+
+        unique_queries = list(dict.fromkeys(queries))
+
+        try:
+            embeddings = getattr(vector_store, "embeddings", None)
+            if embeddings is None:
+                raise RuntimeError("벡터 스토어에 임베딩 모델이 없습니다.")
+
+            # similarity_search와 동일한 쿼리용 임베딩 (RETRIEVAL_QUERY)
+            if hasattr(embeddings, "embed"):
+                vectors = embeddings.embed(
+                    unique_queries, embeddings_task_type="RETRIEVAL_QUERY"
+                )
+            else:
+                vectors = [embeddings.embed_query(query) for query in unique_queries]
+
+            workers = max(1, min(max_workers, len(unique_queries)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        lambda vector: vector_store.similarity_search_by_vector(vector, k=k),
+                        vectors,
+                    )
+                )
+
+            by_query = dict(zip(unique_queries, results))
+            logger.info(
+                f"배치 검색 완료: 쿼리 {len(queries)}개 (고유 {len(unique_queries)}개)"
+            )
+            # 같은 쿼리라도 호출자가 리스트를 독립적으로 수정할 수 있도록 복사
+            return [list(by_query[query]) for query in queries]
+
+        except Exception as e:
+            error_msg = f"배치 벡터 검색 실패: {e}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
     def search_with_score_threshold(
         self,
         vector_store,
@@ -20,10 +20,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+import asyncio
 import traceback
 
 # 프로젝트 모듈
 from Core import AskMode, ForgeMode
+from Node.MCQ import warmup_reranker
 from config import (
     validate_config, 
     get_textbook_structure,
@@ -151,7 +153,7 @@ async def startup_event():
         # AskMode 초기화
         print("⚙️  AskMode 초기화 중...", flush=True)
         logger.info("⚙️  AskMode 초기화 중...")
-        ask_mode = AskMode(logger=logger)
+        ask_mode = await AskMode.acreate(logger=logger)
         print("✅ AskMode 초기화 완료", flush=True)
         logger.info("✅ AskMode 초기화 완료")
         
@@ -166,6 +168,12 @@ async def startup_event():
         print("✅ ForgeMode 초기화 완료", flush=True)
         logger.info("✅ ForgeMode 초기화 완료")
         
+        # 첫 요청 지연 방지: LLM 인증/채널 연결을 미리 수립
+        await asyncio.to_thread(forge_mode.warmup_llm)
+        # Reranking 사용 시 Cross-Encoder를 미리 로드
+        if forge_mode.retriever_config.get("use_reranker"):
+            await asyncio.to_thread(warmup_reranker)
+        
         print("\n" + "=" * 70, flush=True)
         print("✅ API 서버 준비 완료!", flush=True)
         print("📍 API 문서: http://localhost:8000/docs", flush=True)
@@ -237,8 +245,8 @@ async def ask_endpoint(request: AskRequest):
         print(f"\n💬 [Ask] 질문: {request.content[:80]}...", flush=True)
         logger.info(f"[Ask] 질문: {request.content[:100]}...")
         
-        # AskMode 실행
-        result = ask_mode.process(request.content)
+        # AskMode 실행 (이벤트 루프를 막지 않도록 비동기 실행)
+        result = await ask_mode.aprocess(request.content)
         print(f"✅ [Ask] 답변 생성 완료\n", flush=True)
         
         # 응답 데이터 추출
@@ -310,6 +318,8 @@ async def forge_endpoint(request: ForgeRequest):
     
     Returns:
         ForgeResponse: 생성된 MCQ 리스트
+            (일반 주제 배치 생성은 요청 순서가 아닌 완료 순서이며,
+            실패하거나 중복으로 제외된 문제가 있으면 count보다 적을 수 있음)
     
     Example:
         POST /api/forge
@@ -384,7 +394,7 @@ async def forge_endpoint(request: ForgeRequest):
             # 일반 주제 또는 단일 생성: 배치 메서드 활용 (더 효율적)
             print(f"📋 [Forge] 배치 생성 모드 (중복 방지, 풀 관리)", flush=True)
             logger.info(f"[Forge Batch] 배치 생성 모드 (중복 방지, 풀 관리)")
-            generated_mcqs = forge_mode.generate_mcq_batch(
+            generated_mcqs = await forge_mode.generate_mcq_batch_async(
                 topics_hierarchical=filtered_structure,
                 count=count,
                 max_retries=6
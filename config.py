@@ -39,6 +39,7 @@
 
 import os
 import logging
+from functools import lru_cache
 from typing import Dict, Any, List
 from pathlib import Path
 
@@ -78,6 +79,7 @@ VERTEX_AI_CONFIG = {
 # ==================== 모델 설정 ====================
 
 
+@lru_cache(maxsize=1)
 def get_gemini_model_config() -> Dict[str, Any]:
     """
     Gemini 모델 설정을 반환합니다.
@@ -95,6 +97,7 @@ def get_gemini_model_config() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_retriever_config() -> Dict[str, Any]:
     """
     Retriever 설정을 반환합니다.
@@ -108,12 +111,18 @@ def get_retriever_config() -> Dict[str, Any]:
             - gcs_bucket_name: Cloud Storage 버킷 이름
             - k: 최종 반환할 문서 수 (기본: 3, Reranking 후)
             - initial_k: 초기 검색 문서 수 (기본: 10, Reranking 전)
+            - use_reranker: MCQ 문서 검색 시 Cross-Encoder Reranking 사용 여부 (기본: false)
             - search_type: 검색 타입 (기본: similarity)
             - similarity_threshold: 유사도 임계값 (기본: 0.7)
             - llm_temperature: LLM Temperature (기본: 0.7)
             - max_output_tokens: 최대 출력 토큰 (기본: 2048)
             - stream_update: Stream Update 사용 여부 (기본: false)
     
+    Note:
+        환경 변수는 최초 호출 시 한 번만 읽어 캐시합니다 (lru_cache).
+        반환된 딕셔너리는 공유되므로 수정하려면 dict(...)로 복사하세요.
+        환경 변수 변경을 반영하려면 get_retriever_config.cache_clear()를 호출합니다.
+    
     Example:
         >>> config = get_retriever_config()
         >>> k = config["k"]
@@ -127,6 +136,8 @@ def get_retriever_config() -> Dict[str, Any]:
         "gcs_bucket_name": os.getenv("GCS_BUCKET_NAME"),
         "k": int(os.getenv("RETRIEVAL_K", "7")),  # 최종 반환할 문서 개수 (리랭킹 후)
         "initial_k": int(os.getenv("RETRIEVAL_INITIAL_K", "20")),  # Reranking 전 초기 검색 개수
+        # 켜면 랜덤 샘플링 전에 Cross-Encoder로 상위 2k개를 남김 (첫 사용 시 모델 다운로드/로드)
+        "use_reranker": os.getenv("RETRIEVAL_USE_RERANKER", "false").lower() == "true",
         "search_type": os.getenv("SEARCH_TYPE", "similarity"),
         "similarity_threshold": float(os.getenv("SIMILARITY_THRESHOLD", "0.7")),
         "llm_temperature": float(os.getenv("LLM_TEMPERATURE", "0.9")),  # 창의성 향상을 위해 0.7 → 0.9
@@ -135,6 +146,7 @@ def get_retriever_config() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_generation_config() -> Dict[str, Any]:
     """
     Generation 설정 반환
@@ -187,6 +199,8 @@ LOGGING_CONFIG = {
     "console": os.getenv("LOG_CONSOLE", "true").lower() == "true",
     "file_logging": os.getenv("LOG_FILE", "true").lower() == "true",  # 기본값 true로 변경
     "format": os.getenv("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
+    # true면 콘솔/파일 출력을 백그라운드 스레드(QueueListener)에서 처리 (배치 동시 실행 시 핸들러 락 경합 감소)
+    "queue": os.getenv("LOG_QUEUE", "false").lower() == "true",
 }
 
 
@@ -325,6 +339,7 @@ def get_mcq_generation_config() -> Dict[str, Any]:
         Dict[str, Any]: MCQ 생성 설정
             - random_sample_max: 랜덤 샘플링 최대 개수 (기본: 1000)
             - few_shot_max_examples: Few-shot 예시 최대 개수 (기본: 1)
+            - few_shot_buckets: 카테고리별 고정 Few-shot 조합 개수 (기본: 0, 매번 임의 선택)
             - few_shot_folder_path: Few-shot 폴더 경로 (기본: Data/Few_Shot)
             - part_weights: Part별 가중치 (교재 비중 반영)
             - category_weights: 카테고리별 가중치 (문제 형태 비율)
@@ -337,6 +352,8 @@ def get_mcq_generation_config() -> Dict[str, Any]:
     return {
         "random_sample_max": int(os.getenv("MCQ_RANDOM_SAMPLE_MAX", "1000")),
         "few_shot_max_examples": int(os.getenv("MCQ_FEW_SHOT_MAX_EXAMPLES", "3")),  # 3개 예시 (다양성 증가)
+        # 카테고리별 고정 조합 K개 중에서만 선택 (prefix 캐싱용, 8~16 권장)
+        "few_shot_buckets": int(os.getenv("MCQ_FEW_SHOT_BUCKETS", "0")),
         "few_shot_folder_path": os.getenv("MCQ_FEW_SHOT_FOLDER_PATH", "Data/Few_Shot"),
         "max_context_docs": int(os.getenv("MCQ_MAX_CONTEXT_DOCS", "7")),  # LLM에 전달할 최종 문서 개수
         
@@ -646,10 +663,11 @@ def get_prompt_templates() -> Dict[str, str]:
                 "4지선다형 문제를 생성합니다."
             ),
             "mcq_generation_human_retriever": (
-                "교재 내용:\n{context}\n\n"
-                "주제: {question}\n\n"
+                # 정적 지침을 앞에, 호출마다 바뀌는 컨텍스트/주제는 뒤에 배치 (prefix 캐싱)
                 "지침:\n{instruction}\n\n"
-                "{format_instructions}"
+                "{format_instructions}\n\n"
+                "교재 내용:\n{context}\n\n"
+                "주제: {question}"
             ),
         }
 
@@ -291,10 +291,12 @@ def save_mcqs_to_txt(mcqs: list, topic_name: str = "전체") -> str:
             explanation = mcq.get('explanation', [])
             if explanation:
                 f.write("📖 해설:\n")
-                if isinstance(explanation, list):
+                if isinstance(explanation, list) and len(explanation) > 1:
                     for j, exp in enumerate(explanation, 1):
                         if exp and exp.strip():
                             f.write(f"  {j}번: {exp}\n")
+                elif isinstance(explanation, list):
+                    f.write(f"  {explanation[0]}\n")
                 else:
                     f.write(f"  {explanation}\n")
                 f.write("\n")
@@ -327,10 +329,12 @@ def print_mcq_result(mcq: dict, mcq_number: int) -> None:
     explanation = mcq.get('explanation', [])
     if explanation:
         print(f"\n📖 해설:")
-        if isinstance(explanation, list):
+        if isinstance(explanation, list) and len(explanation) > 1:
             for i, exp in enumerate(explanation, 1):
                 if exp and exp.strip():
                     print(f"  {i}번: {exp}")
+        elif isinstance(explanation, list):
+            print(f"  {explanation[0]}")
         else:
             print(f"  {explanation}")
     